@@ -15,16 +15,37 @@ import sys
 
 # Ana proje dizinini path'e ekle
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+# src/model_trainer.py betik olarak çalıştırıldığında kaydedilen modeller
+# (ör. FoldEnsembleClassifier) src modüllerine doğrudan adla başvurur
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 try:
     from src.feature_config import ALL_FEATURES, TARGET_SPORTS, FEATURE_GROUPS
-    from src.data_generator import SportsDataGenerator
+    from src.sport_scorer import SportCompatibilityScorer
+    from src.dataset_io import iter_dataset
+    from src.feature_encoding import expand_multi_hot_columns
+    from src.compiled_model import CompiledModel, compiled_path_for
+    from src.inference import PredictionCache, compute_bmi, form_record_encoder, prepare_model_input
 except ImportError:
     import sys
     import os
     sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
     from feature_config import ALL_FEATURES, TARGET_SPORTS, FEATURE_GROUPS
-    from data_generator import SportsDataGenerator
+    from sport_scorer import SportCompatibilityScorer
+    from dataset_io import iter_dataset
+    from feature_encoding import expand_multi_hot_columns
+    from compiled_model import CompiledModel, compiled_path_for
+    from inference import PredictionCache, compute_bmi, form_record_encoder, prepare_model_input
+
+# Veri analizi sekmesinde kullanılan veri seti (ilk bulunan dosya okunur)
+DATASET_PATHS = [
+    "data/sporcu_dataset.parquet",
+    "data/sporcu_dataset.arrow",
+    "data/sporcu_dataset.csv"
+]
+
+# Tahmin önbelleğinde tutulacak en fazla form sayısı
+PREDICTION_CACHE_SIZE = 4096
 
 # Sayfa konfigürasyonu
 st.set_page_config(
@@ -75,20 +96,150 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+# Streamlit her etkileşimde betiği baştan çalıştırır. Model, kural tabanlı
+# skorlayıcı ve veri seti özetleri süreç başına bir kez yüklenip tüm
+# oturumlarca paylaşılır; önbellek anahtarı dosyanın değişiklik zamanı ve
+# boyutudur, dosya değiştiğinde yeniden yüklenir.
+
+def file_signature(path):
+    """Dosyanın (değişiklik zamanı, boyut) imzasını döndürür (dosya yoksa None)"""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_model_data(model_path, signature):
+    """Model dosyasını yükler (signature yalnızca önbellek anahtarıdır)"""
+    return joblib.load(model_path)
+
+
+@st.cache_resource(max_entries=1, show_spinner=False)
+def load_compiled_model(compiled_path, signature):
+    """Derlenmiş modeli yükler (signature yalnızca önbellek anahtarıdır)"""
+    return CompiledModel.load(compiled_path)
+
+
+@st.cache_resource(max_entries=2, show_spinner=False)
+def load_record_encoder(path, signature):
+    """
+    Modelin tek satırlık hızlı kodlayıcısını kurar
+
+    Formdaki alanlar ve BMI her tahminde önceden ayrılmış vektöre yazılır;
+    diğer özellikler DEFAULT_MODEL_INPUTS'tan bir kez kodlanır. Ölçeklenmiş
+    modellerde standartlaştırma da vektör üzerinde yerinde yapılır
+    (derlenmiş model ölçeklemeyi kendisi yapar).
+    """
+    if path.endswith('.npz'):
+        return form_record_encoder(load_compiled_model(path, signature).encoder)
+    model_data = load_model_data(path, signature)
+    scaled = model_data.get('scaled', model_data['model_name'] in ['SVM', 'Neural Network'])
+    return form_record_encoder(model_data['encoder'], model_data['scaler'] if scaled else None)
+
+
+@st.cache_resource(show_spinner=False)
+def load_sport_scorer():
+    """Kural tabanlı spor uyumluluk skorlayıcısını döndürür"""
+    return SportCompatibilityScorer()
+
+
+@st.cache_resource(show_spinner=False)
+def load_prediction_cache():
+    """
+    Tüm oturumların paylaştığı tahmin önbelleğini döndürür
+
+    Yan bardaki alanların hepsi tam sayı kaydırıcı ya da seçim kutusu
+    olduğundan aynı form sık tekrarlanır; tekrarlar modele gitmeden yanıtlanır.
+    """
+    return PredictionCache(PREDICTION_CACHE_SIZE)
+
+
+@st.cache_data(max_entries=1, show_spinner="Veri seti özetleniyor...")
+def load_dataset_summary(dataset_path, signature, chunk_rows=200_000):
+    """
+    Veri analizi sekmesindeki grafikler için özetleri hesaplar
+
+    Veri seti parça parça okunur; bellekte tam veri seti değil yalnızca
+    sayaçlar ve korelasyon için toplamlar tutulur.
+    """
+    performance_features = ['hiz', 'kuvvet', 'dayaniklilik', 'esneklik', 'koordinasyon']
+    total_rows = 0
+    num_columns = 0
+    sport_counts = pd.Series(dtype='int64')
+    age_counts = pd.Series(dtype='int64')
+    sums = np.zeros(len(performance_features))
+    products = np.zeros((len(performance_features), len(performance_features)))
+    for chunk in iter_dataset(dataset_path, chunk_rows):
+        total_rows += len(chunk)
+        num_columns = len(chunk.columns)
+        sport_counts = sport_counts.add(chunk['tavsiye_edilen_spor'].astype(str).value_counts(),
+                                        fill_value=0)
+        age_counts = age_counts.add(chunk['yas'].value_counts(), fill_value=0)
+        values = chunk[performance_features].to_numpy(dtype=np.float64)
+        sums += values.sum(axis=0)
+        products += values.T @ values
+    
+    # Pearson korelasyonu: kovaryans / (std x std)
+    covariance = products / total_rows - np.outer(sums, sums) / total_rows ** 2
+    std = np.sqrt(np.diag(covariance))
+    correlation = covariance / np.outer(std, std)
+    return {
+        'total_rows': total_rows,
+        'num_columns': num_columns,
+        'mean_age': float((age_counts.index.to_numpy() * age_counts.to_numpy()).sum()) / total_rows,
+        'sport_counts': sport_counts.astype('int64').sort_values(ascending=False, kind='stable'),
+        'age_counts': age_counts.astype('int64').sort_index(),
+        'correlation': pd.DataFrame(correlation, index=performance_features, columns=performance_features)
+    }
+
+
 class SportsApp:
     """Streamlit spor yetenek tahmin uygulaması"""
     
     def __init__(self):
-        self.data_generator = SportsDataGenerator()
+        self.scorer = load_sport_scorer()
         self.model_data = None
+        self.compiled_model = None
+        self.record_encoder = None
+        self.model_version = None
+        self.prediction_error = None
+        self.prediction_cache = load_prediction_cache()
         self.load_model()
+        # Model dosyası değiştiyse önceki modelin tahminleri silinir
+        self.prediction_cache.bind(self.model_version)
         
     def load_model(self):
-        """Eğitilmiş modeli yükler"""
+        """
+        Eğitilmiş modeli yükler
+        
+        Model dosyasından eski olmayan bir derlenmiş model (.npz) varsa o
+        kullanılır; yükleme ve tahmin için yalnızca NumPy gerekir. Yüklenen
+        model süreç içinde önbelleğe alınır ve dosya değişene kadar yeniden
+        okunmaz.
+        """
         model_path = "models/best_model.pkl"
-        if os.path.exists(model_path):
+        compiled_path = compiled_path_for(model_path)
+        model_signature = file_signature(model_path)
+        compiled_signature = file_signature(compiled_path)
+        if compiled_signature and (not model_signature or compiled_signature[0] >= model_signature[0]):
             try:
-                self.model_data = joblib.load(model_path)
+                self.compiled_model = load_compiled_model(compiled_path, compiled_signature)
+                self.record_encoder = load_record_encoder(compiled_path, compiled_signature)
+                self.model_version = (compiled_path, compiled_signature)
+                st.success("✅ Model başarıyla yüklendi!")
+                return
+            except Exception as e:
+                self.compiled_model = None
+                self.record_encoder = None
+                st.warning(f"⚠️ Derlenmiş model yüklenemedi, model dosyası kullanılacak: {str(e)}")
+        if model_signature:
+            try:
+                self.model_data = load_model_data(model_path, model_signature)
+                if 'encoder' in self.model_data:
+                    self.record_encoder = load_record_encoder(model_path, model_signature)
+                self.model_version = (model_path, model_signature)
                 st.success("✅ Model başarıyla yüklendi!")
             except Exception as e:
                 st.error(f"❌ Model yüklenirken hata: {str(e)}")
@@ -157,13 +308,31 @@ class SportsApp:
         return None
     
     def predict_sport(self, user_data):
-        """Kullanıcı verisine göre spor tahmini yapar"""
-        if self.model_data:
+        """
+        Kullanıcı verisine göre spor tahmini yapar
+        
+        Aynı form için önceki sonuç önbellekteyse model çalıştırılmaz. Model
+        hatası nedeniyle veri üreticiye düşülen tahminler önbelleğe alınmaz.
+        """
+        key = self.prediction_cache.key(user_data)
+        result = self.prediction_cache.get(key)
+        if result is not None:
+            return result
+        
+        self.prediction_error = None
+        if self.compiled_model is not None:
+            # Derlenmiş ağaç modeli ile tahmin
+            result = self.predict_with_compiled_model(user_data)
+        elif self.model_data:
             # Eğitilmiş model ile tahmin
-            return self.predict_with_model(user_data)
+            result = self.predict_with_model(user_data)
         else:
             # Veri üretici ile tahmin
-            return self.predict_with_generator(user_data)
+            result = self.predict_with_generator(user_data)
+        
+        if self.prediction_error is None:
+            self.prediction_cache.put(key, result)
+        return result
     
     def predict_with_model(self, user_data):
         """Eğitilmiş model ile tahmin yapar"""
@@ -174,29 +343,23 @@ class SportsApp:
             label_encoder = self.model_data['label_encoder']
             feature_names = self.model_data['feature_names']
             
-            # Kullanıcı verisini model formatına dönüştür
-            full_data = self.prepare_user_data_for_model(user_data)
-            
-            # Kategorik verileri encode et
-            user_df = pd.DataFrame([full_data])
-            categorical_columns = user_df.select_dtypes(include=['object']).columns
-            user_encoded = pd.get_dummies(user_df, columns=categorical_columns, drop_first=True)
+            if 'encoder' in self.model_data:
+                # Hızlı yol: form alanları önceden ayrılmış vektöre yazılır
+                # (gerekirse yerinde ölçeklenir)
+                user_input = self.encode_user_data(user_data)
+                probabilities = model.predict_proba(user_input)[0]
+                sports = label_encoder.classes_[model.classes_]
+                predicted_sport = sports[np.argmax(probabilities)]
+                sport_scores = {sport: probability * 100 for sport, probability in zip(sports, probabilities)}
+                return predicted_sport, sport_scores
             
-            # Sütun isimlerini temizle
-            import re
-            user_encoded.columns = [re.sub(r'[^\w\s]', '_', col).replace(' ', '_') 
-                                   for col in user_encoded.columns]
-            
-            # Model özelliklerini eşleştir
-            for feature in feature_names:
-                if feature not in user_encoded.columns:
-                    user_encoded[feature] = 0
-            
-            # Sadece model özelliklerini al
-            user_encoded = user_encoded[feature_names]
+            # Kodlayıcı içermeyen eski model dosyaları
+            full_data = self.prepare_user_data_for_model(user_data)
+            user_encoded = self.encode_user_data_legacy(full_data, feature_names)
             
             # Model tipine göre scaling
-            if self.model_data['model_name'] in ['SVM', 'Neural Network']:
+            scaled = self.model_data.get('scaled', self.model_data['model_name'] in ['SVM', 'Neural Network'])
+            if scaled:
                 user_scaled = scaler.transform(user_encoded)
                 predictions = model.predict(user_scaled)
                 probabilities = model.predict_proba(user_scaled)
@@ -215,90 +378,65 @@ class SportsApp:
             return predicted_sport, sport_scores
             
         except Exception as e:
+            self.prediction_error = e
             st.error(f"Model tahmin hatası: {str(e)}")
             # Hata durumunda veri üretici ile tahmin yap
             return self.predict_with_generator(user_data)
     
+    def predict_with_compiled_model(self, user_data):
+        """Derlenmiş (yalnızca NumPy) model ile tahmin yapar"""
+        try:
+            probabilities = self.compiled_model.predict_proba(self.encode_user_data(user_data))[0]
+            
+            predicted_sport = self.compiled_model.classes_[np.argmax(probabilities)]
+            sport_scores = {sport: probability * 100
+                            for sport, probability in zip(self.compiled_model.classes_, probabilities)}
+            
+            return predicted_sport, sport_scores
+            
+        except Exception as e:
+            self.prediction_error = e
+            st.error(f"Model tahmin hatası: {str(e)}")
+            return self.predict_with_generator(user_data)
+    
+    def encode_user_data(self, user_data):
+        """
+        Form verisini modelin hızlı kodlayıcısıyla (1, n_features) vektöre çevirir
+        
+        Döndürülen dizi bir sonraki tahminde yeniden kullanılır.
+        """
+        return self.record_encoder.encode({**user_data, 'bmi': compute_bmi(user_data)})
+    
+    def encode_user_data_legacy(self, full_data, feature_names):
+        """Kodlayıcı içermeyen model dosyaları için get_dummies tabanlı kodlama"""
+        user_df = expand_multi_hot_columns(pd.DataFrame([full_data]))
+        categorical_columns = user_df.select_dtypes(include=['object']).columns
+        user_encoded = pd.get_dummies(user_df, columns=categorical_columns, drop_first=True)
+        
+        # Sütun isimlerini temizle
+        import re
+        user_encoded.columns = [re.sub(r'[^\w\s]', '_', col).replace(' ', '_') 
+                               for col in user_encoded.columns]
+        
+        # Model özelliklerini eşleştir
+        for feature in feature_names:
+            if feature not in user_encoded.columns:
+                user_encoded[feature] = 0
+        
+        # Sadece model özelliklerini al
+        return user_encoded[feature_names]
+    
     def prepare_user_data_for_model(self, user_data):
-        """Kullanıcı verisini model için hazırlar"""
-        # Eksik alanları varsayılan değerlerle doldur
-        full_data = {
-            'yas': user_data['yas'],
-            'cinsiyet': user_data['cinsiyet'],
-            'boy': user_data['boy'],
-            'kilo': user_data['kilo'],
-            'vucut_tipi': user_data['vucut_tipi'],
-            'kas_orani': user_data['kas_orani'],
-            'yag_orani': user_data['yag_orani'],
-            'hiz': user_data['hiz'],
-            'kuvvet': user_data['kuvvet'],
-            'dayaniklilik': user_data['dayaniklilik'],
-            'esneklik': user_data['esneklik'],
-            'koordinasyon': user_data['koordinasyon'],
-            'spor_yili': user_data['spor_yili'],
-            'takım_oyunu_tercihi': user_data['takım_oyunu_tercihi'],
-            'ailevi_spor_gecmisi': user_data['ailevi_spor_gecmisi'],
-            # Varsayılan değerler
-            'bmi': user_data['kilo'] / ((user_data['boy'] / 100) ** 2),
-            'kemik_yogunlugu': 'Orta',
-            'denge': 5,
-            'reaksiyon_hizi': 5,
-            'anne_spor_durumu': 'Aktif',
-            'baba_spor_durumu': 'Aktif',
-            'dominant_el': 'Sağ',
-            'onceki_sporlar': "['Futbol']",
-            'en_basarili_spor': 'Futbol',
-            'yaralanma_gecmisi': 'Yok',
-            'stres_toleransi': 5,
-            'yarışma_tutkusu': 5,
-            'konsantrasyon': 5,
-            'coğrafi_konum': 'Şehir',
-            'ekonomik_durum': 'Orta',
-            'tesis_erisimi': 'Orta'
-        }
-        
-        return full_data
+        """Kullanıcı verisini model için hazırlar (eksik alanlar varsayılan değerlerle doldurulur)"""
+        return prepare_model_input(user_data)
     
     def predict_with_generator(self, user_data):
         """Veri üretici ile tahmin yapar"""
         # Eksik alanları varsayılan değerlerle doldur
-        full_data = {
-            'yas': user_data['yas'],
-            'cinsiyet': user_data['cinsiyet'],
-            'boy': user_data['boy'],
-            'kilo': user_data['kilo'],
-            'vucut_tipi': user_data['vucut_tipi'],
-            'kas_orani': user_data['kas_orani'],
-            'yag_orani': user_data['yag_orani'],
-            'hiz': user_data['hiz'],
-            'kuvvet': user_data['kuvvet'],
-            'dayaniklilik': user_data['dayaniklilik'],
-            'esneklik': user_data['esneklik'],
-            'koordinasyon': user_data['koordinasyon'],
-            'spor_yili': user_data['spor_yili'],
-            'takım_oyunu_tercihi': user_data['takım_oyunu_tercihi'],
-            'ailevi_spor_gecmisi': user_data['ailevi_spor_gecmisi'],
-            # Varsayılan değerler
-            'bmi': user_data['kilo'] / ((user_data['boy'] / 100) ** 2),
-            'kemik_yogunlugu': 'Orta',
-            'denge': 5,
-            'reaksiyon_hizi': 5,
-            'anne_spor_durumu': 'Aktif',
-            'baba_spor_durumu': 'Aktif',
-            'dominant_el': 'Sağ',
-            'onceki_sporlar': ['Futbol'],
-            'en_basarili_spor': 'Futbol',
-            'yaralanma_gecmisi': 'Yok',
-            'stres_toleransi': 5,
-            'yarışma_tutkusu': 5,
-            'konsantrasyon': 5,
-            'coğrafi_konum': 'Şehir',
-            'ekonomik_durum': 'Orta',
-            'tesis_erisimi': 'Orta'
-        }
-        
-        # Spor uyumluluk skorlarını hesapla
-        sport_scores = self.data_generator._calculate_sport_compatibility(full_data)
+        full_data = self.prepare_user_data_for_model(user_data)
+        
+        # Spor uyumluluk skorlarını derlenmiş matris skorlayıcı ile hesapla
+        sport_scores = self.scorer.score_record(full_data)
         
         # En iyi sporu bul
         best_sport = max(sport_scores, key=sport_scores.get)
@@ -433,25 +571,31 @@ class SportsApp:
         """Veri analizi sayfasını oluşturur"""
         st.markdown('<div class="section-title">📊 Veri Analizi</div>', unsafe_allow_html=True)
         
-        # Veri setini yükle
+        # Veri seti özetlerini yükle (dosya değişene kadar önbellekten)
         try:
-            data = pd.read_csv("data/sporcu_dataset.csv")
+            dataset_path = next((path for path in DATASET_PATHS if os.path.exists(path)),
+                                DATASET_PATHS[-1])
+            signature = file_signature(dataset_path)
+            if signature is None:
+                raise FileNotFoundError(dataset_path)
+            summary = load_dataset_summary(dataset_path, signature)
             
             # Temel istatistikler
             col1, col2, col3, col4 = st.columns(4)
             
             with col1:
-                st.metric("Toplam Kişi", len(data))
+                st.metric("Toplam Kişi", summary['total_rows'])
             with col2:
-                st.metric("Ortalama Yaş", f"{data['yas'].mean():.1f}")
+                st.metric("Ortalama Yaş", f"{summary['mean_age']:.1f}")
             with col3:
-                st.metric("Spor Türü", len(data['tavsiye_edilen_spor'].unique()))
+                st.metric("Spor Türü", len(summary['sport_counts']))
             with col4:
-                st.metric("Özellik Sayısı", len(data.columns))
+                st.metric("Özellik Sayısı", summary['num_columns'])
             
             # Spor dağılımı
             st.subheader("🏆 Spor Dağılımı")
-            sport_counts = data['tavsiye_edilen_spor'].value_counts()
+            sport_counts = summary['sport_counts']
+            sport_counts = sport_counts[sport_counts > 0]
             fig_pie = px.pie(
                 values=sport_counts.values,
                 names=sport_counts.index,
@@ -459,21 +603,22 @@ class SportsApp:
             )
             st.plotly_chart(fig_pie, use_container_width=True)
             
-            # Yaş dağılımı
+            # Yaş dağılımı (yaş başına sayılardan)
             st.subheader("👥 Yaş Dağılımı")
+            age_counts = summary['age_counts']
             fig_hist = px.histogram(
-                data, 
-                x='yas', 
+                x=age_counts.index,
+                y=age_counts.values,
+                histfunc='sum',
                 nbins=20,
                 title="Yaş Dağılımı",
-                labels={'yas': 'Yaş', 'count': 'Kişi Sayısı'}
+                labels={'x': 'Yaş', 'y': 'Kişi Sayısı'}
             )
             st.plotly_chart(fig_hist, use_container_width=True)
             
             # Performans korelasyonu
             st.subheader("🔗 Performans Korelasyonu")
-            perf_features = ['hiz', 'kuvvet', 'dayaniklilik', 'esneklik', 'koordinasyon']
-            corr_matrix = data[perf_features].corr()
+            corr_matrix = summary['correlation']
             
             fig_heatmap = px.imshow(
                 corr_matrix,
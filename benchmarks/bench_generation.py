@@ -0,0 +1,189 @@
+"""
+Veri Üretimi Verim Benchmark'ı - Spor Yetenek Tahmin Sistemi
+Bu dosya, SportsDataGenerator, BulkDataGenerator ve etiketleme adımının
+farklı veri seti ve batch boyutlarındaki verimini ölçer. Her ölçüm temiz bir
+alt süreçte çalışır; satır/saniye, en yüksek RSS ve çıktı bayt/satır
+değerleri sürümler arasında karşılaştırılabilmesi için JSON'a yazılır.
+
+Kullanım:
+    python benchmarks/bench_generation.py
+    python benchmarks/bench_generation.py --sizes 1000 100000 --batch-sizes 10000 \\
+        --paths vectorized bulk_stream --output benchmarks/results/generation.json
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+# Ölçülebilecek üretim yolları
+PATHS = [
+    'legacy',            # Kişi bazlı SportsDataGenerator.generate_dataset
+    'vectorized',        # Sütun bazlı SportsDataGenerator.generate_dataset_vectorized
+    'bulk',              # BulkDataGenerator, bellekte birleştirip tek seferde yazma
+    'bulk_stream',       # BulkDataGenerator, stream=True
+    'bulk_parallel',     # BulkDataGenerator, stream=True + süreç havuzu
+    'labelling_matrix',  # SportCompatibilityScorer.score_matrix (yalnızca etiketleme)
+    'labelling_per_row'  # SportCompatibilityScorer.score_record, satır satır
+]
+
+# Kişi bazlı yollar yavaş olduğundan bu boyutun üzerinde atlanır (varsayılan)
+SLOW_PATHS = {'legacy', 'labelling_per_row'}
+BATCHED_PATHS = {'bulk', 'bulk_stream', 'bulk_parallel'}
+
+
+def _run_case(case: dict, queue):
+    """Tek bir ölçümü alt süreçte çalıştırıp sonucu kuyruğa koyar"""
+    from src.data_generator import SportsDataGenerator
+    from src.bulk_data_generator import BulkDataGenerator
+    from src.profiling import peak_rss_bytes
+
+    path, rows = case['path'], case['rows']
+    output_bytes = None
+    baseline_rss = peak_rss_bytes()
+
+    if path.startswith('labelling'):
+        # Etiketlenecek özellikler ölçüm dışında üretilir
+        generator = SportsDataGenerator(seed=42)
+        features = generator.generate_dataset_vectorized(rows)
+        records = features.to_dict('records') if path == 'labelling_per_row' else None
+        baseline_rss = peak_rss_bytes()
+
+    start = time.perf_counter()
+    if path == 'legacy':
+        SportsDataGenerator(seed=42).generate_dataset(rows)
+    elif path == 'vectorized':
+        SportsDataGenerator(seed=42).generate_dataset_vectorized(rows)
+    elif path == 'labelling_matrix':
+        generator.scorer.score_matrix(features)
+    elif path == 'labelling_per_row':
+        for record in records:
+            generator.scorer.score_record(record)
+    else:
+        bulk = BulkDataGenerator(batch_size=case['batch_size'], seed=42, vectorized=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            save_path = os.path.join(tmp, f"dataset.{case['format']}")
+            with contextlib.redirect_stdout(io.StringIO()):
+                bulk.generate_large_dataset(
+                    rows, save_path,
+                    stream=(path != 'bulk'),
+                    n_jobs=case['n_jobs'] if path == 'bulk_parallel' else 1
+                )
+            output_bytes = os.path.getsize(save_path)
+    seconds = time.perf_counter() - start
+
+    queue.put({
+        **case,
+        'seconds': round(seconds, 4),
+        'rows_per_sec': round(rows / seconds, 1) if seconds > 0 else None,
+        'peak_rss_mb': round(peak_rss_bytes() / 2**20, 1),
+        'baseline_rss_mb': round(baseline_rss / 2**20, 1),
+        'output_bytes_per_row': round(output_bytes / rows, 2) if output_bytes else None
+    })
+
+
+def run_case(case: dict) -> dict:
+    """Ölçümü temiz bir süreçte çalıştırır (RSS ölçümleri birbirini etkilemez)"""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    process = context.Process(target=_run_case, args=(case, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def _metadata() -> dict:
+    import numpy as np
+    import pandas as pd
+    from src.bulk_data_generator import ENGINE_VERSION, dataset_fingerprint
+
+    try:
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True,
+                                cwd=os.path.dirname(__file__)).stdout.strip() or None
+    except OSError:
+        commit = None
+
+    return {
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'git_commit': commit,
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'engine_version': ENGINE_VERSION,
+        'fingerprint': dataset_fingerprint()
+    }
+
+
+def build_cases(args) -> list:
+    cases = []
+    for rows in args.sizes:
+        for path in args.paths:
+            if path in SLOW_PATHS and rows > args.max_slow_rows:
+                continue
+            if path in BATCHED_PATHS:
+                for batch_size in args.batch_sizes:
+                    for file_format in args.formats:
+                        cases.append({'path': path, 'rows': rows, 'batch_size': batch_size,
+                                      'format': file_format, 'n_jobs': args.workers})
+            else:
+                cases.append({'path': path, 'rows': rows})
+    return cases
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Veri üretimi verim benchmark'ı")
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1_000, 10_000, 100_000, 1_000_000, 10_000_000],
+                        help="Ölçülecek veri seti boyutları")
+    parser.add_argument('--batch-sizes', type=int, nargs='+', default=[10_000, 100_000],
+                        help="BulkDataGenerator batch boyutları")
+    parser.add_argument('--paths', nargs='+', choices=PATHS, default=PATHS,
+                        help="Ölçülecek üretim yolları")
+    parser.add_argument('--formats', nargs='+', choices=['csv', 'parquet', 'arrow'], default=['csv'],
+                        help="Bulk yolları için çıktı biçimleri")
+    parser.add_argument('--workers', type=int, default=os.cpu_count() or 1,
+                        help="bulk_parallel için işçi süreç sayısı")
+    parser.add_argument('--max-slow-rows', type=int, default=10_000,
+                        help="Kişi bazlı yolların ölçüleceği en büyük boyut")
+    parser.add_argument('--output', default=None,
+                        help="JSON çıktı dosyası (varsayılan: benchmarks/results/generation-<zaman>.json)")
+    args = parser.parse_args()
+
+    output = args.output or os.path.join(
+        os.path.dirname(__file__), 'results',
+        f"generation-{datetime.now().strftime('%Y%m%d-%H%M%S')}.json")
+
+    results = []
+    cases = build_cases(args)
+    print(f"⏱️ {len(cases)} ölçüm çalıştırılıyor...")
+    for i, case in enumerate(cases, 1):
+        result = run_case(case)
+        results.append(result)
+        extra = f" batch={case['batch_size']} {case['format']}" if 'batch_size' in case else ""
+        bytes_per_row = (f", {result['output_bytes_per_row']} B/satır"
+                         if result['output_bytes_per_row'] else "")
+        print(f"✅ [{i}/{len(cases)}] {case['path']:<18} {case['rows']:>10} satır{extra}: "
+              f"{result['rows_per_sec']:>12,.0f} satır/s, "
+              f"RSS {result['peak_rss_mb']} MB{bytes_per_row}")
+
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump({'meta': _metadata(), 'results': results}, f, ensure_ascii=False, indent=2)
+    print(f"💾 Sonuçlar kaydedildi: {output}")
+
+
+if __name__ == "__main__":
+    main()
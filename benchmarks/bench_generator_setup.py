@@ -0,0 +1,65 @@
+"""
+Üretici Kurulum Maliyeti Mikro Benchmark'ı - Spor Yetenek Tahmin Sistemi
+Bu dosya, her batch için yeni bir SportsDataGenerator oluşturmanın (eski
+yöntem) ve tek bir üreticiyi reseed ile yeniden kullanmanın batch başına
+kurulum maliyetini karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_generator_setup.py --batches 200
+"""
+
+import argparse
+import os
+import sys
+import time
+
+from faker import Faker
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.data_generator import SportsDataGenerator
+
+
+def _per_batch_us(func, batches: int) -> float:
+    """func'ı batches kez çalıştırıp çağrı başına süreyi mikrosaniye döndürür"""
+    start = time.perf_counter()
+    for batch_num in range(batches):
+        func(batch_num)
+    return (time.perf_counter() - start) / batches * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch başına üretici kurulum maliyeti")
+    parser.add_argument('--batches', type=int, default=200, help="Ölçülecek batch sayısı")
+    parser.add_argument('--seed', type=int, default=42, help="Temel seed değeri")
+    args = parser.parse_args()
+
+    def eager_faker_setup(batch_num):
+        # Eski kurulum: her batch'te Faker('tr_TR') ve yeni üretici
+        Faker('tr_TR')
+        Faker.seed(args.seed + batch_num * 1000)
+        SportsDataGenerator(seed=args.seed + batch_num * 1000)
+
+    def fresh_generator_setup(batch_num):
+        SportsDataGenerator(seed=args.seed + batch_num * 1000)
+
+    generator = SportsDataGenerator(seed=args.seed)
+
+    def reseed_setup(batch_num):
+        generator.reseed(args.seed + batch_num * 1000)
+
+    results = {
+        "Yeni üretici + Faker('tr_TR') (eski)": _per_batch_us(eager_faker_setup, args.batches),
+        "Yeni üretici (lazy Faker)": _per_batch_us(fresh_generator_setup, args.batches),
+        "Tek üretici + reseed": _per_batch_us(reseed_setup, args.batches),
+    }
+
+    print(f"⏱️ Batch başına kurulum süresi ({args.batches} batch)")
+    print("=" * 50)
+    baseline = next(iter(results.values()))
+    for name, per_batch in results.items():
+        print(f"   {name:<38} {per_batch:10.1f} µs  (x{baseline / per_batch:.0f})")
+
+
+if __name__ == "__main__":
+    main()
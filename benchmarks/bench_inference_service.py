@@ -0,0 +1,150 @@
+"""
+Tahmin Servisi Yük Testi - Spor Yetenek Tahmin Sistemi
+Bu dosya, inference_service'i ayrı bir süreçte başlatıp eşzamanlı
+istemcilerle yük altında ölçer. Her yapılandırma (mikro-batch kapalı:
+max_batch_size=1, açık: verilen batch boyutu ve bekleme süresi) için
+istek/s, p50/p99 gecikme ve ortalama batch boyutu raporlanır.
+
+Kullanım:
+    python benchmarks/bench_inference_service.py --model models/best_model.pkl \\
+        --concurrency 1 8 32 --requests 2000
+"""
+
+import argparse
+import http.client
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+
+from src.inference import sample_forms
+
+SERVICE = os.path.join(os.path.dirname(__file__), '..', 'src', 'inference_service.py')
+
+
+def _free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_service(model: str, max_batch_size: int, max_wait_ms: float):
+    """Servisi alt süreçte başlatıp /health yanıt verene kadar bekler"""
+    port = _free_port()
+    process = subprocess.Popen(
+        [sys.executable, SERVICE, '--model', model, '--port', str(port),
+         '--max-batch-size', str(max_batch_size), '--max-wait-ms', str(max_wait_ms)],
+        stdout=subprocess.DEVNULL)
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        try:
+            health(port)
+            return process, port
+        except OSError:
+            if process.poll() is not None:
+                raise RuntimeError("Tahmin servisi başlatılamadı")
+            time.sleep(0.1)
+    process.kill()
+    raise RuntimeError("Tahmin servisi 60 saniyede hazır olmadı")
+
+
+def health(port: int) -> dict:
+    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+    try:
+        connection.request('GET', '/health')
+        return json.loads(connection.getresponse().read())
+    finally:
+        connection.close()
+
+
+def run_load(port: int, concurrency: int, requests: int, forms: list) -> dict:
+    """concurrency istemciyle toplam requests tek satırlık istek gönderir"""
+    bodies = [json.dumps(form).encode('utf-8') for form in forms]
+    latencies = []
+    errors = []
+    counter = iter(range(requests))
+    lock = threading.Lock()
+
+    def client():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=30)
+        local = []
+        while True:
+            with lock:
+                i = next(counter, None)
+            if i is None:
+                break
+            start = time.perf_counter()
+            connection.request('POST', '/predict', body=bodies[i % len(bodies)],
+                               headers={'Content-Type': 'application/json'})
+            response = connection.getresponse()
+            response.read()
+            local.append(time.perf_counter() - start)
+            if response.status != 200:
+                errors.append(response.status)
+        connection.close()
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=client) for _ in range(concurrency)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    seconds = time.perf_counter() - start
+
+    latencies = np.array(latencies) * 1000
+    return {
+        'requests_per_second': len(latencies) / seconds,
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'errors': len(errors)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tahmin servisi yük testi")
+    parser.add_argument('--model', default="models/best_model.pkl", help="Model dosyası")
+    parser.add_argument('--concurrency', type=int, nargs='+', default=[1, 8, 32],
+                        help="Eşzamanlı istemci sayıları")
+    parser.add_argument('--requests', type=int, default=2000, help="Ölçüm başına istek sayısı")
+    parser.add_argument('--max-batch-size', type=int, default=64, help="Mikro-batch boyutu")
+    parser.add_argument('--max-wait-ms', type=float, default=0.0, help="Mikro-batch bekleme süresi")
+    args = parser.parse_args()
+
+    forms = sample_forms(256)
+    configs = [('batch yok', 1, 0.0),
+               (f'mikro-batch ({args.max_batch_size}/{args.max_wait_ms:g} ms)',
+                args.max_batch_size, args.max_wait_ms)]
+
+    print(f"⏱️ Tahmin servisi yük testi: {args.model} ({args.requests} istek/ölçüm)")
+    print("=" * 84)
+    print(f"   {'Yapılandırma':<28} {'istemci':>8} {'istek/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+          f"{'ort. batch':>11}")
+    for name, max_batch_size, max_wait_ms in configs:
+        process, port = start_service(args.model, max_batch_size, max_wait_ms)
+        try:
+            run_load(port, 1, 50, forms)  # ısınma
+            for concurrency in args.concurrency:
+                before = health(port)['batch']
+                result = run_load(port, concurrency, args.requests, forms)
+                after = health(port)['batch']
+                batches = after['batches'] - before['batches']
+                mean_batch = (after['requests'] - before['requests']) / batches if batches else 0.0
+                errors = f"  ({result['errors']} hata)" if result['errors'] else ""
+                print(f"   {name:<28} {concurrency:>8} {result['requests_per_second']:>10.0f} "
+                      f"{result['p50_ms']:>9.2f} {result['p99_ms']:>9.2f} {mean_batch:>11.1f}{errors}")
+        finally:
+            process.terminate()
+            process.wait()
+
+
+if __name__ == "__main__":
+    main()
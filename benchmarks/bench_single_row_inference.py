@@ -0,0 +1,124 @@
+"""
+Tek Satır Tahmin Gecikmesi Mikro Benchmark'ı - Spor Yetenek Tahmin Sistemi
+Bu dosya, Streamlit uygulamasında bir form gönderiminin model girdisine
+dönüştürülme süresini (modelin kendi predict süresi hariç) ve uçtan uca
+tahmin süresini p50/p99 olarak ölçer.
+
+Ölçülen yollar:
+    - legacy: tam kayıt sözlüğü + DataFrame + get_dummies + sütun eşleme
+      (kodlayıcı içermeyen eski model dosyalarının yolu)
+    - transform_record: tam kayıt sözlüğü + FeatureEncoder.transform_record
+      + scaler.transform
+    - record_encoder: önceden ayrılmış vektöre doğrudan yazma (yerinde ölçekleme)
+    - model: modelin kendi predict_proba süresi (karşılaştırma için)
+    - end_to_end: SportsApp.predict_with_model (ve varsa derlenmiş model)
+
+Kullanım:
+    python benchmarks/bench_single_row_inference.py --model models/best_model.pkl
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from streamlit.logger import set_log_level
+
+set_log_level('error')  # Streamlit çalışma ortamı dışında içe aktarma uyarıları
+
+from app.main import (SportsApp, file_signature, load_model_data, load_compiled_model,
+                      load_record_encoder, load_sport_scorer)
+from src.compiled_model import compiled_path_for
+from src.inference import sample_forms
+
+
+def measure(func, forms: list, iterations: int) -> dict:
+    """func'ı formlar üzerinde döngüyle çalıştırıp çağrı başına gecikme yüzdeliklerini döndürür"""
+    for form in forms[:min(len(forms), 20)]:
+        func(form)  # ısınma
+    timings = np.empty(iterations)
+    for i in range(iterations):
+        form = forms[i % len(forms)]
+        start = time.perf_counter_ns()
+        func(form)
+        timings[i] = time.perf_counter_ns() - start
+    timings /= 1000
+    return {'p50': np.percentile(timings, 50), 'p99': np.percentile(timings, 99), 'mean': timings.mean()}
+
+
+def build_app(model_path: str, compiled: bool) -> SportsApp:
+    """Sabit model yolu yerine verilen dosyayı kullanan bir uygulama örneği kurar"""
+    app = SportsApp.__new__(SportsApp)
+    app.scorer = load_sport_scorer()
+    app.model_data = None
+    app.compiled_model = None
+    signature = file_signature(model_path)
+    if compiled:
+        app.compiled_model = load_compiled_model(model_path, signature)
+    else:
+        app.model_data = load_model_data(model_path, signature)
+    app.record_encoder = load_record_encoder(model_path, signature)
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Tek satır tahmin gecikmesi")
+    parser.add_argument('--model', default="models/best_model.pkl", help="save_best_model çıktısı")
+    parser.add_argument('--iterations', type=int, default=5000, help="Yol başına ölçüm sayısı")
+    parser.add_argument('--seed', type=int, default=42, help="Form üretimi seed değeri")
+    args = parser.parse_args()
+
+    forms = sample_forms(256, args.seed)
+    app = build_app(args.model, compiled=False)
+    model_data = app.model_data
+    model = model_data['model']
+    encoder = model_data['encoder']
+    scaler = model_data['scaler']
+    scaled = model_data.get('scaled', model_data['model_name'] in ['SVM', 'Neural Network'])
+
+    def legacy(form):
+        encoded = app.encode_user_data_legacy(app.prepare_user_data_for_model(form),
+                                              model_data['feature_names'])
+        return scaler.transform(encoded) if scaled else encoded.to_numpy()
+
+    def transform_record(form):
+        encoded = encoder.transform_record(app.prepare_user_data_for_model(form)).reshape(1, -1)
+        return scaler.transform(encoded) if scaled else encoded
+
+    encoded = app.encode_user_data(forms[0]).copy()
+
+    results = {
+        'legacy (get_dummies)': measure(legacy, forms, args.iterations),
+        'transform_record + scaler': measure(transform_record, forms, args.iterations),
+        'record_encoder': measure(app.encode_user_data, forms, args.iterations),
+        'model.predict_proba': measure(lambda form: model.predict_proba(encoded), forms, args.iterations),
+        'end_to_end (predict_with_model)': measure(app.predict_with_model, forms, args.iterations)
+    }
+
+    compiled_path = compiled_path_for(args.model)
+    if os.path.exists(compiled_path):
+        compiled_app = build_app(compiled_path, compiled=True)
+        compiled_model = compiled_app.compiled_model
+
+        def compiled_records(form):
+            return compiled_model.predict_proba_records([compiled_app.prepare_user_data_for_model(form)])
+
+        results['compiled: predict_proba_records'] = measure(compiled_records, forms, args.iterations)
+        results['compiled: end_to_end'] = measure(compiled_app.predict_with_compiled_model, forms,
+                                                  args.iterations)
+
+    print(f"⏱️ Tek satır tahmin gecikmesi: {model_data['model_name']} "
+          f"({'ölçekli' if scaled else 'ölçeksiz'}, {args.iterations} ölçüm)")
+    print("=" * 72)
+    print(f"   {'Yol':<36} {'p50 µs':>10} {'p99 µs':>10} {'ort. µs':>10}")
+    for name, result in results.items():
+        print(f"   {name:<36} {result['p50']:10.1f} {result['p99']:10.1f} {result['mean']:10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+Toplu Tahmin - Spor Yetenek Tahmin Sistemi
+Bu dosya, save_best_model ile kaydedilmiş modelle büyük veri setlerini
+(CSV/Parquet/Arrow) parça parça puanlar.
+
+Girdi iter_dataset ile chunk_rows satırlık parçalar halinde okunur; her parça
+kaydedilmiş FeatureEncoder ile kodlanır, scaler yalnızca ölçeklenmiş
+modellerde (SVM, Neural Network, compact mod) uygulanır ve tahmin edilen spor
+ile her hedef spor için bir olasılık sütunu çıktıya parça parça yazılır.
+
+n_jobs > 1 ise parçalar, modeli bir kez yükleyen işçi süreçlerde puanlanır.
+Bellekte en fazla 2 * n_jobs parça bulunur; çıktı girdinin satır sırasını korur.
+"""
+
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional
+
+import joblib
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+try:
+    from dataset_io import DatasetWriter, detect_format, iter_dataset
+    from feature_config import TARGET_SPORTS
+    from model_trainer import SCALED_MODELS
+except ImportError:
+    from src.dataset_io import DatasetWriter, detect_format, iter_dataset
+    from src.feature_config import TARGET_SPORTS
+    from src.model_trainer import SCALED_MODELS
+
+PREDICTION_COLUMN = 'tahmin_edilen_spor'
+
+
+def probability_column(sport: str) -> str:
+    """Spor adından çıktıdaki olasılık sütununun adını üretir"""
+    return f'olasilik_{sport.replace("/", "_").replace(" ", "_").lower()}'
+
+
+class ChunkScorer:
+    """Kaydedilmiş model verisiyle tek bir veri parçasını puanlayan sınıf"""
+
+    def __init__(self, model_data: Dict):
+        """
+        Args:
+            model_data: save_best_model ile kaydedilmiş sözlük
+        """
+        if 'encoder' not in model_data:
+            raise ValueError("Model dosyası FeatureEncoder içermiyor; toplu tahmin için "
+                             "modeli güncel sürümle yeniden eğitin")
+        self.model = model_data['model']
+        self.encoder = model_data['encoder']
+        self.scaler = model_data['scaler']
+        self.scaled = model_data.get('scaled', model_data['model_name'] in SCALED_MODELS)
+        self.classes = np.asarray(model_data['label_encoder'].classes_)
+
+        # Model eğitimde görmediği sporlar için de sütun üretilir (olasılık 0)
+        self.sports = list(TARGET_SPORTS) + sorted(set(self.classes) - set(TARGET_SPORTS))
+        sport_index = {sport: i for i, sport in enumerate(self.sports)}
+        model_classes = getattr(self.model, 'classes_', np.arange(len(self.classes)))
+        self._columns = np.array([sport_index[sport] for sport in self.classes[model_classes]])
+        self.output_columns = [PREDICTION_COLUMN] + [probability_column(sport) for sport in self.sports]
+
+    def predict_proba(self, chunk: pd.DataFrame) -> np.ndarray:
+        """Parçayı kodlayıp (N, len(sports)) boyutunda olasılık matrisi döndürür"""
+        X = self.encoder.transform(chunk)
+        if self.scaled:
+            X = self.scaler.transform(X)
+        probabilities = np.zeros((len(X), len(self.sports)), dtype=np.float32)
+        probabilities[:, self._columns] = self.model.predict_proba(X)
+        return probabilities
+
+    def score(self, chunk: pd.DataFrame, keep_columns: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Parçayı puanlar
+
+        Tahmin edilen spor, en yüksek olasılıklı spordur (SVM'de model.predict
+        ile nadiren farklı olabilir; çıktı kendi içinde tutarlı kalır).
+
+        Args:
+            chunk: Ham özellik sütunlarını içeren parça
+            keep_columns: Çıktıya aynen taşınacak girdi sütunları (ör. kimlik sütunu)
+        """
+        probabilities = self.predict_proba(chunk)
+        output = {}
+        for column in keep_columns or []:
+            output[column] = chunk[column].to_numpy()
+        output[PREDICTION_COLUMN] = np.asarray(self.sports, dtype=object)[probabilities.argmax(axis=1)]
+        for i, column in enumerate(self.output_columns[1:]):
+            output[column] = probabilities[:, i]
+        return pd.DataFrame(output)
+
+
+# İşçi süreçteki puanlayıcı; model işçi başına bir kez yüklenir
+_worker_scorer: Optional[ChunkScorer] = None
+
+
+def _init_worker(model_path: str, threads: int):
+    global _worker_scorer
+    _worker_scorer = ChunkScorer(joblib.load(model_path))
+    # XGBoost/LightGBM/BLAS iş parçacıkları işçiler arasında paylaştırılır
+    threadpool_limits(threads)
+
+
+def _score_in_worker(chunk: pd.DataFrame, keep_columns: Optional[List[str]]) -> pd.DataFrame:
+    return _worker_scorer.score(chunk, keep_columns)
+
+
+class BatchScorer:
+    """Büyük veri setlerini kaydedilmiş en iyi modelle parça parça puanlayan sınıf"""
+
+    def __init__(self, model_path: str = "models/best_model.pkl", chunk_rows: int = 100_000,
+                 n_jobs: int = 1, keep_columns: Optional[List[str]] = None):
+        """
+        Args:
+            model_path: save_best_model ile kaydedilmiş model dosyası
+            chunk_rows: Bir parçadaki satır sayısı (bellek kullanımı buna bağlıdır)
+            n_jobs: Parçaları puanlayan işçi süreç sayısı (1: aynı süreçte,
+                -1: tüm çekirdekler; diğer 1'den küçük değerler ValueError)
+            keep_columns: Çıktıya aynen taşınacak girdi sütunları
+        """
+        if n_jobs == -1:
+            n_jobs = os.cpu_count() or 1
+        elif n_jobs < 1:
+            raise ValueError(f"Geçersiz işçi sayısı: {n_jobs} (1 ya da daha büyük olmalı, -1: tüm çekirdekler)")
+        self.model_path = model_path
+        self.chunk_rows = chunk_rows
+        self.n_jobs = n_jobs
+        self.keep_columns = keep_columns
+        self.scorer = ChunkScorer(joblib.load(model_path))
+        self.report = {}
+
+    def _scored_chunks(self, input_path: str):
+        """Puanlanmış parçaları girdi sırasıyla üretir"""
+        chunks = iter_dataset(input_path, self.chunk_rows)
+        if self.n_jobs == 1:
+            for chunk in chunks:
+                yield self.scorer.score(chunk, self.keep_columns)
+            return
+
+        threads = max(1, (os.cpu_count() or 1) // self.n_jobs)
+        with ProcessPoolExecutor(max_workers=self.n_jobs, initializer=_init_worker,
+                                 initargs=(self.model_path, threads)) as executor:
+            pending = deque()
+            for chunk in chunks:
+                pending.append(executor.submit(_score_in_worker, chunk, self.keep_columns))
+                if len(pending) >= 2 * self.n_jobs:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def score_file(self, input_path: str, output_path: str) -> Dict:
+        """
+        Girdi veri setini puanlayıp çıktıyı (CSV/Parquet/Arrow) yazar
+
+        Çıktı önce geçici dosyaya yazılır; iş yarıda kalırsa eksik bir dosya
+        output_path'te görünmez.
+
+        Returns:
+            Özet rapor (satır sayısı, süre, satır/s, tahmin dağılımı)
+        """
+        print(f"Toplu tahmin: {input_path} -> {output_path} "
+              f"(parça: {self.chunk_rows} satır, işçi: {self.n_jobs})")
+        start = time.perf_counter()
+        counts = np.zeros(len(self.scorer.sports), dtype=np.int64)
+        sport_index = {sport: i for i, sport in enumerate(self.scorer.sports)}
+        temp_path = output_path + ".tmp"
+        with DatasetWriter(temp_path, detect_format(output_path)) as writer:
+            for scored in self._scored_chunks(input_path):
+                writer.write(scored)
+                for sport, count in scored[PREDICTION_COLUMN].value_counts().items():
+                    counts[sport_index[sport]] += count
+                print(f"   {writer.rows_written} satır puanlandı "
+                      f"({writer.rows_written / (time.perf_counter() - start):,.0f} satır/s)")
+        os.replace(temp_path, output_path)
+
+        seconds = time.perf_counter() - start
+        self.report = {
+            'rows': int(counts.sum()),
+            'seconds': seconds,
+            'rows_per_second': counts.sum() / max(seconds, 1e-9),
+            'predictions': {sport: int(count) for sport, count in zip(self.scorer.sports, counts)}
+        }
+        print(f"Tamamlandı: {self.report['rows']} satır, {seconds:.1f}s "
+              f"({self.report['rows_per_second']:,.0f} satır/s)")
+        return self.report
+
+
+# Kullanım örneği
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Kaydedilmiş modelle toplu tahmin")
+    parser.add_argument('input', help="Puanlanacak veri seti (CSV/Parquet/Arrow)")
+    parser.add_argument('output', help="Tahmin dosyası (CSV/Parquet/Arrow)")
+    parser.add_argument('--model', default="models/best_model.pkl", help="Model dosyası")
+    parser.add_argument('--chunk-rows', type=int, default=100_000, help="Parça başına satır sayısı")
+    parser.add_argument('--workers', type=int, default=1, help="İşçi süreç sayısı (-1: tüm çekirdekler)")
+    parser.add_argument('--keep-columns', nargs='*', default=None,
+                        help="Çıktıya aynen taşınacak girdi sütunları (ör. kimlik sütunu)")
+    args = parser.parse_args()
+    BatchScorer(args.model, args.chunk_rows, args.workers, args.keep_columns).score_file(
+        args.input, args.output)
@@ -5,77 +5,634 @@ Bu dosya, büyük veri setlerini parçalar halinde üretir.
 
 import pandas as pd
 import numpy as np
-from data_generator import SportsDataGenerator
 import os
-from typing import List
+import json
+import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 import time
 
+try:
+    from data_generator import SportsDataGenerator
+    from feature_config import ALL_FEATURES, TARGET_SPORTS
+    from dataset_io import DatasetWriter, save_dataset, read_dataset, detect_format
+except ImportError:
+    from src.data_generator import SportsDataGenerator
+    from src.feature_config import ALL_FEATURES, TARGET_SPORTS
+    from src.dataset_io import DatasetWriter, save_dataset, read_dataset, detect_format
+
+MANIFEST_NAME = "manifest.json"
+# Tamamlanan parçaların kayıtları bu günlüğe (JSON satırları) eklenir; manifest
+# yalnızca çalışmanın başında ve sonunda yeniden yazılır
+JOURNAL_NAME = "manifest.journal"
+SHARD_EXTENSIONS = {'csv': 'csv', 'parquet': 'parquet', 'arrow': 'arrow'}
+
+
+# Vektörel motorda satırlar sabit boyutlu bloklar halinde üretilir; her blok
+# kendi SeedSequence akışını kullanır. Böylece herhangi bir satır aralığı,
+# batch_size'dan ve önceki satırlardan bağımsız olarak üretilebilir.
+ROWS_PER_BLOCK = 10_000
+
+# Üretim mantığı değiştiğinde artırılmalıdır (dataset_fingerprint'e girer)
+ENGINE_VERSION = 2
+
+
+def dataset_fingerprint() -> str:
+    """Üretim konfigürasyonunun (özellik şeması, hedef sporlar, motor ve NumPy sürümü) özetini döndürür
+    
+    Aynı seed ve aynı parmak izine sahip iki makine, aynı satır aralığı için
+    bayt düzeyinde aynı veriyi üretir. NumPy, Generator akışlarının sürümler
+    arasında aynı kalacağını garanti etmediğinden NumPy sürümü de özete girer.
+    """
+    config = {
+        'engine_version': ENGINE_VERSION,
+        'numpy_version': np.__version__,
+        'rows_per_block': ROWS_PER_BLOCK,
+        'features': ALL_FEATURES,
+        'target_sports': TARGET_SPORTS
+    }
+    payload = json.dumps(config, sort_keys=True, ensure_ascii=False, default=list)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    """İşçi sayısını çözümler (-1: tüm çekirdekler); diğer 1'den küçük değerler ValueError"""
+    if n_jobs == -1:
+        return os.cpu_count() or 1
+    if n_jobs < 1:
+        raise ValueError(f"Geçersiz işçi sayısı: {n_jobs} (1 ya da daha büyük olmalı, -1: tüm çekirdekler)")
+    return n_jobs
+
+
+def _block_seed_sequence(base_seed: int, block: int) -> np.random.SeedSequence:
+    """base_seed'den türetilmiş, bloğa özel bağımsız SeedSequence döndürür
+    
+    SeedSequence(base_seed).spawn(n)[block] ile aynı akışı verir, ancak
+    önceki blokları oluşturmaya gerek kalmaz.
+    """
+    return np.random.SeedSequence(base_seed, spawn_key=(block,))
+
+
+# Her süreçte bir kez oluşturulup bloklar arasında yeniden kullanılan üretici
+_process_generator: Optional[SportsDataGenerator] = None
+
+# Son üretilen blok ((base_seed, blok), DataFrame); ardışık küçük batch'lerin
+# aynı bloğu tekrar üretmesini önler
+_block_cache: Optional[Tuple[Tuple[int, int], pd.DataFrame]] = None
+
+
+def _block_generator(base_seed: int, block: int) -> SportsDataGenerator:
+    """Süreçteki üreticiyi bloğun RNG akışıyla yeniden tohumlayıp döndürür"""
+    global _process_generator
+    rng = np.random.default_rng(_block_seed_sequence(base_seed, block))
+    if _process_generator is None:
+        _process_generator = SportsDataGenerator(seed=base_seed, rng=rng)
+    else:
+        _process_generator.reseed(base_seed, rng)
+    return _process_generator
+
+
+def _generate_block(base_seed: int, block: int) -> pd.DataFrame:
+    """Tek bir bloğu kendi RNG akışıyla vektörel olarak üretir"""
+    global _block_cache
+    if _block_cache is not None and _block_cache[0] == (base_seed, block):
+        return _block_cache[1]
+    
+    data = _block_generator(base_seed, block).generate_dataset_vectorized(ROWS_PER_BLOCK)
+    _block_cache = ((base_seed, block), data)
+    return data
+
+
+def generate_rows(base_seed: int, start: int, stop: int,
+                  fingerprint: Optional[str] = None) -> pd.DataFrame:
+    """
+    (base_seed) veri setinin [start, stop) satır aralığını üretir
+    
+    Önceki satırlar üretilmez; yalnızca aralığı kapsayan bloklar üretilir.
+    Sonuç makineden, batch boyutundan ve işçi sayısından bağımsızdır.
+    
+    Args:
+        base_seed: Veri setinin seed değeri
+        start: İlk satır (dahil)
+        stop: Son satır (hariç)
+        fingerprint: Verilirse dataset_fingerprint() ile karşılaştırılır;
+            farklı bir üretim konfigürasyonu ValueError ile reddedilir
+    """
+    if fingerprint is not None and fingerprint != dataset_fingerprint():
+        raise ValueError(f"Konfigürasyon parmak izi uyuşmuyor: istenen {fingerprint}, "
+                         f"bu kurulum {dataset_fingerprint()}")
+    if not 0 <= start <= stop:
+        raise ValueError(f"Geçersiz satır aralığı: [{start}, {stop})")
+    if start == stop:
+        # Blok üretilmez; yalnızca sütunlar ve tipleriyle boş veri seti döner
+        return _block_generator(base_seed, 0).generate_dataset_vectorized(0)
+    
+    first_block = start // ROWS_PER_BLOCK
+    last_block = (stop - 1) // ROWS_PER_BLOCK
+    
+    parts = []
+    for block in range(first_block, last_block + 1):
+        block_start = block * ROWS_PER_BLOCK
+        data = _generate_block(base_seed, block)
+        parts.append(data.iloc[max(start, block_start) - block_start:
+                               min(stop, block_start + ROWS_PER_BLOCK) - block_start])
+    
+    if len(parts) == 1:
+        return parts[0].reset_index(drop=True)
+    return pd.concat(parts, ignore_index=True)
+
+
+def _write_shard(batch: pd.DataFrame, path: str, file_format: str) -> Dict:
+    """Batch'i parça dosyasına atomik olarak yazar ve manifest kaydını döndürür"""
+    temp_path = path + ".tmp"
+    with DatasetWriter(temp_path, file_format) as writer:
+        writer.write(batch)
+    os.replace(temp_path, path)
+    
+    summary = DatasetSummary()
+    summary.update(batch)
+    return {
+        'file': os.path.basename(path),
+        'rows': len(batch),
+        'bytes': os.path.getsize(path),
+        'summary': summary.to_dict()
+    }
+
+
+def _generate_row_ranges(base_seed: int, ranges: List[Tuple[int, int]]) -> List[pd.DataFrame]:
+    """Ardışık satır aralıklarını işçi süreçte üretir (ortak bloklar bir kez üretilir)"""
+    return [generate_rows(base_seed, start, stop) for start, stop in ranges]
+
+
+def _generate_vectorized_shards(base_seed: int, shards: List[Tuple[int, int, str]],
+                                file_format: str) -> List[Dict]:
+    """Ardışık parçaları işçi süreçte üretip doğrudan diske yazar"""
+    return [_write_shard(generate_rows(base_seed, start, stop), path, file_format)
+            for start, stop, path in shards]
+
+
+def _run_ordered(tasks: List[Tuple[int, Callable, tuple]], n_jobs: int) -> Iterator[Tuple[int, object]]:
+    """
+    (anahtar, fonksiyon, argümanlar) görevlerini süreç havuzunda çalıştırır
+    
+    Sonuçlar görev sırasıyla döndürülür; bellekte en fazla 2 * n_jobs
+    tamamlanmamış görev tutulur.
+    """
+    with ProcessPoolExecutor(max_workers=n_jobs) as executor:
+        pending = deque()
+        next_task = 0
+        while next_task < len(tasks) or pending:
+            while next_task < len(tasks) and len(pending) < 2 * n_jobs:
+                key, func, args = tasks[next_task]
+                pending.append((key, executor.submit(func, *args)))
+                next_task += 1
+            
+            key, future = pending.popleft()
+            yield key, future.result()
+
+
+class DatasetSummary:
+    """Üretilen veri setinin özet istatistiklerini batch batch biriktirir"""
+    
+    def __init__(self):
+        self.total_rows = 0
+        self.num_columns = 0
+        self.age_sum = 0.0
+        self.sport_counts = pd.Series(dtype='int64')
+        self.gender_counts = pd.Series(dtype='int64')
+    
+    def update(self, batch: pd.DataFrame):
+        """Bir batch'in istatistiklerini özete ekler"""
+        self.total_rows += len(batch)
+        self.num_columns = len(batch.columns)
+        self.age_sum += float(batch['yas'].sum())
+        self.sport_counts = self.sport_counts.add(
+            batch['tavsiye_edilen_spor'].value_counts(), fill_value=0).astype('int64')
+        self.gender_counts = self.gender_counts.add(
+            batch['cinsiyet'].value_counts(), fill_value=0).astype('int64')
+    
+    def merge(self, other: 'DatasetSummary'):
+        """Başka bir özetin istatistiklerini bu özete ekler"""
+        self.total_rows += other.total_rows
+        self.num_columns = other.num_columns or self.num_columns
+        self.age_sum += other.age_sum
+        self.sport_counts = self.sport_counts.add(other.sport_counts, fill_value=0).astype('int64')
+        self.gender_counts = self.gender_counts.add(other.gender_counts, fill_value=0).astype('int64')
+    
+    def to_dict(self) -> Dict:
+        """Özeti JSON'a yazılabilir sözlüğe çevirir"""
+        return {
+            'total_rows': self.total_rows,
+            'num_columns': self.num_columns,
+            'age_sum': self.age_sum,
+            'sport_counts': {k: int(v) for k, v in self.sport_counts.items()},
+            'gender_counts': {k: int(v) for k, v in self.gender_counts.items()}
+        }
+    
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'DatasetSummary':
+        """to_dict çıktısından özet oluşturur"""
+        summary = cls()
+        summary.total_rows = data['total_rows']
+        summary.num_columns = data['num_columns']
+        summary.age_sum = data['age_sum']
+        summary.sport_counts = pd.Series(data['sport_counts'], dtype='int64')
+        summary.gender_counts = pd.Series(data['gender_counts'], dtype='int64')
+        return summary
+    
+    @property
+    def mean_age(self) -> float:
+        return self.age_sum / self.total_rows if self.total_rows else 0.0
+    
+    def print_report(self, save_path: str):
+        """Özet bilgileri yazdırır"""
+        print("\n" + "="*50)
+        print("📊 BÜYÜK VERİ SETİ ÖZET BİLGİLERİ")
+        print("="*50)
+        print(f"📈 Toplam kişi sayısı: {self.total_rows}")
+        print(f"📊 Özellik sayısı: {self.num_columns}")
+        print(f"📁 Dosya boyutu: {os.path.getsize(save_path) / (1024*1024):.2f} MB")
+        print(f"📋 Ortalama yaş: {self.mean_age:.1f}")
+        
+        print(f"\n🏆 En çok tavsiye edilen sporlar (Türkiye'ye özel):")
+        sport_counts = self.sport_counts.sort_values(ascending=False, kind='stable')
+        for i, (sport, count) in enumerate(sport_counts.head(5).items(), 1):
+            print(f"   {i}. {sport}: {count} kişi (%{count/self.total_rows*100:.1f})")
+        
+        print(f"\n👥 Cinsiyet dağılımı:")
+        gender_counts = self.gender_counts.sort_values(ascending=False, kind='stable')
+        for gender, count in gender_counts.items():
+            print(f"   {gender}: {count} kişi (%{count/self.total_rows*100:.1f})")
+
+
 class BulkDataGenerator:
     """Büyük veri setlerini parçalar halinde üretir"""
     
-    def __init__(self, batch_size: int = 50, seed: int = 42):
+    def __init__(self, batch_size: int = 50, seed: int = 42, vectorized: bool = False):
         """
         Bulk veri üretici sınıfını başlatır
         
         Args:
             batch_size: Her seferinde üretilecek kişi sayısı
             seed: Rastgele sayı üreteci için seed değeri
+            vectorized: True ise satırlar sütun bazlı motorla, ROWS_PER_BLOCK'luk
+                blokların her birine özel np.random.Generator akışıyla üretilir
+                (paralel üretim için gerekli). Bu durumda çıktı batch_size'dan
+                bağımsızdır. Paralel üretimde batch_size, ROWS_PER_BLOCK'un böleni
+                ya da katı olmalıdır; işçi görevleri tam bloklara yuvarlanır.
         """
         self.batch_size = batch_size
         self.base_seed = seed
+        self.vectorized = vectorized
         self.generator = SportsDataGenerator(seed=seed)
         
-    def generate_batch(self, batch_num: int) -> pd.DataFrame:
+    def generate_rows(self, start: int, stop: int, fingerprint: Optional[str] = None) -> pd.DataFrame:
+        """Veri setinin [start, stop) satır aralığını üretir (bkz. generate_rows)"""
+        return generate_rows(self.base_seed, start, stop, fingerprint)
+    
+    def generate_batch(self, batch_num: int, size: Optional[int] = None) -> pd.DataFrame:
         """Tek bir batch veri üretir"""
-        # Her batch için farklı seed kullan
+        size = self.batch_size if size is None else size
+        
+        if self.vectorized:
+            start = batch_num * self.batch_size
+            return generate_rows(self.base_seed, start, start + size)
+        
+        # Her batch için farklı seed kullan (üretici yeniden oluşturulmaz)
         batch_seed = self.base_seed + batch_num * 1000
-        self.generator = SportsDataGenerator(seed=batch_seed)
+        self.generator.reseed(batch_seed)
         
-        return self.generator.generate_dataset(self.batch_size)
+        return self.generator.generate_dataset(size)
+    
+    def _batch_sizes(self, total_size: int) -> List[int]:
+        """Her batch'in kişi sayısını döndürür (son batch kalan kişi kadardır)"""
+        batches = (total_size + self.batch_size - 1) // self.batch_size
+        return [min(self.batch_size, total_size - batch_num * self.batch_size)
+                for batch_num in range(batches)]
+    
+    def _iter_batches(self, total_size: int, n_jobs: int = 1) -> Iterator[Tuple[int, pd.DataFrame]]:
+        """
+        Batch'leri sırayla (batch_num, DataFrame) olarak üretir
+        
+        n_jobs > 1 ise batch'ler bir süreç havuzunda üretilir; sıra korunur ve
+        bellekte en fazla 2 * n_jobs tamamlanmamış batch tutulur.
+        """
+        sizes = self._batch_sizes(total_size)
+        
+        if n_jobs == 1:
+            for batch_num, size in enumerate(sizes):
+                yield batch_num, self.generate_batch(batch_num, size)
+            return
+        
+        self._check_parallel(n_jobs)
+        tasks = [(group, _generate_row_ranges,
+                  (self.base_seed, [self._batch_range(batch_num, sizes[batch_num]) for batch_num in group]))
+                 for group in self._block_groups(range(len(sizes)))]
+        for group, batches in _run_ordered(tasks, n_jobs):
+            yield from zip(group, batches)
+    
+    def _batch_range(self, batch_num: int, size: int) -> Tuple[int, int]:
+        start = batch_num * self.batch_size
+        return start, start + size
+    
+    def _block_groups(self, batch_nums: Iterable[int]) -> List[List[int]]:
+        """
+        Batch'leri başladıkları bloğa göre işçi görevlerine gruplar
+        
+        Küçük batch'ler aynı görevde toplanır; böylece her blok yalnızca bir
+        işçide ve bir kez üretilir (batch başına tam blok üretilmez).
+        """
+        groups = []
+        current_block = None
+        for batch_num in batch_nums:
+            block = batch_num * self.batch_size // ROWS_PER_BLOCK
+            if block != current_block:
+                groups.append([])
+                current_block = block
+            groups[-1].append(batch_num)
+        return groups
+    
+    def _check_parallel(self, n_jobs: int):
+        if n_jobs <= 1:
+            return
+        if not self.vectorized:
+            raise ValueError("Paralel üretim yalnızca vectorized=True ile kullanılabilir "
+                             "(klasik motor global RNG durumunu kullanır)")
+        if self.batch_size % ROWS_PER_BLOCK and ROWS_PER_BLOCK % self.batch_size:
+            raise ValueError(f"Paralel üretimde batch_size ({self.batch_size}) {ROWS_PER_BLOCK} "
+                             f"satırlık blok boyutunun böleni ya da katı olmalı; aksi halde blok "
+                             f"sınırındaki bloklar birden çok işçide yeniden üretilir")
+    
+    def _batch_seed_info(self, batch_num: int, rows: int) -> Dict:
+        """Manifest için batch'in seed bilgisini döndürür"""
+        if self.vectorized:
+            start = batch_num * self.batch_size
+            return {'entropy': self.base_seed, 'row_range': [start, start + rows]}
+        return {'seed': self.base_seed + batch_num * 1000}
+    
+    def _manifest_config(self, total_size: int, file_format: str) -> Dict:
+        config = {
+            'total_size': total_size,
+            'batch_size': self.batch_size,
+            'base_seed': self.base_seed,
+            'vectorized': self.vectorized,
+            'format': file_format
+        }
+        if self.vectorized:
+            config['fingerprint'] = dataset_fingerprint()
+        return config
+    
+    @staticmethod
+    def _write_manifest(shard_dir: str, manifest: Dict):
+        """
+        Manifest'i atomik olarak (geçici dosya + yeniden adlandırma) yazar
+        
+        Günlükteki kayıtlar artık manifest'te olduğundan günlük silinir.
+        """
+        path = os.path.join(shard_dir, MANIFEST_NAME)
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        os.replace(path + ".tmp", path)
+        journal_path = os.path.join(shard_dir, JOURNAL_NAME)
+        if os.path.exists(journal_path):
+            os.remove(journal_path)
+    
+    @staticmethod
+    def _read_manifest(shard_dir: str) -> Dict:
+        """
+        Manifest'i okur ve günlükteki parça kayıtlarını üzerine ekler
+        
+        Yazılırken kesilmiş (satır sonu olmayan) son günlük satırı yok sayılır.
+        """
+        with open(os.path.join(shard_dir, MANIFEST_NAME), encoding='utf-8') as f:
+            manifest = json.load(f)
+        journal_path = os.path.join(shard_dir, JOURNAL_NAME)
+        if os.path.exists(journal_path):
+            with open(journal_path, encoding='utf-8') as f:
+                for line in f:
+                    if not line.endswith('\n'):
+                        break
+                    record = json.loads(line)
+                    manifest['shards'][str(record.pop('batch'))] = record
+        return manifest
+    
+    def generate_sharded_dataset(self, total_size: int, shard_dir: str,
+                                 file_format: str = 'csv',
+                                 n_jobs: int = 1,
+                                 resume: bool = True,
+                                 progress_callback=None) -> DatasetSummary:
+        """
+        Veri setini kontrol noktalı (checkpoint) parçalar halinde üretir
+        
+        Her batch shard_dir içinde ayrı bir parça dosyasına yazılır ve
+        tamamlanan her parçanın kaydı (seed, satır sayısı, boyut, özet)
+        manifest.journal'a bir satır olarak eklenir; günlük, çalışmanın
+        sonunda manifest.json'a işlenir. Yarıda kalan bir çalışma
+        resume=True ile yeniden başlatıldığında tamamlanmış parçalar atlanır;
+        sonuç, kesintisiz bir çalışmayla aynıdır.
+        
+        Args:
+            total_size: Toplam kişi sayısı
+            shard_dir: Parça dosyalarının ve manifest'in yazılacağı dizin
+            file_format: Parça biçimi ('csv', 'parquet' ya da 'arrow')
+            n_jobs: Paralel işçi süreç sayısı (-1: tüm çekirdekler); işçiler
+                parçaları doğrudan diske yazar
+            resume: False ise mevcut manifest yok sayılır ve tüm parçalar yeniden üretilir
+            progress_callback: Her parçadan sonra (tamamlanan kişi, toplam kişi,
+                tamamlanan parça, toplam parça) ile çağrılır
+        """
+        n_jobs = resolve_n_jobs(n_jobs)
+        self._check_parallel(n_jobs)
+        if file_format not in SHARD_EXTENSIONS:
+            raise ValueError(f"Desteklenmeyen parça biçimi: {file_format}")
+        
+        os.makedirs(shard_dir, exist_ok=True)
+        config = self._manifest_config(total_size, file_format)
+        manifest = {'config': config, 'shards': {}}
+        
+        manifest_path = os.path.join(shard_dir, MANIFEST_NAME)
+        if resume and os.path.exists(manifest_path):
+            previous = self._read_manifest(shard_dir)
+            if previous['config'] != config:
+                raise ValueError(f"{manifest_path} farklı bir konfigürasyonla oluşturulmuş: "
+                                 f"{previous['config']} (yeni: {config}). "
+                                 f"Farklı bir dizin kullanın ya da resume=False verin.")
+            # Yalnızca dosyası eksiksiz duran parçalar tamamlanmış sayılır
+            for key, shard in previous['shards'].items():
+                path = os.path.join(shard_dir, shard['file'])
+                if os.path.exists(path) and os.path.getsize(path) == shard['bytes']:
+                    manifest['shards'][key] = shard
+        
+        sizes = self._batch_sizes(total_size)
+        batches = len(sizes)
+        missing = [batch_num for batch_num in range(batches) if str(batch_num) not in manifest['shards']]
+        
+        print(f"🚀 {total_size} kişilik veri seti parçalar halinde üretiliyor: {shard_dir}")
+        print(f"📦 Parça sayısı: {batches} (tamamlanmış: {batches - len(missing)}, kalan: {len(missing)})")
+        self._write_manifest(shard_dir, manifest)
+        
+        def shard_path(batch_num):
+            return os.path.join(shard_dir, f"part-{batch_num:06d}.{SHARD_EXTENSIONS[file_format]}")
+        
+        if n_jobs > 1:
+            tasks = [(group, _generate_vectorized_shards,
+                      (self.base_seed,
+                       [(*self._batch_range(batch_num, sizes[batch_num]), shard_path(batch_num))
+                        for batch_num in group],
+                       file_format))
+                     for group in self._block_groups(missing)]
+            results = ((batch_num, shard) for group, shards in _run_ordered(tasks, n_jobs)
+                       for batch_num, shard in zip(group, shards))
+        else:
+            results = ((batch_num, _write_shard(self.generate_batch(batch_num, sizes[batch_num]),
+                                                shard_path(batch_num), file_format))
+                       for batch_num in missing)
+        
+        completed_rows = sum(shard['rows'] for shard in manifest['shards'].values())
+        start_time = time.time()
+        with open(os.path.join(shard_dir, JOURNAL_NAME), 'a', encoding='utf-8') as journal:
+            for done, (batch_num, shard) in enumerate(results, 1):
+                shard.update(self._batch_seed_info(batch_num, shard['rows']))
+                manifest['shards'][str(batch_num)] = shard
+                journal.write(json.dumps({'batch': batch_num, **shard}, ensure_ascii=False) + "\n")
+                journal.flush()
+                completed_rows += shard['rows']
+                
+                elapsed_time = time.time() - start_time
+                start_time = time.time()
+                print(f"✅ Parça {batch_num + 1}/{batches} yazıldı: {shard['rows']} kişi "
+                      f"({elapsed_time:.2f}s, kalan {len(missing) - done})")
+                
+                if progress_callback:
+                    progress_callback(completed_rows, total_size, len(manifest['shards']), batches)
+        self._write_manifest(shard_dir, manifest)
+        
+        summary = DatasetSummary()
+        for batch_num in range(batches):
+            summary.merge(DatasetSummary.from_dict(manifest['shards'][str(batch_num)]['summary']))
+        return summary
+    
+    @staticmethod
+    def shard_files(shard_dir: str) -> List[str]:
+        """
+        Manifest'teki parça dosyalarını batch sırasıyla döndürür
+        
+        Eksik parça varsa ValueError fırlatılır.
+        """
+        manifest = BulkDataGenerator._read_manifest(shard_dir)
+        config = manifest['config']
+        total_batches = (config['total_size'] + config['batch_size'] - 1) // config['batch_size']
+        if len(manifest['shards']) != total_batches:
+            raise ValueError(f"Eksik parçalar var: {len(manifest['shards'])}/{total_batches} tamamlanmış")
+        return [os.path.join(shard_dir, manifest['shards'][str(batch_num)]['file'])
+                for batch_num in range(total_batches)]
+    
+    @staticmethod
+    def merge_shards(shard_dir: str, save_path: str):
+        """
+        Manifest'teki parçaları sırayla tek bir dosyada birleştirir
+        
+        CSV parçaları bayt düzeyinde birleştirilir (başlık bir kez yazılır);
+        diğer biçimler parça parça okunup akış halinde yazılır.
+        """
+        files = BulkDataGenerator.shard_files(shard_dir)
+        
+        if detect_format(files[0]) == 'csv' and detect_format(save_path) == 'csv':
+            with open(save_path, 'wb') as output:
+                for i, path in enumerate(files):
+                    with open(path, 'rb') as shard:
+                        header = shard.readline()
+                        if i == 0:
+                            output.write(header)
+                        while True:
+                            chunk = shard.read(1 << 20)
+                            if not chunk:
+                                break
+                            output.write(chunk)
+        else:
+            with DatasetWriter(save_path) as writer:
+                for path in files:
+                    writer.write(read_dataset(path))
     
     def generate_large_dataset(self, total_size: int, 
                              save_path: str = "data/sporcu_dataset_large.csv",
-                             progress_callback=None) -> pd.DataFrame:
+                             progress_callback=None,
+                             n_jobs: int = 1,
+                             stream: bool = False,
+                             checkpoint_dir: Optional[str] = None) -> Union[pd.DataFrame, DatasetSummary]:
         """
         Büyük veri setini parçalar halinde üretir
         
         Args:
             total_size: Toplam kişi sayısı
-            save_path: Kaydedilecek dosya yolu
-            progress_callback: İlerleme callback fonksiyonu
+            save_path: Kaydedilecek dosya yolu (.csv, .parquet ya da .arrow)
+            progress_callback: Her batch'ten sonra (tamamlanan kişi, toplam kişi,
+                tamamlanan batch, toplam batch) ile çağrılır
+            n_jobs: Paralel işçi süreç sayısı (-1: tüm çekirdekler). 1'den büyük
+                değerler vectorized=True gerektirir; çıktı işçi sayısından bağımsızdır.
+            stream: True ise her batch üretildiği anda dosyaya eklenir ve bellekte
+                tutulmaz; bu durumda veri seti yerine DatasetSummary döndürülür.
+            checkpoint_dir: Verilirse batch'ler bu dizine parça olarak yazılır ve
+                manifest tutulur (bkz. generate_sharded_dataset); yarıda kalan
+                çalışma aynı çağrıyla kaldığı yerden devam eder. Parçalar sonunda
+                save_path'te birleştirilir ve DatasetSummary döndürülür.
         """
+        n_jobs = resolve_n_jobs(n_jobs)
+        
+        if checkpoint_dir is not None:
+            summary = self.generate_sharded_dataset(
+                total_size, checkpoint_dir,
+                file_format=detect_format(save_path),
+                n_jobs=n_jobs,
+                progress_callback=progress_callback
+            )
+            print(f"🔄 Parçalar birleştiriliyor: {save_path}")
+            self.merge_shards(checkpoint_dir, save_path)
+            summary.print_report(save_path)
+            return summary
+        
         print(f"🚀 {total_size} kişilik veri seti üretiliyor...")
         print(f"📦 Batch boyutu: {self.batch_size}")
+        if n_jobs > 1:
+            print(f"⚙️ Paralel işçi sayısı: {n_jobs}")
+        if stream:
+            print(f"💾 Batch'ler doğrudan dosyaya yazılıyor: {save_path}")
         
         all_data = []
+        summary = DatasetSummary()
         batches = (total_size + self.batch_size - 1) // self.batch_size
+        writer = DatasetWriter(save_path) if stream else None
         
-        for batch_num in range(batches):
+        try:
             start_time = time.time()
-            
-            # Son batch için kalan kişi sayısını hesapla
-            remaining = total_size - (batch_num * self.batch_size)
-            current_batch_size = min(self.batch_size, remaining)
-            
-            # Batch üret
-            if current_batch_size > 0:
-                # Bu batch için özel generator
-                batch_generator = SportsDataGenerator(seed=self.base_seed + batch_num * 1000)
-                batch_data = batch_generator.generate_dataset(current_batch_size)
-                all_data.append(batch_data)
-            
-            # İlerleme bilgisi
-            completed = (batch_num + 1) * self.batch_size
-            if completed > total_size:
-                completed = total_size
+            for batch_num, batch_data in self._iter_batches(total_size, n_jobs):
+                if stream:
+                    writer.write(batch_data)
+                    summary.update(batch_data)
+                else:
+                    all_data.append(batch_data)
                 
-            elapsed_time = time.time() - start_time
-            
-            print(f"✅ Batch {batch_num + 1}/{batches} tamamlandı: "
-                  f"{completed}/{total_size} kişi ({elapsed_time:.2f}s)")
-            
-            if progress_callback:
-                progress_callback(completed, total_size, batch_num + 1, batches)
+                # İlerleme bilgisi
+                completed = (batch_num + 1) * self.batch_size
+                if completed > total_size:
+                    completed = total_size
+                    
+                elapsed_time = time.time() - start_time
+                start_time = time.time()
+                
+                print(f"✅ Batch {batch_num + 1}/{batches} tamamlandı: "
+                      f"{completed}/{total_size} kişi ({elapsed_time:.2f}s)")
+                
+                if progress_callback:
+                    progress_callback(completed, total_size, batch_num + 1, batches)
+        finally:
+            if writer is not None:
+                writer.close()
+        
+        if stream:
+            summary.print_report(save_path)
+            return summary
         
         # Tüm batch'leri birleştir
         print("🔄 Batch'ler birleştiriliyor...")
@@ -83,26 +640,11 @@ class BulkDataGenerator:
         
         # Dosyaya kaydet
         print(f"💾 Veri seti kaydediliyor: {save_path}")
-        final_dataset.to_csv(save_path, index=False, encoding='utf-8')
+        save_dataset(final_dataset, save_path)
         
         # Özet bilgiler
-        print("\n" + "="*50)
-        print("📊 BÜYÜK VERİ SETİ ÖZET BİLGİLERİ")
-        print("="*50)
-        print(f"📈 Toplam kişi sayısı: {len(final_dataset)}")
-        print(f"📊 Özellik sayısı: {len(final_dataset.columns)}")
-        print(f"📁 Dosya boyutu: {os.path.getsize(save_path) / (1024*1024):.2f} MB")
-        print(f"📋 Ortalama yaş: {final_dataset['yas'].mean():.1f}")
-        
-        print(f"\n🏆 En çok tavsiye edilen sporlar (Türkiye'ye özel):")
-        sport_counts = final_dataset['tavsiye_edilen_spor'].value_counts()
-        for i, (sport, count) in enumerate(sport_counts.head(5).items(), 1):
-            print(f"   {i}. {sport}: {count} kişi (%{count/len(final_dataset)*100:.1f})")
-        
-        print(f"\n👥 Cinsiyet dağılımı:")
-        gender_counts = final_dataset['cinsiyet'].value_counts()
-        for gender, count in gender_counts.items():
-            print(f"   {gender}: {count} kişi (%{count/len(final_dataset)*100:.1f})")
+        summary.update(final_dataset)
+        summary.print_report(save_path)
         
         return final_dataset
     
@@ -0,0 +1,450 @@
+"""
+Derlenmiş Model - Spor Yetenek Tahmin Sistemi
+Bu dosya, ağaç tabanlı modelleri (Random Forest, XGBoost, LightGBM ve
+bunların katman toplulukları) düz NumPy dizilerine derler ve yalnızca
+NumPy ile çalışan vektörel bir değerlendirici sağlar.
+
+Derlenmiş model .npz dosyası olarak kaydedilir; ağaçların yanında
+ölçekleyici parametrelerini, sınıf adlarını ve özellik düzenini de içerir.
+Yükleme ve tahmin sklearn/XGBoost/LightGBM içe aktarmaz; bu kütüphaneler
+yalnızca derleme sırasında gerekir.
+
+Tüm düğümler "x <= eşik ise sol" kuralına çevrilir:
+    - sklearn: girdi float32'ye çevrilip float64 eşikle karşılaştırılır
+    - XGBoost: float32 "x < eşik" kuralı, eşiğin bir önceki float32 değeriyle
+      "<=" kuralına çevrilir
+    - LightGBM: girdi float64 olarak karşılaştırılır
+Böylece derlenmiş modelin olasılıkları orijinal modelle (kayan nokta toplama
+sırası farkı dışında) aynıdır. NaN değerler düğümün eksik değer yönüne gider.
+"""
+
+import json
+import os
+import numpy as np
+from typing import Iterable, List, Optional
+
+try:
+    from feature_encoding import FeatureEncoder
+except ImportError:
+    from src.feature_encoding import FeatureEncoder
+
+FORMAT_VERSION = 1
+
+# Bir değerlendirme bloğundaki en fazla (satır x ağaç) hücre sayısı; ara diziler
+# önbellekte kalacak kadar küçük tutulur (900 ağaçta 64 satırlık bloklar en hızlısıdır)
+_BLOCK_CELLS = 1 << 16
+
+
+class CompiledTreeEnsemble:
+    """Düz dizilerle temsil edilen tek bir ağaç topluluğu"""
+
+    # .npz dosyasına yazılan diziler
+    ARRAYS = ('feature', 'threshold', 'left', 'right', 'default_left', 'value', 'roots', 'tree_class',
+              'output_classes')
+
+    def __init__(self, kind: str, feature: np.ndarray, threshold: np.ndarray,
+                 left: np.ndarray, right: np.ndarray, default_left: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, tree_class: np.ndarray,
+                 output_classes: np.ndarray, base_score: float, max_depth: int,
+                 float32_input: bool):
+        """
+        Args:
+            kind: 'average' (Random Forest: yaprak olasılıklarının ortalaması) ya da
+                'softmax' (boosting: sınıf başına yaprak değerlerinin toplamı + softmax)
+            feature, threshold: Düğümün özellik indeksi ve eşiği ("x <= eşik" ise sol)
+            left, right: Çocuk düğümlerin mutlak indeksleri; yapraklar kendini gösterir
+            default_left: NaN değerlerin sola gidip gitmediği
+            value: Yaprak değerleri [düğüm, çıktı]
+            roots: Her ağacın kök düğümü
+            tree_class: Boosting'de her ağacın katkı yaptığı çıktı sütunu
+            output_classes: Çıktı sütunlarının tüm sınıflar içindeki indeksleri
+            base_score: Boosting başlangıç marjı
+            max_depth: En derin ağacın derinliği (değerlendirme adım sayısı)
+            float32_input: Girdi karşılaştırmadan önce float32'ye yuvarlanır mı
+        """
+        self.kind = kind
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.right = right
+        self.default_left = default_left
+        self.value = value
+        self.roots = roots
+        self.tree_class = tree_class
+        self.output_classes = output_classes
+        self.base_score = base_score
+        self.max_depth = max_depth
+        self.float32_input = float32_input
+        # Değerlendirmede kullanılan biçim: intp indeksler (dönüşüm maliyeti olmadan
+        # toplama) ve iç içe çocuk dizisi (düğüm i'nin sol/sağ çocuğu 2i / 2i+1'de)
+        self._feature = feature.astype(np.intp)
+        self._children = np.stack([left, right], axis=1).ravel().astype(np.intp)
+        self._roots = roots.astype(np.intp)
+        if kind == 'softmax':
+            self._leaf_value = np.ascontiguousarray(value[:, 0])
+            self._class_matrix = np.zeros((len(roots), len(output_classes)))
+            self._class_matrix[np.arange(len(roots)), tree_class] = 1.0
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    def apply(self, X: np.ndarray) -> np.ndarray:
+        """Her satırın her ağaçta düştüğü yaprak düğümünü döndürür [satır, ağaç]"""
+        if self.float32_input:
+            X = X.astype(np.float32)
+        X = np.ascontiguousarray(X, dtype=np.float64)
+        n_rows, n_features = X.shape
+        values = X.ravel()
+        has_nan = np.isnan(values).any()
+        # Satır i'nin j. özelliği values[i * n_features + j]'dedir
+        offsets = 0 if n_rows == 1 else np.arange(0, n_rows * n_features, n_features, dtype=np.intp)[:, None]
+        nodes = np.broadcast_to(self._roots, (n_rows, self.n_trees))
+        for depth in range(self.max_depth):
+            x = values[offsets + self._feature[nodes]]
+            go_right = x > self.threshold[nodes]
+            if has_nan:
+                go_right = np.where(np.isnan(x), ~self.default_left[nodes], go_right)
+            nodes = self._children[2 * nodes + go_right]
+        return nodes
+
+    def predict_proba(self, X: np.ndarray, n_classes: int) -> np.ndarray:
+        """Tüm sınıflar için olasılıklar [satır, n_classes]"""
+        proba = np.zeros((len(X), n_classes))
+        block = max(1, _BLOCK_CELLS // self.n_trees)
+        for start in range(0, len(X), block):
+            nodes = self.apply(X[start:start + block])
+            if self.kind == 'average':
+                scores = self.value[nodes].sum(axis=1) / self.n_trees
+            else:
+                margin = self._leaf_value[nodes] @ self._class_matrix + self.base_score
+                margin -= margin.max(axis=1, keepdims=True)
+                scores = np.exp(margin)
+                scores /= scores.sum(axis=1, keepdims=True)
+            proba[start:start + block, self.output_classes] = scores
+        return proba
+
+
+def _pack(kind: str, trees: List[dict], tree_class, output_classes, base_score: float,
+          float32_input: bool) -> CompiledTreeEnsemble:
+    """
+    Ağaç başına yerel indeksli düğüm dizilerini tek bir düz topluluğa birleştirir
+
+    Her ağaç sözlüğü left/right (yapraklarda -1), feature, threshold,
+    default_left ve value [düğüm, çıktı] dizilerini içerir.
+    """
+    offsets = np.cumsum([0] + [len(tree['left']) for tree in trees])
+    parts = {name: [] for name in ('feature', 'threshold', 'left', 'right', 'default_left', 'value')}
+    max_depth = 0
+    for offset, tree in zip(offsets, trees):
+        left = np.asarray(tree['left'], dtype=np.int64)
+        right = np.asarray(tree['right'], dtype=np.int64)
+        is_leaf = left < 0
+        local = np.arange(len(left))
+        parts['left'].append(np.where(is_leaf, local, left) + offset)
+        parts['right'].append(np.where(is_leaf, local, right) + offset)
+        parts['feature'].append(np.where(is_leaf, 0, tree['feature']))
+        parts['threshold'].append(np.where(is_leaf, 0.0, tree['threshold']))
+        parts['default_left'].append(np.asarray(tree['default_left'], dtype=bool))
+        parts['value'].append(np.asarray(tree['value'], dtype=np.float64))
+
+        # Derinlik: kökten başlayarak seviye seviye
+        depth, level = 0, np.array([0])
+        while True:
+            level = level[~is_leaf[level]]
+            if not len(level):
+                break
+            level = np.concatenate([left[level], right[level]])
+            depth += 1
+        max_depth = max(max_depth, depth)
+
+    return CompiledTreeEnsemble(
+        kind=kind,
+        feature=np.concatenate(parts['feature']).astype(np.int32),
+        threshold=np.concatenate(parts['threshold']).astype(np.float64),
+        left=np.concatenate(parts['left']).astype(np.int32),
+        right=np.concatenate(parts['right']).astype(np.int32),
+        default_left=np.concatenate(parts['default_left']),
+        value=np.concatenate(parts['value']),
+        roots=offsets[:-1].astype(np.int32),
+        tree_class=np.asarray(tree_class, dtype=np.int32),
+        output_classes=np.asarray(output_classes, dtype=np.int32),
+        base_score=float(base_score),
+        max_depth=max_depth,
+        float32_input=float32_input
+    )
+
+
+def _compile_sklearn_forest(model) -> CompiledTreeEnsemble:
+    """RandomForestClassifier (ve benzeri sklearn ağaç toplulukları)"""
+    trees = []
+    for estimator in model.estimators_:
+        tree = estimator.tree_
+        value = tree.value[:, 0, :].astype(np.float64)
+        totals = value.sum(axis=1, keepdims=True)
+        trees.append({
+            'left': tree.children_left,
+            'right': tree.children_right,
+            'feature': tree.feature,
+            'threshold': tree.threshold,
+            'default_left': getattr(tree, 'missing_go_to_left', np.zeros(tree.node_count)),
+            'value': np.divide(value, totals, out=np.zeros_like(value), where=totals > 0)
+        })
+    return _pack('average', trees, np.zeros(len(trees)), np.asarray(model.classes_), 0.0,
+                 float32_input=True)
+
+
+def _compile_xgboost(booster, classes) -> CompiledTreeEnsemble:
+    """XGBoost gbtree Booster'ı (multi:softprob)"""
+    model = json.loads(bytes(booster.save_raw('json')))
+    learner = model['learner']
+    gbm = learner['gradient_booster']
+    if gbm['name'] != 'gbtree':
+        raise ValueError(f"Desteklenmeyen XGBoost booster türü: {gbm['name']}")
+    trees_json = gbm['model']['trees']
+    tree_info = gbm['model']['tree_info']
+    best_iteration = booster.attr('best_iteration')
+    if best_iteration is not None:
+        per_iteration = len(trees_json) // booster.num_boosted_rounds()
+        trees_json = trees_json[:(int(best_iteration) + 1) * per_iteration]
+        tree_info = tree_info[:len(trees_json)]
+
+    trees = []
+    for tree in trees_json:
+        if any(tree.get('split_type', [])):
+            raise ValueError("Kategorik XGBoost bölmeleri desteklenmiyor")
+        conditions = np.asarray(tree['split_conditions'], dtype=np.float32)
+        left = np.asarray(tree['left_children'])
+        trees.append({
+            'left': left,
+            'right': tree['right_children'],
+            'feature': tree['split_indices'],
+            # float32'de x < t  <=>  x <= t'den önceki float32 değer
+            'threshold': np.nextafter(conditions, np.float32(-np.inf)).astype(np.float64),
+            'default_left': tree['default_left'],
+            'value': np.where(left < 0, conditions, 0.0).astype(np.float64)[:, None]
+        })
+    base_score = float(learner['learner_model_param']['base_score'])
+    return _pack('softmax', trees, tree_info, classes, base_score, float32_input=True)
+
+
+def _compile_lightgbm(booster, classes) -> CompiledTreeEnsemble:
+    """LightGBM Booster'ı (multiclass)"""
+    model = booster.dump_model()
+    if model.get('average_output'):
+        raise ValueError("LightGBM 'rf' boosting türü desteklenmiyor")
+    per_iteration = model['num_tree_per_iteration']
+
+    trees, tree_class = [], []
+    for i, info in enumerate(model['tree_info']):
+        tree = {'left': [], 'right': [], 'feature': [], 'threshold': [], 'default_left': [], 'value': []}
+
+        def visit(node) -> int:
+            index = len(tree['left'])
+            for name in tree:
+                tree[name].append(None)
+            if 'leaf_value' in node:
+                tree['left'][index] = tree['right'][index] = -1
+                tree['feature'][index], tree['threshold'][index] = 0, 0.0
+                tree['default_left'][index] = False
+                tree['value'][index] = [node['leaf_value']]
+                return index
+            if node['decision_type'] != '<=':
+                raise ValueError("Kategorik LightGBM bölmeleri desteklenmiyor")
+            if node['missing_type'] == 'Zero':
+                raise ValueError("zero_as_missing ile eğitilmiş LightGBM modelleri desteklenmiyor")
+            threshold = float(node['threshold'])
+            tree['feature'][index], tree['threshold'][index] = node['split_feature'], threshold
+            # missing_type 'None': NaN, 0 olarak karşılaştırılır
+            tree['default_left'][index] = (node['default_left'] if node['missing_type'] == 'NaN'
+                                           else 0.0 <= threshold)
+            tree['value'][index] = [0.0]
+            tree['left'][index] = visit(node['left_child'])
+            tree['right'][index] = visit(node['right_child'])
+            return index
+
+        visit(info['tree_structure'])
+        trees.append(tree)
+        tree_class.append(i % per_iteration)
+    return _pack('softmax', trees, tree_class, classes, 0.0, float32_input=False)
+
+
+def compile_estimator(model) -> List[CompiledTreeEnsemble]:
+    """
+    Eğitilmiş bir modeli derlenmiş topluluklara çevirir
+
+    Katman toplulukları (estimators listesi olan modeller) her katman için
+    bir topluluk döndürür; olasılıklar tahminde ortalanır. Desteklenmeyen
+    modellerde ValueError verilir.
+    """
+    if isinstance(getattr(model, 'estimators', None), list):
+        return [compiled for estimator in model.estimators for compiled in compile_estimator(estimator)]
+    if hasattr(model, 'estimators_') and hasattr(model.estimators_[0], 'tree_'):
+        return [_compile_sklearn_forest(model)]
+
+    # XGBClassifier'ın 'booster' özniteliği bir hiperparametredir; önce get_booster denenir
+    if hasattr(model, 'get_booster'):
+        booster = model.get_booster()
+    elif hasattr(model, 'booster_'):
+        booster = model.booster_
+    else:
+        booster = getattr(model, 'booster', None)
+    classes = np.asarray(model.classes_)
+    if hasattr(booster, 'save_raw'):
+        return [_compile_xgboost(booster, classes)]
+    if hasattr(booster, 'dump_model'):
+        return [_compile_lightgbm(booster, classes)]
+    raise ValueError(f"{type(model).__name__} derlenemiyor; yalnızca ağaç toplulukları desteklenir")
+
+
+class CompiledModel:
+    """Ön işleme bilgileriyle birlikte derlenmiş, yalnızca NumPy ile çalışan model"""
+
+    def __init__(self, members: List[CompiledTreeEnsemble], classes: Iterable[str],
+                 feature_names: Iterable[str], model_name: str, scaled: bool = False,
+                 scaler_mean: Optional[np.ndarray] = None, scaler_scale: Optional[np.ndarray] = None,
+                 accuracy: Optional[float] = None):
+        """
+        Args:
+            members: Olasılıkları ortalanan derlenmiş topluluklar
+            classes: Sınıf (spor) adları, label encoder sırasıyla
+            feature_names: Modelin beklediği özellik düzeni
+            model_name: Kaynak modelin adı
+            scaled: Girdi standartlaştırılarak mı verilmeli
+            scaler_mean, scaler_scale: StandardScaler parametreleri
+            accuracy: Kaynak modelin test doğruluğu
+        """
+        self.members = members
+        self.classes_ = np.asarray(list(classes))
+        self.feature_names = list(feature_names)
+        self.model_name = model_name
+        self.scaled = scaled
+        self.scaler_mean = scaler_mean
+        self.scaler_scale = scaler_scale
+        self.accuracy = accuracy
+        self.encoder = FeatureEncoder()
+        if self.encoder.feature_names != self.feature_names:
+            raise ValueError("Derlenmiş modelin özellik düzeni mevcut şemayla uyuşmuyor; modeli yeniden derleyin")
+
+    @classmethod
+    def from_model_data(cls, model_data: dict) -> 'CompiledModel':
+        """save_best_model ile üretilen model sözlüğünden derlenmiş model oluşturur"""
+        scaler = model_data['scaler']
+        scaled = model_data.get('scaled', model_data['model_name'] in ['SVM', 'Neural Network'])
+        return cls(
+            compile_estimator(model_data['model']),
+            model_data['label_encoder'].classes_,
+            model_data['feature_names'],
+            model_data['model_name'],
+            scaled=scaled,
+            scaler_mean=np.asarray(scaler.mean_, dtype=np.float64) if scaled else None,
+            scaler_scale=np.asarray(scaler.scale_, dtype=np.float64) if scaled else None,
+            accuracy=model_data.get('accuracy')
+        )
+
+    def transform(self, X: np.ndarray) -> np.ndarray:
+        """Kodlanmış özellik matrisini modele verilecek hale getirir (gerekirse ölçekler)"""
+        X = np.asarray(X, dtype=np.float64)
+        if self.scaled:
+            X = (X - self.scaler_mean) / self.scaler_scale
+        return X
+
+    def predict_proba(self, X: np.ndarray) -> np.ndarray:
+        """Kodlanmış (ölçeklenmemiş) özellik matrisi için sınıf olasılıkları"""
+        X = self.transform(X)
+        proba = self.members[0].predict_proba(X, len(self.classes_))
+        for member in self.members[1:]:
+            proba += member.predict_proba(X, len(self.classes_))
+        return proba / len(self.members)
+
+    def predict(self, X: np.ndarray) -> np.ndarray:
+        """Kodlanmış özellik matrisi için sınıf adları"""
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
+
+    def predict_proba_records(self, records: Iterable[dict]) -> np.ndarray:
+        """Ham kayıtlar (özellik adı -> değer) için sınıf olasılıkları"""
+        return self.predict_proba(self.encoder.transform_records(records))
+
+    def save(self, path: str):
+        """Derlenmiş modeli sıkıştırılmamış .npz olarak kaydeder"""
+        meta = {
+            'format_version': FORMAT_VERSION,
+            'model_name': self.model_name,
+            'classes': self.classes_.tolist(),
+            'feature_names': self.feature_names,
+            'scaled': self.scaled,
+            'accuracy': None if self.accuracy is None else float(self.accuracy),
+            'members': [{'kind': member.kind, 'base_score': member.base_score,
+                         'max_depth': member.max_depth, 'float32_input': member.float32_input}
+                        for member in self.members]
+        }
+        arrays = {'meta': np.array(json.dumps(meta, ensure_ascii=False))}
+        if self.scaled:
+            arrays.update(scaler_mean=self.scaler_mean, scaler_scale=self.scaler_scale)
+        for i, member in enumerate(self.members):
+            for name in CompiledTreeEnsemble.ARRAYS:
+                arrays[f'{i}.{name}'] = getattr(member, name)
+        with open(path, 'wb') as f:
+            np.savez(f, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> 'CompiledModel':
+        """Kaydedilmiş derlenmiş modeli yükler"""
+        with np.load(path, allow_pickle=False) as data:
+            meta = json.loads(str(data['meta']))
+            if meta['format_version'] != FORMAT_VERSION:
+                raise ValueError(f"Desteklenmeyen derlenmiş model sürümü: {meta['format_version']}")
+            members = [
+                CompiledTreeEnsemble(
+                    kind=info['kind'], base_score=info['base_score'], max_depth=info['max_depth'],
+                    float32_input=info['float32_input'],
+                    **{name: data[f'{i}.{name}'] for name in CompiledTreeEnsemble.ARRAYS})
+                for i, info in enumerate(meta['members'])
+            ]
+            scaler_mean = data['scaler_mean'] if meta['scaled'] else None
+            scaler_scale = data['scaler_scale'] if meta['scaled'] else None
+        return cls(members, meta['classes'], meta['feature_names'], meta['model_name'],
+                   scaled=meta['scaled'], scaler_mean=scaler_mean, scaler_scale=scaler_scale,
+                   accuracy=meta['accuracy'])
+
+
+def compiled_path_for(model_path: str) -> str:
+    """Model dosyasının yanındaki derlenmiş model yolunu döndürür (best_model.pkl -> best_model.npz)"""
+    return os.path.splitext(model_path)[0] + '.npz'
+
+
+def save_compiled_companion(model_data: dict, model_path: str) -> Optional[str]:
+    """
+    Model dosyasının yanına derlenmiş halini yazar
+
+    Model derlenemiyorsa (ör. SVM, Neural Network) eski modelden kalmış
+    derlenmiş dosya silinir; böylece uygulama güncel olmayan bir modeli
+    yüklemez. Yazılan yol ya da None döndürülür.
+    """
+    compiled_path = compiled_path_for(model_path)
+    try:
+        compiled = CompiledModel.from_model_data(model_data)
+    except (ValueError, AttributeError, IndexError):
+        if os.path.exists(compiled_path):
+            os.remove(compiled_path)
+        return None
+    compiled.save(compiled_path)
+    return compiled_path
+
+
+def export_compiled_model(model_path: str = "models/best_model.pkl",
+                          output_path: str = "models/best_model.npz") -> CompiledModel:
+    """Kaydedilmiş model dosyasını derleyip .npz olarak yazar"""
+    import joblib
+
+    compiled = CompiledModel.from_model_data(joblib.load(model_path))
+    compiled.save(output_path)
+    n_trees = sum(member.n_trees for member in compiled.members)
+    print(f"Derlenmiş model kaydedildi: {output_path} ({compiled.model_name}, {n_trees} ağaç)")
+    return compiled
+
+
+# Kullanım örneği
+if __name__ == "__main__":
+    import sys
+    export_compiled_model(*sys.argv[1:3])
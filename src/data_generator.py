@@ -7,7 +7,7 @@ import pandas as pd
 import numpy as np
 from faker import Faker
 import random
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import json
 
 try:
@@ -17,6 +17,9 @@ try:
         GENETIC_FEATURES, EXPERIENCE_FEATURES, PSYCHOLOGICAL_FEATURES,
         ENVIRONMENTAL_FEATURES
     )
+    from sport_scorer import SportCompatibilityScorer
+    from dataset_io import save_dataset
+    from feature_encoding import PREVIOUS_SPORTS, encode_previous_sports
 except ImportError:
     from src.feature_config import (
         ALL_FEATURES, TARGET_SPORTS, FEATURE_GROUPS,
@@ -24,21 +27,65 @@ except ImportError:
         GENETIC_FEATURES, EXPERIENCE_FEATURES, PSYCHOLOGICAL_FEATURES,
         ENVIRONMENTAL_FEATURES
     )
+    from src.sport_scorer import SportCompatibilityScorer
+    from src.dataset_io import save_dataset
+    from src.feature_encoding import PREVIOUS_SPORTS, encode_previous_sports
 
 class SportsDataGenerator:
     """Spor yetenek tahmin sistemi için sentetik veri üretici"""
     
-    def __init__(self, seed: int = 42):
+    def __init__(self, seed: int = 42, rng: Optional[np.random.Generator] = None):
         """
         Veri üretici sınıfını başlatır
         
         Args:
             seed: Rastgele sayı üreteci için seed değeri
+            rng: Vektörel üretimde kullanılacak bağımsız üreteç (verilmezse
+                seed'den oluşturulur)
         """
-        self.fake = Faker('tr_TR')  # Türkçe locale
-        random.seed(seed)
-        np.random.seed(seed)
-        Faker.seed(seed)
+        # Faker yalnızca gerçekten kullanıldığında oluşturulur (bkz. fake)
+        self._fake = None
+        # TARGET_SPORTS kurallarından derlenmiş matris skorlayıcı
+        self.scorer = SportCompatibilityScorer()
+        self.reseed(seed, rng)
+    
+    @property
+    def fake(self) -> Faker:
+        """Türkçe locale'li Faker örneği (ilk erişimde oluşturulur)"""
+        if self._fake is None:
+            self._fake = Faker('tr_TR')  # Türkçe locale
+            Faker.seed(self.seed)
+        return self._fake
+    
+    def reseed(self, seed: int, rng: Optional[np.random.Generator] = None):
+        """
+        Üreticiyi yeniden oluşturmadan yeni bir seed ile başlatır
+        
+        Yeni bir SportsDataGenerator(seed=seed, rng=rng) ile aynı rastgele
+        durumu üretir; locale sağlayıcıları yeniden yüklenmez. Süreç geneli
+        random/np.random durumu burada değil, klasik (kişi kişi) üretim ilk
+        kez kullanıldığında tohumlanır; vektörel üretim yalnızca self.rng'yi
+        kullanır ve global durumu değiştirmez.
+        
+        Args:
+            seed: Rastgele sayı üreteci için seed değeri
+            rng: Vektörel üretimde kullanılacak bağımsız üreteç (verilmezse
+                seed'den oluşturulur)
+        """
+        self.seed = seed
+        self._global_seed_pending = True
+        # Vektörel (sütun bazlı) üretim için bağımsız üreteç
+        self.rng = rng if rng is not None else np.random.default_rng(seed)
+    
+    def _seed_global_state(self):
+        """Klasik üretimin kullandığı global random/np.random (ve Faker) durumunu tohumlar"""
+        if not self._global_seed_pending:
+            return
+        random.seed(self.seed)
+        np.random.seed(self.seed)
+        if self._fake is not None:
+            Faker.seed(self.seed)
+        self._global_seed_pending = False
         
     def _generate_demographic_features(self) -> Dict:
         """Demografik özellikler üretir - Türk insanlarının özelliklerine göre"""
@@ -231,7 +278,8 @@ class SportsDataGenerator:
         
         return {
             'spor_yili': spor_yili,
-            'onceki_sporlar': onceki_sporlar,
+            # 10 bitlik çoklu-sıcak tamsayı olarak saklanır (bkz. feature_encoding)
+            'onceki_sporlar': encode_previous_sports(onceki_sporlar),
             'en_basarili_spor': en_basarili_spor,
             'yaralanma_gecmisi': yaralanma_gecmisi
         }
@@ -288,50 +336,278 @@ class SportsDataGenerator:
     
     def _calculate_sport_compatibility(self, person_data: Dict) -> Dict:
         """Kişinin hangi spora ne kadar uygun olduğunu hesaplar"""
-        compatibilities = {}
+        return self.scorer.score_record(person_data)
+    
+    # ------------------------------------------------------------------
+    # Sütun bazlı (vektörel) üretim
+    # Aşağıdaki metodlar yukarıdaki _generate_* metodlarıyla aynı koşullu
+    # mantığı kullanır, ancak her özelliği tüm batch için tek seferde NumPy
+    # dizileri olarak üretir.
+    # ------------------------------------------------------------------
+    
+    @staticmethod
+    def _take(values: List[str], codes: np.ndarray) -> np.ndarray:
+        """Kategori kodlarını metin değerlerine (object dizisi) çevirir"""
+        return np.asarray(values, dtype=object)[codes]
+    
+    def _choice_codes(self, n: int, p) -> np.ndarray:
+        """Satır bazlı olasılıklara göre kategori kodu seçer
         
-        for sport, sport_info in TARGET_SPORTS.items():
-            score = 0
-            max_score = 0
-            
-            # Anahtar özellikler skoru
-            for feature in sport_info['key_features']:
-                if feature in person_data:
-                    if feature in ['boy', 'kilo']:
-                        # Boy-kilo için normalize et
-                        if feature == 'boy':
-                            normalized = (person_data[feature] - 160) / 30  # 160-190 arası normalize
-                        else:
-                            normalized = (80 - person_data[feature]) / 30  # Düşük kilo avantajlı
-                        score += max(0, min(10, 5 + normalized * 2))
-                    elif feature == 'takım_oyunu_tercihi':
-                        # Takım sporları için bonus
-                        team_sports = ['Futbol', 'Basketbol', 'Voleybol']
-                        if sport in team_sports and person_data[feature] in ['Takım', 'Karma']:
-                            score += 8
-                        elif sport not in team_sports and person_data[feature] in ['Bireysel', 'Karma']:
-                            score += 8
-                        else:
-                            score += 4
-                    else:
-                        score += person_data[feature]
-                    max_score += 10
-            
-            # Vücut tipi uygunluğu
-            if person_data['vucut_tipi'] in sport_info['preferred_body_type']:
-                score += 15
-            else:
-                score += 5
-            max_score += 15
-            
-            # Normalize et (0-100)
-            compatibility = (score / max_score) * 100 if max_score > 0 else 0
-            compatibilities[sport] = round(compatibility, 1)
+        Args:
+            n: Satır sayısı
+            p: (k,) ya da (n, k) boyutunda olasılıklar
+        """
+        cumulative = np.cumsum(np.broadcast_to(p, (n, np.shape(p)[-1])), axis=1)
+        u = self.rng.random(n)[:, None]
+        return np.minimum((u >= cumulative).sum(axis=1), cumulative.shape[1] - 1)
+    
+    def _generate_demographic_columns(self, n: int) -> Dict[str, np.ndarray]:
+        """Demografik özellikleri sütun bazlı üretir"""
+        rng = self.rng
+        yas = rng.integers(12, 51, size=n)
+        erkek = rng.random(n) < 0.5
+        
+        # Türk erkekleri: 173.7 ± 7.5 cm, Türk kadınları: 161.4 ± 6.5 cm
+        z = rng.standard_normal(n)
+        boy = np.where(erkek, 173.7 + 7.5 * z, 161.4 + 6.5 * z)
+        kilo_base = (boy - 100) * np.where(erkek, 0.85, 0.8)
+        
+        # Yaş faktörü
+        kilo_base *= np.select([yas < 18, yas > 35], [0.85, 1.1], 1.0)
         
-        return compatibilities
+        boy = np.clip(boy, 140, 220)
+        kilo = np.clip(kilo_base + rng.uniform(-10, 10, size=n), 40, 150)
+        bmi = kilo / ((boy / 100) ** 2)
+        
+        return {
+            'yas': yas.astype(np.int64),
+            'cinsiyet': np.where(erkek, 'Erkek', 'Kadın').astype(object),
+            'boy': np.round(boy).astype(np.int64),
+            'kilo': np.round(kilo, 1),
+            'bmi': np.round(bmi, 1)
+        }
     
-    def generate_single_person(self) -> Dict:
-        """Tek bir kişi için veri üretir"""
+    def _generate_physical_columns(self, demographics: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Fiziksel özellikleri sütun bazlı üretir"""
+        rng = self.rng
+        bmi = demographics['bmi']
+        n = len(bmi)
+        kadin = demographics['cinsiyet'] == 'Kadın'
+        
+        # BMI grubu: 0 -> bmi < 20, 1 -> bmi < 25, 2 -> diğer
+        grup = np.select([bmi < 20, bmi < 25], [0, 1], 2)
+        
+        # Vücut tipi olasılıkları (Ektomorf, Mezomorf, Endomorf) - BMI grubuna göre
+        vucut_olasilik = np.array([
+            [0.7, 0.3, 0.0],
+            [0.2, 0.6, 0.2],
+            [0.0, 0.4, 0.6]
+        ])
+        vucut_kodu = self._choice_codes(n, vucut_olasilik[grup])
+        
+        kas_aralik = np.array([[15, 25], [20, 35], [25, 40]], dtype=float)[grup]
+        yag_aralik = np.array([[5, 15], [10, 20], [15, 30]], dtype=float)[grup]
+        kas_orani = rng.uniform(kas_aralik[:, 0], kas_aralik[:, 1])
+        yag_orani = rng.uniform(yag_aralik[:, 0], yag_aralik[:, 1])
+        
+        # Cinsiyet faktörü
+        kas_orani *= np.where(kadin, 0.8, 1.0)
+        yag_orani *= np.where(kadin, 1.2, 1.0)
+        
+        # Yaş faktörü
+        yasli = demographics['yas'] > 30
+        kas_orani *= np.where(yasli, 0.95, 1.0)
+        yag_orani *= np.where(yasli, 1.1, 1.0)
+        
+        return {
+            'vucut_tipi': self._take(['Ektomorf', 'Mezomorf', 'Endomorf'], vucut_kodu),
+            'kas_orani': np.round(kas_orani, 1),
+            'yag_orani': np.round(yag_orani, 1),
+            'kemik_yogunlugu': self._take(['Düşük', 'Orta', 'Yüksek'], rng.integers(0, 3, size=n))
+        }
+    
+    def _generate_performance_columns(self, demographics: Dict[str, np.ndarray],
+                                      physical: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Performans özelliklerini sütun bazlı üretir"""
+        rng = self.rng
+        yas = demographics['yas']
+        n = len(yas)
+        kadin = demographics['cinsiyet'] == 'Kadın'
+        vucut_tipi = physical['vucut_tipi']
+        vucut_kodu = np.select([vucut_tipi == 'Ektomorf', vucut_tipi == 'Mezomorf'], [0, 1], 2)
+        
+        # Vücut tipine göre temel yetenekler (Ektomorf, Mezomorf, Endomorf)
+        hiz_base = np.array([7, 6, 4], dtype=float)[vucut_kodu]
+        kuvvet_base = np.array([5, 8, 7], dtype=float)[vucut_kodu]
+        dayaniklilik_base = np.array([8, 6, 5], dtype=float)[vucut_kodu]
+        esneklik_base = np.array([7, 6, 5], dtype=float)[vucut_kodu]
+        
+        # Yaş faktörü
+        multiplier = np.select([yas < 18, yas < 25, yas < 35], [0.8, 1.0, 0.9], 0.75)
+        
+        # Cinsiyet faktörü
+        kuvvet_base *= np.where(kadin, 0.8, 1.0)
+        esneklik_base *= np.where(kadin, 1.2, 1.0)
+        
+        # Kas oranı etkisi
+        kas_multiplier = physical['kas_orani'] / 25
+        
+        features = {
+            'hiz': hiz_base * multiplier + rng.uniform(-1, 1, size=n),
+            'kuvvet': kuvvet_base * multiplier * kas_multiplier + rng.uniform(-1, 1, size=n),
+            'dayaniklilik': dayaniklilik_base * multiplier + rng.uniform(-1, 1, size=n),
+            'esneklik': esneklik_base * multiplier + rng.uniform(-1, 1, size=n),
+            'koordinasyon': rng.uniform(4, 8, size=n) * multiplier,
+            'denge': rng.uniform(4, 8, size=n) * multiplier,
+            'reaksiyon_hizi': rng.uniform(4, 8, size=n) * multiplier
+        }
+        
+        return {k: np.round(np.clip(v, 1, 10), 1) for k, v in features.items()}
+    
+    def _generate_genetic_columns(self, n: int) -> Dict[str, np.ndarray]:
+        """Genetik özellikleri sütun bazlı üretir"""
+        seviyeler = ['Sedanter', 'Aktif', 'Sporcu']
+        var = self.rng.random(n) >= 0.75
+        
+        # Ailevi spor geçmişine göre ebeveyn aktivite olasılıkları
+        anne_olasilik = np.where(var[:, None], [0.4, 0.45, 0.15], [0.65, 0.30, 0.05])
+        baba_olasilik = np.where(var[:, None], [0.25, 0.55, 0.20], [0.50, 0.40, 0.10])
+        
+        return {
+            'ailevi_spor_gecmisi': np.where(var, 'Var', 'Yok').astype(object),
+            'anne_spor_durumu': self._take(seviyeler, self._choice_codes(n, anne_olasilik)),
+            'baba_spor_durumu': self._take(seviyeler, self._choice_codes(n, baba_olasilik)),
+            'dominant_el': np.where(self.rng.random(n) < 0.90, 'Sağ', 'Sol').astype(object)
+        }
+    
+    def _generate_experience_columns(self, demographics: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Deneyim özelliklerini sütun bazlı üretir"""
+        rng = self.rng
+        yas = demographics['yas']
+        n = len(yas)
+        
+        max_spor_yili = np.maximum(0, yas - 10)
+        spor_yili = rng.integers(0, max_spor_yili + 1)
+        num_sports = np.minimum(rng.integers(1, 5, size=n), spor_yili)
+        
+        turkiye_sporlari = ['Futbol', 'Basketbol', 'Voleybol', 'Yüzme',
+                            'Atletizm', 'Tenis', 'Güreş', 'Bisiklet', 'Jimnastik', 'Boks']
+        spor_agirliklari = np.array([0.30, 0.15, 0.12, 0.10, 0.08, 0.07, 0.06, 0.05, 0.04, 0.03])
+        
+        # Ağırlıklı, tekrarsız seçim (Gumbel-top-k): np.random.choice(replace=False, p=...)
+        # ile aynı dağılımı verir
+        keys = np.log(spor_agirliklari) + rng.gumbel(size=(n, len(turkiye_sporlari)))
+        ranked = np.argsort(-keys, axis=1)[:, :4]
+        
+        # Seçilen sporlar 10 bitlik çoklu-sıcak tamsayıda toplanır
+        spor_bitleri = np.array([1 << PREVIOUS_SPORTS.index(spor) for spor in turkiye_sporlari],
+                                dtype=np.int16)
+        onceki_sporlar = np.zeros(n, dtype=np.int16)
+        for j in range(4):
+            onceki_sporlar |= np.where(j < num_sports, spor_bitleri[ranked[:, j]], 0).astype(np.int16)
+        
+        # En başarılı spor seçilen sporlardan biri
+        secilen = ranked[np.arange(n), (rng.random(n) * np.maximum(num_sports, 1)).astype(int)]
+        en_basarili_spor = np.where(
+            spor_yili == 0, 'Hiçbiri',
+            np.asarray(turkiye_sporlari, dtype=object)[secilen]
+        ).astype(object)
+        
+        # Yaralanma riski spor yılı ile artar
+        secenek_sayisi = np.select([spor_yili > 10, spor_yili > 5], [4, 3], 2)
+        yaralanma_kodu = (rng.random(n) * secenek_sayisi).astype(int)
+        yaralanma_kodu[spor_yili == 0] = 0
+        
+        return {
+            'spor_yili': spor_yili.astype(np.int64),
+            # Klasik üretimle aynı tip (dosyada şema tipiyle int16 saklanır)
+            'onceki_sporlar': onceki_sporlar.astype(np.int64),
+            'en_basarili_spor': en_basarili_spor,
+            'yaralanma_gecmisi': self._take(['Yok', 'Hafif', 'Orta', 'Ağır'], yaralanma_kodu)
+        }
+    
+    def _generate_psychological_columns(self, demographics: Dict[str, np.ndarray],
+                                        performance: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Psikolojik özellikleri sütun bazlı üretir"""
+        rng = self.rng
+        yas = demographics['yas']
+        n = len(yas)
+        
+        stres_base = np.minimum(8, 4 + (yas - 12) * 0.1)
+        stres_toleransi = np.clip(stres_base + rng.uniform(-2, 2, size=n), 1, 10)
+        
+        takım_oyunu_tercihi = self._take(['Bireysel', 'Takım', 'Karma'], rng.integers(0, 3, size=n))
+        
+        avg_performance = (performance['hiz'] + performance['kuvvet'] + performance['dayaniklilik']) / 3
+        yarışma_tutkusu = np.clip(avg_performance * 0.8 + rng.uniform(-2, 2, size=n), 1, 10)
+        
+        konsantrasyon = np.clip(rng.uniform(4, 8, size=n), 1, 10)
+        
+        return {
+            'stres_toleransi': np.round(stres_toleransi, 1),
+            'takım_oyunu_tercihi': takım_oyunu_tercihi,
+            'yarışma_tutkusu': np.round(yarışma_tutkusu, 1),
+            'konsantrasyon': np.round(konsantrasyon, 1)
+        }
+    
+    def _generate_environmental_columns(self, n: int) -> Dict[str, np.ndarray]:
+        """Çevresel özellikleri sütun bazlı üretir"""
+        cografi_secenekler = [
+            'Marmara', 'Ege', 'Akdeniz', 'İç Anadolu', 'Karadeniz',
+            'Doğu Anadolu', 'Güneydoğu Anadolu'
+        ]
+        cografi_agirlik = [0.25, 0.15, 0.12, 0.18, 0.12, 0.08, 0.10]
+        ekonomik_secenekler = ['Düşük', 'Orta', 'Yüksek']
+        ekonomik_agirlik = [0.35, 0.50, 0.15]
+        tesis_secenekler = ['Zor', 'Orta', 'Kolay']
+        tesis_agirlik = [0.30, 0.45, 0.25]
+        
+        return {
+            'coğrafi_konum': self._take(cografi_secenekler, self._choice_codes(n, cografi_agirlik)),
+            'ekonomik_durum': self._take(ekonomik_secenekler, self._choice_codes(n, ekonomik_agirlik)),
+            'tesis_erisimi': self._take(tesis_secenekler, self._choice_codes(n, tesis_agirlik))
+        }
+    
+    def generate_dataset_vectorized(self, num_people: int = 100) -> pd.DataFrame:
+        """
+        Veri setini sütun bazlı (vektörel) olarak üretir
+        
+        generate_dataset ile istatistiksel olarak eşdeğer bir veri seti döndürür;
+        her özellik tüm kişiler için tek seferde NumPy dizisi olarak üretilir.
+        
+        Args:
+            num_people: Üretilecek kişi sayısı
+        """
+        demographics = self._generate_demographic_columns(num_people)
+        physical = self._generate_physical_columns(demographics)
+        performance = self._generate_performance_columns(demographics, physical)
+        genetic = self._generate_genetic_columns(num_people)
+        experience = self._generate_experience_columns(demographics)
+        psychological = self._generate_psychological_columns(demographics, performance)
+        environmental = self._generate_environmental_columns(num_people)
+        
+        columns = {
+            **demographics,
+            **physical,
+            **performance,
+            **genetic,
+            **experience,
+            **psychological,
+            **environmental
+        }
+        
+        # Spor uygunluk skorları ve en uygun spor
+        scores = self.scorer.score_matrix(columns)
+        columns['tavsiye_edilen_spor'] = self.scorer.best_sports(scores)
+        for j, column in enumerate(self.scorer.score_columns):
+            columns[column] = scores[:, j]
+        
+        return pd.DataFrame(columns)
+    
+    def _generate_person_features(self) -> Dict:
+        """Tek bir kişinin (etiketsiz) tüm özelliklerini üretir"""
+        self._seed_global_state()
+        
         # Demografik özellikler
         demographics = self._generate_demographic_features()
         
@@ -354,7 +630,7 @@ class SportsDataGenerator:
         environmental = self._generate_environmental_features()
         
         # Tüm özellikleri birleştir
-        person_data = {
+        return {
             **demographics,
             **physical,
             **performance,
@@ -363,6 +639,10 @@ class SportsDataGenerator:
             **psychological,
             **environmental
         }
+    
+    def generate_single_person(self) -> Dict:
+        """Tek bir kişi için veri üretir"""
+        person_data = self._generate_person_features()
         
         # Spor uygunluk skorlarını hesapla
         sport_scores = self._calculate_sport_compatibility(person_data)
@@ -374,24 +654,32 @@ class SportsDataGenerator:
         
         return person_data
     
-    def generate_dataset(self, num_people: int = 100) -> pd.DataFrame:
-        """Belirtilen sayıda kişi için veri seti üretir"""
-        data = []
-        
-        for i in range(num_people):
-            person = self.generate_single_person()
-            # Spor skorlarını ayrı sütunlara çevir
-            sport_scores = person.pop('spor_skorlari')
-            for sport, score in sport_scores.items():
-                person[f'skor_{sport.replace("/", "_").replace(" ", "_").lower()}'] = score
-            
-            data.append(person)
+    def generate_dataset(self, num_people: int = 100, vectorized: bool = False) -> pd.DataFrame:
+        """
+        Belirtilen sayıda kişi için veri seti üretir
+        
+        Args:
+            num_people: Üretilecek kişi sayısı
+            vectorized: True ise sütun bazlı (vektörel) üretim kullanılır
+        """
+        if vectorized:
+            return self.generate_dataset_vectorized(num_people)
+        
+        df = pd.DataFrame([self._generate_person_features() for _ in range(num_people)])
+        if df.empty:
+            return df
+        
+        # Etiketleme tüm batch için tek matris işlemiyle yapılır
+        scores = self.scorer.score_matrix(df)
+        df['tavsiye_edilen_spor'] = self.scorer.best_sports(scores)
+        for j, column in enumerate(self.scorer.score_columns):
+            df[column] = scores[:, j]
         
-        return pd.DataFrame(data)
+        return df
     
     def save_dataset(self, df: pd.DataFrame, filename: str):
-        """Veri setini dosyaya kaydeder"""
-        df.to_csv(filename, index=False, encoding='utf-8')
+        """Veri setini dosyaya kaydeder (.csv, .parquet ya da .arrow uzantısına göre)"""
+        save_dataset(df, filename)
         print(f"Veri seti kaydedildi: {filename}")
         print(f"Veri boyutu: {df.shape}")
         print(f"Özellik sayısı: {len(df.columns)}")
@@ -13,6 +13,11 @@ from plotly.subplots import make_subplots
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from dataset_io import read_dataset
+except ImportError:
+    from src.dataset_io import read_dataset
+
 # Türkçe karakter desteği
 plt.rcParams['font.family'] = 'Arial'
 plt.rcParams['axes.unicode_minus'] = False
@@ -25,7 +30,7 @@ class SportsDataVisualizer:
         Veri görselleştirici sınıfını başlatır
         
         Args:
-            data_path: Veri seti dosya yolu
+            data_path: Veri seti dosya yolu (.csv, .parquet ya da .arrow)
         """
         self.data_path = data_path
         self.data = None
@@ -45,7 +50,12 @@ class SportsDataVisualizer:
     def load_data(self):
         """Veri setini yükler"""
         print("Veri seti yükleniyor...")
-        self.data = pd.read_csv(self.data_path)
+        self.data = read_dataset(self.data_path)
+        
+        # Parquet/Arrow'daki kategorik tiplerde veri setinde geçmeyen
+        # kategoriler grafiklerde boş çubuk olarak görünmesin
+        for column in self.data.select_dtypes(include=['category']).columns:
+            self.data[column] = self.data[column].cat.remove_unused_categories()
         print(f"Veri boyutu: {self.data.shape}")
         return self.data
     
@@ -0,0 +1,219 @@
+"""
+Veri Seti Okuma/Yazma - Spor Yetenek Tahmin Sistemi
+Bu dosya, veri setlerini CSV, Parquet ve Arrow IPC biçimlerinde okur ve yazar.
+Parquet/Arrow çıktılarında sütun tipleri ALL_FEATURES şemasından türetilir:
+kategorik özellikler sözlük kodlu (dictionary-encoded), sayısal özellikler
+dar tiplerle (int8/int16, float32) saklanır.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterator, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    import pyarrow.feather as feather
+except ImportError:  # pyarrow isteğe bağlıdır, yalnızca CSV dışı biçimler için gerekir
+    pa = None
+
+try:
+    from feature_config import ALL_FEATURES, TARGET_SPORTS
+    from sport_scorer import score_column
+    from feature_encoding import MULTI_HOT_FEATURES, previous_sports_to_mask
+except ImportError:
+    from src.feature_config import ALL_FEATURES, TARGET_SPORTS
+    from src.sport_scorer import score_column
+    from src.feature_encoding import MULTI_HOT_FEATURES, previous_sports_to_mask
+
+TARGET_COLUMN = 'tavsiye_edilen_spor'
+
+# Dosya uzantısı -> biçim
+FORMAT_EXTENSIONS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow'
+}
+
+
+def detect_format(path: str) -> str:
+    """Dosya uzantısından veri seti biçimini belirler"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension not in FORMAT_EXTENSIONS:
+        raise ValueError(f"Desteklenmeyen veri seti uzantısı: {extension} "
+                         f"(desteklenenler: {', '.join(FORMAT_EXTENSIONS)})")
+    return FORMAT_EXTENSIONS[extension]
+
+
+def _require_pyarrow(file_format: str):
+    if pa is None:
+        raise ImportError(f"{file_format} biçimi için pyarrow gereklidir: pip install pyarrow")
+
+
+def _integer_dtype(value_range) -> str:
+    """Değer aralığını kapsayan en dar işaretli tamsayı tipini seçer"""
+    low, high = value_range
+    for dtype in ('int8', 'int16', 'int32'):
+        info = np.iinfo(dtype)
+        if info.min <= low and high <= info.max:
+            return dtype
+    return 'int64'
+
+
+def dataset_dtypes() -> Dict[str, object]:
+    """ALL_FEATURES ve TARGET_SPORTS'tan sütun -> pandas dtype eşlemesi üretir"""
+    dtypes = {}
+    for feature, info in ALL_FEATURES.items():
+        if info['type'] == 'categorical':
+            dtypes[feature] = pd.CategoricalDtype(info['values'])
+        elif info['type'] == 'numeric' and info.get('integer'):
+            dtypes[feature] = _integer_dtype(info['range'])
+        elif info['type'] in ('numeric', 'calculated'):
+            dtypes[feature] = 'float32'
+        else:
+            # Çoklu kategorik alanlar 10 bitlik çoklu-sıcak tamsayı olarak saklanır
+            dtypes[feature] = 'int16'
+
+    dtypes[TARGET_COLUMN] = pd.CategoricalDtype(list(TARGET_SPORTS.keys()))
+    for sport in TARGET_SPORTS:
+        dtypes[score_column(sport)] = 'float32'
+    return dtypes
+
+
+def apply_schema(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    DataFrame sütunlarını şemadaki dar tiplere çevirir
+
+    Şemada tanımlı olmayan kategorik değerler sessizce kaybolmasın diye
+    ValueError fırlatılır.
+    """
+    dtypes = dataset_dtypes()
+    converted = {}
+    for column in df.columns:
+        dtype = dtypes.get(column)
+        values = df[column]
+        if dtype is None:
+            converted[column] = values
+        elif isinstance(dtype, pd.CategoricalDtype):
+            categorical = values.astype(dtype)
+            unknown = categorical.isna() & values.notna()
+            if unknown.any():
+                raise ValueError(f"'{column}' sütununda şemada olmayan değerler var: "
+                                 f"{sorted(values[unknown].astype(str).unique())[:5]}")
+            converted[column] = categorical
+        elif column in MULTI_HOT_FEATURES:
+            # Eski CSV'lerdeki liste metinleri de çoklu-sıcak tamsayıya çevrilir
+            converted[column] = previous_sports_to_mask(values)
+        else:
+            converted[column] = values.astype(dtype)
+    return pd.DataFrame(converted)
+
+
+def save_dataset(df: pd.DataFrame, path: str, file_format: Optional[str] = None):
+    """Veri setini uzantıya (ya da file_format'a) göre CSV/Parquet/Arrow olarak kaydeder"""
+    file_format = file_format or detect_format(path)
+    if file_format == 'csv':
+        df.to_csv(path, index=False, encoding='utf-8')
+        return
+
+    _require_pyarrow(file_format)
+    table = pa.Table.from_pandas(apply_schema(df), preserve_index=False)
+    if file_format == 'parquet':
+        pq.write_table(table, path, compression='zstd')
+    else:
+        feather.write_feather(table, path, compression='zstd')
+
+
+def read_dataset(path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Veri setini uzantısına göre okur; Parquet/Arrow'da kategorik tipler korunur"""
+    file_format = detect_format(path)
+    if file_format == 'csv':
+        return pd.read_csv(path, usecols=columns)
+
+    _require_pyarrow(file_format)
+    if file_format == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def iter_dataset(path: str, chunk_rows: int = 100_000,
+                 columns: Optional[List[str]] = None) -> Iterator[pd.DataFrame]:
+    """
+    Veri setini en fazla chunk_rows satırlık parçalar halinde okur
+
+    Dosyanın tamamı belleğe alınmaz: CSV parça parça ayrıştırılır,
+    Parquet/Arrow kayıt batch'leri halinde okunur.
+    """
+    file_format = detect_format(path)
+    if file_format == 'csv':
+        yield from pd.read_csv(path, usecols=columns, chunksize=chunk_rows)
+        return
+
+    _require_pyarrow(file_format)
+    if file_format == 'parquet':
+        batches = pq.ParquetFile(path).iter_batches(batch_size=chunk_rows, columns=columns)
+        for batch in batches:
+            yield batch.to_pandas()
+    else:
+        with pa.memory_map(path, 'r') as source:
+            reader = pa.ipc.open_file(source)
+            for i in range(reader.num_record_batches):
+                table = pa.Table.from_batches([reader.get_batch(i)])
+                if columns is not None:
+                    table = table.select(columns)
+                for offset in range(0, table.num_rows, chunk_rows):
+                    yield table.slice(offset, chunk_rows).to_pandas()
+
+
+class DatasetWriter:
+    """Batch'leri tek bir dosyaya akış halinde yazan yazıcı (CSV/Parquet/Arrow)"""
+
+    def __init__(self, path: str, file_format: Optional[str] = None):
+        """
+        Args:
+            path: Çıktı dosya yolu
+            file_format: 'csv', 'parquet' ya da 'arrow' (verilmezse uzantıdan belirlenir)
+        """
+        self.path = path
+        self.file_format = file_format or detect_format(path)
+        if self.file_format != 'csv':
+            _require_pyarrow(self.file_format)
+        self._handle = None
+        self._writer = None
+        self.rows_written = 0
+
+    def write(self, batch: pd.DataFrame):
+        """Bir batch'i dosyanın sonuna ekler (CSV başlığı yalnızca bir kez yazılır)"""
+        if self.file_format == 'csv':
+            if self._handle is None:
+                self._handle = open(self.path, 'w', encoding='utf-8', newline='')
+            batch.to_csv(self._handle, index=False, header=(self.rows_written == 0))
+        else:
+            table = pa.Table.from_pandas(apply_schema(batch), preserve_index=False)
+            if self._writer is None:
+                if self.file_format == 'parquet':
+                    self._writer = pq.ParquetWriter(self.path, table.schema, compression='zstd')
+                else:
+                    self._handle = pa.OSFile(self.path, 'wb')
+                    self._writer = pa.ipc.new_file(
+                        self._handle, table.schema,
+                        options=pa.ipc.IpcWriteOptions(compression='zstd'))
+            self._writer.write_table(table)
+        self.rows_written += len(batch)
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._handle is not None:
+            self._handle.close()
+            self._handle = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -7,6 +7,7 @@ Bu dosya, makine öğrenmesi modeli için kullanılacak tüm özellikleri tanım
 DEMOGRAPHIC_FEATURES = {
     'yas': {
         'type': 'numeric',
+        'integer': True,
         'range': (12, 50),
         'description': 'Yaş (yıl)',
         'importance': 'high'
@@ -19,6 +20,7 @@ DEMOGRAPHIC_FEATURES = {
     },
     'boy': {
         'type': 'numeric',
+        'integer': True,
         'range': (140, 220),
         'description': 'Boy (cm)',
         'importance': 'high'
@@ -143,6 +145,7 @@ GENETIC_FEATURES = {
 EXPERIENCE_FEATURES = {
     'spor_yili': {
         'type': 'numeric',
+        'integer': True,
         'range': (0, 30),
         'description': 'Toplam spor deneyimi (yıl)',
         'importance': 'high'
@@ -151,6 +154,7 @@ EXPERIENCE_FEATURES = {
         'type': 'multi_categorical',
         'values': ['Futbol', 'Basketbol', 'Voleybol', 'Tenis', 'Yüzme', 
                   'Atletizm', 'Jimnastik', 'Boks', 'Güreş', 'Bisiklet', 'Hiçbiri'],
+        'encoding': 'multi_hot',  # 10 bitlik tamsayı, 0 = Hiçbiri (bkz. feature_encoding)
         'description': 'Daha önce yapılan sporlar',
         'importance': 'medium'
     },
@@ -0,0 +1,319 @@
+"""
+Özellik Kodlama - Spor Yetenek Tahmin Sistemi
+Bu dosya, özelliklerin model girdisine dönüştürülmesinde kullanılan
+kodlayıcıları içerir.
+
+FeatureEncoder, eğitimde ve tahminde aynı sabit sütun düzenini üreten,
+şemadan kurulan tek kodlayıcıdır; model dosyasına birlikte kaydedilir.
+
+onceki_sporlar alanı, 10 sporun her biri için bir bit içeren çoklu-sıcak
+(multi-hot) bir tamsayı olarak saklanır: bit i, PREVIOUS_SPORTS[i]
+sporunun daha önce yapıldığını gösterir; 0 değeri 'Hiçbiri' anlamına gelir.
+"""
+
+import ast
+import re
+import threading
+import numpy as np
+from typing import Iterable, List
+
+try:
+    from feature_config import ALL_FEATURES
+except ImportError:
+    from src.feature_config import ALL_FEATURES
+
+NO_SPORT = 'Hiçbiri'
+
+# Bit sırası feature_config'teki değer sırasını izler
+PREVIOUS_SPORTS = [sport for sport in ALL_FEATURES['onceki_sporlar']['values'] if sport != NO_SPORT]
+_SPORT_BITS = {sport: 1 << i for i, sport in enumerate(PREVIOUS_SPORTS)}
+
+# Çoklu-sıcak olarak saklanan özellikler
+MULTI_HOT_FEATURES = [feature for feature, info in ALL_FEATURES.items()
+                      if info['type'] == 'multi_categorical']
+
+
+def encode_previous_sports(sports: Iterable[str]) -> int:
+    """Spor listesini çoklu-sıcak tamsayıya çevirir (bilinmeyen sporlar yok sayılır)"""
+    mask = 0
+    for sport in sports:
+        mask |= _SPORT_BITS.get(sport, 0)
+    return mask
+
+
+def decode_previous_sports(mask: int) -> List[str]:
+    """Çoklu-sıcak tamsayıyı spor listesine çevirir"""
+    sports = [sport for sport, bit in _SPORT_BITS.items() if int(mask) & bit]
+    return sports or [NO_SPORT]
+
+
+def parse_previous_sports(value) -> int:
+    """
+    onceki_sporlar değerini çoklu-sıcak tamsayıya çevirir
+
+    Tamsayıları, listeleri, eski CSV'lerdeki "['Futbol', 'Basketbol']"
+    biçimli metinleri ve tek bir spor adını kabul eder.
+    """
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, str):
+        value = value.strip()
+        if value.startswith('['):
+            value = ast.literal_eval(value)
+        elif value.isdigit():
+            return int(value)
+        else:
+            value = [value]
+    return encode_previous_sports(value)
+
+
+def previous_sports_to_mask(values) -> np.ndarray:
+    """Bir sütundaki onceki_sporlar değerlerini int16 çoklu-sıcak diziye çevirir"""
+    array = values.to_numpy() if hasattr(values, 'to_numpy') else np.asarray(values, dtype=object)
+    if array.dtype.kind in 'iu':
+        return array.astype(np.int16)
+    # Eski biçim: her benzersiz değer bir kez çözümlenir
+    cache = {}
+
+    def lookup(value):
+        key = str(value)
+        if key not in cache:
+            cache[key] = parse_previous_sports(value)
+        return cache[key]
+
+    return np.fromiter((lookup(value) for value in array), dtype=np.int16, count=len(array))
+
+
+def expand_previous_sports(masks) -> np.ndarray:
+    """Çoklu-sıcak tamsayıları (N, 10) boyutunda 0/1 matrisine açar"""
+    masks = np.asarray(masks, dtype=np.int64)
+    return ((masks[:, None] >> np.arange(len(PREVIOUS_SPORTS))) & 1).astype(np.uint8)
+
+
+def multi_hot_columns(feature: str) -> List[str]:
+    """Çoklu-sıcak bir özelliğin açıldığı sütun adlarını döndürür"""
+    return [f'{feature}_{sport}' for sport in PREVIOUS_SPORTS]
+
+
+def expand_multi_hot_columns(df):
+    """
+    DataFrame'deki çoklu-sıcak sütunları sabit sayıda 0/1 sütununa açar
+
+    Özellik genişliği veri setinin boyutundan ve görülen kombinasyonlardan
+    bağımsızdır.
+    """
+    for feature in MULTI_HOT_FEATURES:
+        if feature not in df.columns:
+            continue
+        expanded = expand_previous_sports(previous_sports_to_mask(df[feature]))
+        position = df.columns.get_loc(feature)
+        df = df.drop(columns=[feature])
+        for i, column in enumerate(multi_hot_columns(feature)):
+            df.insert(position + i, column, expanded[:, i])
+    return df
+
+
+def clean_feature_name(name: str) -> str:
+    """Sütun adını XGBoost/LightGBM'in kabul ettiği biçime getirir"""
+    return re.sub(r'[^\w\s]', '_', name).replace(' ', '_')
+
+
+class FeatureEncoder:
+    """
+    ALL_FEATURES şemasından kurulan, ham kayıtları sabit indeksli NumPy
+    vektörlerine çeviren kodlayıcı
+
+    Sütun düzeni, eğitimde kullanılan pd.get_dummies(drop_first=True)
+    düzeniyle uyumludur: sayısal özellikler şema sırasıyla (çoklu-sıcak
+    alanlar yerinde 0/1 sütunlarına açılarak), ardından her kategorik
+    özelliğin sıralı değerlerinden ilki hariç gösterge sütunları gelir.
+    Kategoriler veriden değil şemadan alındığı için eğitim ve tahminde
+    aynı düzen üretilir.
+    """
+
+    def __init__(self, features: dict = None, drop_first: bool = True):
+        """
+        Args:
+            features: Özellik şeması (varsayılan: ALL_FEATURES)
+            drop_first: Her kategorik özelliğin ilk (sıralı) değeri için sütun üretme
+        """
+        features = ALL_FEATURES if features is None else features
+        self.drop_first = drop_first
+        self.numeric_features = []
+        self.multi_hot_features = []
+        self.categorical_features = []
+        self.feature_names = []
+
+        # Sayısal ve çoklu-sıcak sütunlar şema sırasıyla
+        self._numeric_index = []
+        self._multi_hot_index = []
+        for feature, info in features.items():
+            if info['type'] == 'categorical':
+                self.categorical_features.append(feature)
+            elif info['type'] == 'multi_categorical':
+                self.multi_hot_features.append(feature)
+                self._multi_hot_index.append(len(self.feature_names))
+                self.feature_names.extend(clean_feature_name(c) for c in multi_hot_columns(feature))
+            else:
+                self.numeric_features.append(feature)
+                self._numeric_index.append(len(self.feature_names))
+                self.feature_names.append(clean_feature_name(feature))
+
+        # Kategorik değer -> sütun indeksi (drop_first ile düşen değer -1)
+        self.category_index = {}
+        for feature in self.categorical_features:
+            values = sorted(features[feature]['values'])
+            mapping = {}
+            for i, value in enumerate(values):
+                if drop_first and i == 0:
+                    mapping[value] = -1
+                else:
+                    mapping[value] = len(self.feature_names)
+                    self.feature_names.append(clean_feature_name(f'{feature}_{value}'))
+            self.category_index[feature] = mapping
+
+        self.n_features = len(self.feature_names)
+
+    def _category_columns(self, feature: str, values) -> np.ndarray:
+        """Bir kategorik sütunun her satırı için gösterge sütunu indeksini döndürür"""
+        mapping = self.category_index[feature]
+        categorical = getattr(values, 'cat', None)
+        if categorical is not None:
+            # pandas kategorik tip: kategoriler bir kez eşlenir
+            lookup = np.array([mapping.get(value, -2) for value in categorical.categories] + [-2])
+            columns = lookup[categorical.codes.to_numpy()]
+        else:
+            array = values.to_numpy() if hasattr(values, 'to_numpy') else np.asarray(values, dtype=object)
+            uniques, inverse = np.unique(array.astype(str), return_inverse=True)
+            columns = np.array([mapping.get(value, -2) for value in uniques])[inverse]
+
+        if (columns == -2).any():
+            unknown = sorted({str(value) for value in np.asarray(values, dtype=object)[columns == -2]})
+            raise ValueError(f"'{feature}' özelliğinde şemada olmayan değerler var: {unknown[:5]}")
+        return columns
+
+    def transform(self, data, dtype=np.float64) -> np.ndarray:
+        """
+        Sütun erişimli bir veri kümesini (DataFrame ya da sütun sözlüğü)
+        (N, n_features) boyutunda matrise çevirir
+
+        Şemada olmayan kategorik değerler için ValueError fırlatılır.
+        """
+        missing = [feature for feature in
+                   self.numeric_features + self.multi_hot_features + self.categorical_features
+                   if feature not in data]
+        if missing:
+            raise ValueError(f"Eksik özellikler: {missing}")
+
+        n_rows = len(data[self.numeric_features[0]])
+        matrix = np.zeros((n_rows, self.n_features), dtype=dtype)
+        for feature, column in zip(self.numeric_features, self._numeric_index):
+            matrix[:, column] = np.asarray(data[feature], dtype=dtype)
+        for feature, column in zip(self.multi_hot_features, self._multi_hot_index):
+            expanded = expand_previous_sports(previous_sports_to_mask(data[feature]))
+            matrix[:, column:column + expanded.shape[1]] = expanded
+        rows = np.arange(n_rows)
+        for feature in self.categorical_features:
+            columns = self._category_columns(feature, data[feature])
+            present = columns >= 0
+            matrix[rows[present], columns[present]] = 1
+        return matrix
+
+    def transform_record(self, record: dict, dtype=np.float64) -> np.ndarray:
+        """Tek bir kaydı (özellik -> değer sözlüğü) n_features uzunluğunda vektöre çevirir"""
+        vector = np.zeros(self.n_features, dtype=dtype)
+        for feature, column in zip(self.numeric_features, self._numeric_index):
+            vector[column] = record[feature]
+        for feature, column in zip(self.multi_hot_features, self._multi_hot_index):
+            mask = parse_previous_sports(record[feature])
+            for bit in range(len(PREVIOUS_SPORTS)):
+                vector[column + bit] = (mask >> bit) & 1
+        for feature in self.categorical_features:
+            column = self.category_index[feature].get(record[feature], -2)
+            if column == -2:
+                raise ValueError(f"'{feature}' özelliğinde şemada olmayan değer: {record[feature]}")
+            if column >= 0:
+                vector[column] = 1
+        return vector
+
+    def transform_records(self, records: Iterable[dict], dtype=np.float64) -> np.ndarray:
+        """Kayıt listesini (N, n_features) boyutunda matrise çevirir"""
+        records = list(records)
+        columns = {feature: [record[feature] for record in records]
+                   for feature in self.numeric_features + self.multi_hot_features + self.categorical_features}
+        return self.transform(columns, dtype=dtype)
+
+
+class RecordEncoder:
+    """
+    Yalnızca belirli alanları değişen tek kayıtları önceden ayrılmış bir
+    vektöre yazan kodlayıcı (tek satırlık tahmin için)
+
+    Sabit alanlar kurulumda bir kez kodlanıp şablon vektöre yazılır. Her
+    çağrıda şablon tampona kopyalanır ve yalnızca değişen alanlar bilinen
+    sütun indekslerine yazılır; DataFrame, ara sözlük ya da yeni dizi
+    oluşturulmaz. Tampon iş parçacığına özeldir ve bir sonraki çağrıda
+    üzerine yazılır.
+    """
+
+    def __init__(self, encoder: FeatureEncoder, defaults: dict, fields: Iterable[str],
+                 scaler=None, dtype=np.float64):
+        """
+        Args:
+            encoder: Modelle birlikte kaydedilmiş FeatureEncoder
+            defaults: fields dışındaki tüm özelliklerin sabit değerleri
+            fields: Her çağrıda kayıttan okunacak özellikler
+            scaler: Verilirse (StandardScaler) vektör yerinde standartlaştırılır
+            dtype: Vektör tipi
+        """
+        self.fields = list(fields)
+        self._numeric = []
+        self._multi_hot = []
+        self._categorical = []
+        placeholders = {}
+        for field in self.fields:
+            if field in encoder.category_index:
+                mapping = encoder.category_index[field]
+                block = np.array([column for column in mapping.values() if column >= 0], dtype=np.intp)
+                self._categorical.append((field, block, mapping))
+                placeholders[field] = next(iter(mapping))
+            elif field in encoder.multi_hot_features:
+                start = encoder._multi_hot_index[encoder.multi_hot_features.index(field)]
+                self._multi_hot.append((field, start))
+                placeholders[field] = 0
+            elif field in encoder.numeric_features:
+                self._numeric.append((field, encoder._numeric_index[encoder.numeric_features.index(field)]))
+                placeholders[field] = 0
+            else:
+                raise ValueError(f"Kodlayıcıda olmayan özellik: {field}")
+
+        self.template = encoder.transform_record({**defaults, **placeholders}, dtype=dtype).reshape(1, -1)
+        self._mean = None if scaler is None or scaler.mean_ is None else scaler.mean_.astype(dtype)
+        self._scale = None if scaler is None or scaler.scale_ is None else scaler.scale_.astype(dtype)
+        self._local = threading.local()
+
+    def encode(self, record: dict) -> np.ndarray:
+        """Kaydın fields alanlarını yazıp (1, n_features) boyutundaki tamponu döndürür"""
+        row = getattr(self._local, 'row', None)
+        if row is None:
+            row = self._local.row = np.empty_like(self.template)
+        np.copyto(row, self.template)
+        vector = row[0]
+        for field, column in self._numeric:
+            vector[column] = record[field]
+        for field, start in self._multi_hot:
+            mask = parse_previous_sports(record[field])
+            for bit in range(len(PREVIOUS_SPORTS)):
+                vector[start + bit] = (mask >> bit) & 1
+        for field, block, mapping in self._categorical:
+            column = mapping.get(record[field], -2)
+            if column == -2:
+                raise ValueError(f"'{field}' özelliğinde şemada olmayan değer: {record[field]}")
+            vector[block] = 0
+            if column >= 0:
+                vector[column] = 1
+        if self._mean is not None:
+            np.subtract(row, self._mean, out=row)
+        if self._scale is not None:
+            np.divide(row, self._scale, out=row)
+        return row
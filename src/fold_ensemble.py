@@ -0,0 +1,58 @@
+"""
+Katman Topluluğu - Spor Yetenek Tahmin Sistemi
+Bu dosya, cross-validation katmanlarında eğitilen modelleri tek bir
+sınıflandırıcı olarak kullanan FoldEnsembleClassifier sınıfını içerir.
+"""
+
+import numpy as np
+from typing import List
+from sklearn.base import BaseEstimator, ClassifierMixin
+
+
+def aligned_probabilities(model, X, classes: np.ndarray) -> np.ndarray:
+    """
+    Modelin olasılıklarını tüm sınıfları içeren sabit sütun düzenine yerleştirir
+
+    Bir katmanın eğitim verisinde bulunmayan sınıfların olasılığı 0 olur.
+    """
+    probabilities = model.predict_proba(X)
+    aligned = np.zeros((probabilities.shape[0], len(classes)), dtype=np.float64)
+    aligned[:, np.searchsorted(classes, model.classes_)] = probabilities
+    return aligned
+
+
+class FoldEnsembleClassifier(BaseEstimator, ClassifierMixin):
+    """CV katman modellerinin olasılık ortalamasıyla tahmin yapan topluluk"""
+
+    def __init__(self, estimators: List = None, classes=None):
+        """
+        Args:
+            estimators: Eğitilmiş katman modelleri
+            classes: Tüm sınıf etiketleri (sıralı)
+        """
+        self.estimators = estimators
+        self.classes = classes
+
+    @property
+    def classes_(self) -> np.ndarray:
+        return np.asarray(self.classes)
+
+    @property
+    def feature_importances_(self) -> np.ndarray:
+        """Katman modellerinin özellik önemlerinin ortalaması"""
+        if not all(hasattr(model, 'feature_importances_') for model in self.estimators):
+            raise AttributeError("Katman modellerinin feature_importances_ özelliği yok")
+        return np.mean([model.feature_importances_ for model in self.estimators], axis=0)
+
+    def fit(self, X, y):
+        """Katman modelleri önceden eğitildiği için yalnızca sınıfları kaydeder"""
+        if self.classes is None:
+            self.classes = np.unique(y)
+        return self
+
+    def predict_proba(self, X) -> np.ndarray:
+        return np.mean([aligned_probabilities(model, X, self.classes_)
+                        for model in self.estimators], axis=0)
+
+    def predict(self, X) -> np.ndarray:
+        return self.classes_[np.argmax(self.predict_proba(X), axis=1)]
@@ -0,0 +1,310 @@
+"""
+Hiperparametre Arama - Spor Yetenek Tahmin Sistemi
+Bu dosya, modellerin hiperparametrelerini zaman/CPU bütçesi altında
+ardışık yarılama (successive halving) ve Hyperband ile arar.
+
+Kaynak (resource), boosting modellerinde (XGBoost, LightGBM) boosting tur
+sayısı, diğer modellerde eğitim satırı sayısıdır. Her turda adayların
+yalnızca en iyi 1/eta'sı bir sonraki, eta kat daha büyük kaynağa geçer.
+XGBoost, LightGBM ve Neural Network doğrulama setiyle erken durdurulur.
+
+Bütçe her eğitimden önce denetlenir; boosting modellerinin eğitimi süre
+dolduğunda tur arasında kesilir. Diğer modellerin tek bir eğitimi kesilemez,
+bu nedenle süre, en fazla bir eğitim kadar aşılabilir.
+"""
+
+import math
+import time
+import numpy as np
+import lightgbm as lgb
+import xgboost as xgb
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import ParameterSampler
+from typing import Dict, List, Optional
+
+# Model başına arama uzayı
+SEARCH_SPACES = {
+    'Random Forest': {
+        'n_estimators': [100, 200, 400],
+        'max_depth': [6, 10, 16, None],
+        'min_samples_split': [2, 5, 10],
+        'min_samples_leaf': [1, 2, 4],
+        'max_features': ['sqrt', 0.5]
+    },
+    'XGBoost': {
+        'max_depth': [3, 4, 6, 8],
+        'learning_rate': [0.03, 0.1, 0.3],
+        'subsample': [0.6, 0.8, 1.0],
+        'colsample_bytree': [0.6, 0.8, 1.0],
+        'min_child_weight': [1, 3, 5]
+    },
+    'LightGBM': {
+        'num_leaves': [15, 31, 63],
+        'max_depth': [-1, 6, 10],
+        'learning_rate': [0.03, 0.1, 0.3],
+        'colsample_bytree': [0.6, 0.8, 1.0],
+        'min_child_samples': [10, 20, 40]
+    },
+    'SVM': {
+        'C': [0.1, 1.0, 10.0, 100.0],
+        'gamma': ['scale', 0.01, 0.1]
+    },
+    'Neural Network': {
+        'hidden_layer_sizes': [(50,), (100, 50), (200, 100)],
+        'alpha': [1e-4, 1e-3, 1e-2],
+        'learning_rate_init': [1e-3, 3e-3, 1e-2]
+    }
+}
+
+# Kaynağı boosting tur sayısı olan modeller
+BOOSTING_MODELS = ['XGBoost', 'LightGBM']
+
+# Erken durdurma sabrı (tur)
+EARLY_STOPPING_ROUNDS = 20
+
+# Bütçe verilmediğinde kullanılan duvar saati bütçesi (saniye)
+DEFAULT_TIME_BUDGET = 900.0
+
+# Neural Network adayları erken durdurmayla değerlendirilir; seçilen ayarlara
+# da yazılır ki son eğitim değerlendirilen yapılandırmayla aynı olsun
+MLP_EARLY_STOPPING = {'early_stopping': True, 'validation_fraction': 0.1}
+
+
+class SearchBudget:
+    """Duvar saati ve/veya CPU saniyesi bütçesi"""
+
+    def __init__(self, time_budget: Optional[float] = DEFAULT_TIME_BUDGET,
+                 cpu_budget: Optional[float] = None):
+        """
+        Args:
+            time_budget: En fazla duvar saati süresi (saniye; None: sınırsız)
+            cpu_budget: En fazla toplam CPU süresi (saniye, paralel işçiler dahil)
+        """
+        self.time_budget = time_budget
+        self.cpu_budget = cpu_budget
+        self.started = time.perf_counter()
+        self.cpu_seconds = 0.0
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    @property
+    def deadline(self) -> Optional[float]:
+        """Duvar saati bütçesinin bittiği an (time.time() cinsinden; işçi süreçlerle paylaşılabilir)"""
+        if self.time_budget is None:
+            return None
+        return time.time() + self.time_budget - self.elapsed
+
+    def exhausted(self) -> bool:
+        return ((self.time_budget is not None and self.elapsed >= self.time_budget) or
+                (self.cpu_budget is not None and self.cpu_seconds >= self.cpu_budget))
+
+    def describe(self) -> str:
+        """Bütçenin okunabilir özeti"""
+        limits = []
+        if self.time_budget is not None:
+            limits.append(f"{self.time_budget:.0f} s duvar saati")
+        if self.cpu_budget is not None:
+            limits.append(f"{self.cpu_budget:.0f} CPU saniyesi")
+        return ", ".join(limits) if limits else "sınırsız"
+
+    def split(self, parts: int) -> 'SearchBudget':
+        """Kalan bütçenin 1/parts'ını alan yeni bir bütçe döndürür"""
+        return SearchBudget(
+            None if self.time_budget is None else max(0.0, self.time_budget - self.elapsed) / parts,
+            None if self.cpu_budget is None else max(0.0, self.cpu_budget - self.cpu_seconds) / parts
+        )
+
+
+class _XGBoostDeadline(xgb.callback.TrainingCallback):
+    """Süre dolduğunda XGBoost eğitimini tur sonunda durdurur"""
+
+    def __init__(self, deadline: float):
+        super().__init__()
+        self.deadline = deadline
+        self.stopped = False
+
+    def after_iteration(self, model, epoch, evals_log) -> bool:
+        self.stopped = time.time() >= self.deadline
+        return self.stopped
+
+
+def _lightgbm_deadline(deadline: float, state: dict):
+    """Süre dolduğunda LightGBM eğitimini tur sonunda durduran callback"""
+    def callback(env):
+        if time.time() >= deadline:
+            state['stopped'] = True
+            raise lgb.callback.EarlyStopException(env.iteration, env.evaluation_result_list)
+    return callback
+
+
+def _evaluate_candidate(model_name: str, model, params: dict, resource: int,
+                        X_train, y_train, X_val, y_val, order: np.ndarray,
+                        deadline: Optional[float] = None) -> dict:
+    """
+    Bir adayı verilen kaynakla eğitip doğrulama doğruluğunu döndürür
+
+    deadline (time.time()) verilirse boosting modellerinin eğitimi o anda
+    kesilir; sonuçta 'truncated' True olur.
+    """
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    model = clone(model).set_params(**params)
+    best_iteration = None
+    truncated = False
+
+    if model_name == 'XGBoost':
+        callbacks = [_XGBoostDeadline(deadline)] if deadline is not None else None
+        model.set_params(n_estimators=resource, early_stopping_rounds=EARLY_STOPPING_ROUNDS,
+                         callbacks=callbacks)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], verbose=False)
+        best_iteration = int(model.best_iteration) + 1
+        truncated = bool(callbacks and callbacks[0].stopped)
+    elif model_name == 'LightGBM':
+        state = {'stopped': False}
+        callbacks = [lgb.early_stopping(EARLY_STOPPING_ROUNDS, verbose=False)]
+        if deadline is not None:
+            callbacks.append(_lightgbm_deadline(deadline, state))
+        model.set_params(n_estimators=resource)
+        model.fit(X_train, y_train, eval_set=[(X_val, y_val)], callbacks=callbacks)
+        best_iteration = int(model.best_iteration_ or resource)
+        truncated = state['stopped']
+    else:
+        # Kaynak = eğitim satırı sayısı; alt kümeler iç içedir
+        rows = order[:resource]
+        if model_name == 'Neural Network':
+            model.set_params(**MLP_EARLY_STOPPING)
+        model.fit(X_train[rows], y_train[rows])
+
+    return {
+        'params': params,
+        'resource': resource,
+        'score': accuracy_score(y_val, model.predict(X_val)),
+        'best_iteration': best_iteration,
+        'truncated': truncated,
+        'cpu_seconds': time.process_time() - cpu_start,
+        'wall_seconds': time.perf_counter() - wall_start
+    }
+
+
+class SuccessiveHalvingSearch:
+    """Bir model için bütçeli ardışık yarılama / Hyperband araması"""
+
+    def __init__(self, model_name: str, model, X_train, y_train, X_val, y_val,
+                 search_space: Optional[Dict[str, List]] = None,
+                 method: str = 'halving', eta: int = 3,
+                 min_resource: Optional[int] = None, max_resource: Optional[int] = None,
+                 n_jobs: int = 1, budget: Optional[SearchBudget] = None,
+                 random_state: int = 42):
+        """
+        Args:
+            model_name: Model adı (SEARCH_SPACES anahtarı)
+            model: Temel model; adaylar bunun klonlarıdır
+            X_train, y_train: Arama eğitim verisi
+            X_val, y_val: Doğrulama verisi (erken durdurma ve puanlama)
+            search_space: Parametre -> değer listesi (varsayılan: SEARCH_SPACES)
+            method: 'halving' (tek ardışık yarılama) ya da 'hyperband'
+            eta: Her turda elenme oranı
+            min_resource, max_resource: Kaynak aralığı (tur ya da satır sayısı)
+            n_jobs: Aynı turdaki adayları eşzamanlı değerlendiren iş sayısı
+            budget: Zaman/CPU bütçesi (varsayılan: DEFAULT_TIME_BUDGET saniye)
+            random_state: Aday örnekleme ve alt küme seed değeri
+        """
+        if method not in ('halving', 'hyperband'):
+            raise ValueError(f"Geçersiz arama yöntemi: {method} ('halving' ya da 'hyperband')")
+        self.model_name = model_name
+        self.model = model
+        self.X_train, self.y_train = X_train, y_train
+        self.X_val, self.y_val = X_val, y_val
+        self.search_space = search_space or SEARCH_SPACES[model_name]
+        self.method = method
+        self.eta = eta
+        if model_name in BOOSTING_MODELS:
+            self.max_resource = max_resource or 500
+            self.min_resource = min_resource or 30
+        else:
+            self.max_resource = max_resource or len(y_train)
+            self.min_resource = min_resource or max(100, self.max_resource // eta ** 3)
+        self.n_jobs = effective_n_jobs(n_jobs)
+        self.budget = budget or SearchBudget()
+        self.random_state = random_state
+        self.order = np.random.default_rng(random_state).permutation(len(y_train))
+        self.history = []
+
+    def _evaluate(self, candidates: List[dict], resource: int) -> List[dict]:
+        """
+        Adayları n_jobs'luk gruplar halinde değerlendirir
+
+        Bütçe her eğitimden (paralelde her gruptan) önce denetlenir ve bitince
+        durulur; boosting eğitimleri süre dolduğunda kesilir.
+        """
+        results = []
+        threads = max(1, (effective_n_jobs(-1)) // self.n_jobs)
+        args = (self.X_train, self.y_train, self.X_val, self.y_val, self.order)
+        for start in range(0, len(candidates), self.n_jobs):
+            if self.budget.exhausted():
+                break
+            group = candidates[start:start + self.n_jobs]
+            if self.n_jobs == 1:
+                outputs = [_evaluate_candidate(self.model_name, self.model, group[0], resource, *args,
+                                               deadline=self.budget.deadline)]
+            else:
+                model = clone(self.model)
+                if 'n_jobs' in model.get_params():
+                    model.set_params(n_jobs=threads)
+                deadline = self.budget.deadline
+                with parallel_config(backend='loky', inner_max_num_threads=threads):
+                    outputs = Parallel(n_jobs=self.n_jobs)(
+                        delayed(_evaluate_candidate)(self.model_name, model, params, resource, *args,
+                                                     deadline=deadline)
+                        for params in group)
+            for output in outputs:
+                self.budget.cpu_seconds += output['cpu_seconds']
+            results.extend(outputs)
+        self.history.extend(results)
+        return results
+
+    def _halving(self, n_candidates: int, resource: int, seed: int):
+        """Tek bir ardışık yarılama parantezi (bracket)"""
+        candidates = list(ParameterSampler(self.search_space, n_candidates, random_state=seed))
+        while candidates and not self.budget.exhausted():
+            results = self._evaluate(candidates, resource)
+            print(f"   {self.model_name}: {len(results)}/{len(candidates)} aday, kaynak={resource}, "
+                  f"en iyi={max((r['score'] for r in results), default=float('nan')):.4f}")
+            if len(results) < len(candidates) or len(candidates) == 1 or resource >= self.max_resource:
+                break
+            results.sort(key=lambda r: r['score'], reverse=True)
+            candidates = [r['params'] for r in results[:max(1, len(results) // self.eta)]]
+            resource = min(resource * self.eta, self.max_resource)
+
+    def run(self) -> dict:
+        """Aramayı çalıştırır ve en iyi yapılandırmayı döndürür"""
+        print(f"   {self.model_name}: arama bütçesi {self.budget.describe()}")
+        s_max = max(0, int(math.log(self.max_resource / self.min_resource, self.eta)))
+        if self.method == 'halving':
+            brackets = [s_max]
+        else:
+            brackets = list(range(s_max, -1, -1))
+
+        for i, s in enumerate(brackets):
+            n_candidates = int(math.ceil((s_max + 1) / (s + 1) * self.eta ** s))
+            resource = max(self.min_resource, int(self.max_resource * self.eta ** -s))
+            self._halving(n_candidates, resource, self.random_state + i)
+
+        if self.budget.exhausted():
+            print(f"   ⚠️ {self.model_name}: bütçe doldu ({self.budget.describe()}), arama erken kesildi")
+        if not self.history:
+            return {'best_params': {}, 'best_score': None, 'history': []}
+
+        # En büyük kaynakta değerlendirilen adaylar arasından en iyisi
+        top_resource = max(r['resource'] for r in self.history)
+        best = max((r for r in self.history if r['resource'] == top_resource), key=lambda r: r['score'])
+        best_params = dict(best['params'])
+        if best['best_iteration'] is not None:
+            best_params['n_estimators'] = best['best_iteration']
+        if self.model_name == 'Neural Network':
+            best_params.update(MLP_EARLY_STOPPING)
+        return {'best_params': best_params, 'best_score': best['score'], 'history': self.history}
@@ -0,0 +1,379 @@
+"""
+Artımlı Yeniden Eğitim - Spor Yetenek Tahmin Sistemi
+Bu dosya, save_best_model ile kaydedilmiş bir modeli veri setine eklenen
+yeni satırlarla, tam yeniden eğitim yapmadan günceller.
+
+Güncelleme yöntemleri:
+    - XGBoost / LightGBM: mevcut booster'a yalnızca yeni satırlarla ek
+      boosting turları eklenir
+    - Random Forest: warm_start ile yeni satırlar üzerinde ek ağaçlar
+      eğitilir
+    - Neural Network (ve SGD): yeni satırlar üzerinde birkaç epoch partial_fit
+    - Katman topluluğu (FoldEnsembleClassifier): her katman modeli ayrı ayrı
+      güncellenir
+SVM artımlı eğitimi desteklemez; temel veri seti verilirse tam yeniden
+eğitime düşülür.
+
+Yeni satırların bir kısmı değerlendirme için ayrılır. Temel veri seti
+verildiğinde aynı model (temel + yeni satırlarla) baştan da eğitilir ve
+artımlı modelin doğruluk kayması (drift) ile hız kazancı raporlanır.
+
+Güncelleme kabul denetiminden geçer: artımlı modelin değerlendirme
+doğruluğu tam yeniden eğitimden max_accuracy_drop'tan fazla düşükse tam
+yeniden eğitilen model, önceki modelden fazla düşükse önceki model korunur
+(ve kaydedilmez). Her iki durumda da AccuracyDropWarning verilir.
+"""
+
+import copy
+import json
+import time
+import warnings
+import numpy as np
+import joblib
+from sklearn.base import clone
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import train_test_split
+import xgboost as xgb
+import lightgbm as lgb
+from typing import Dict, Optional, Tuple
+
+try:
+    from dataset_io import read_dataset
+    from fold_ensemble import FoldEnsembleClassifier
+    from model_trainer import PREPROCESSING_CONFIG, SCALED_MODELS
+    from out_of_core_trainer import BoosterClassifier
+    from profiling import StageProfiler
+    from compiled_model import save_compiled_companion
+except ImportError:
+    from src.dataset_io import read_dataset
+    from src.fold_ensemble import FoldEnsembleClassifier
+    from src.model_trainer import PREPROCESSING_CONFIG, SCALED_MODELS
+    from src.out_of_core_trainer import BoosterClassifier
+    from src.profiling import StageProfiler
+    from src.compiled_model import save_compiled_companion
+
+# LightGBM'de tur sayısını belirleyen parametreler; ek tur sayısını ezmemeleri için çıkarılır
+_LGB_ROUND_ALIASES = ('num_iterations', 'num_iteration', 'n_iter', 'num_tree', 'num_trees',
+                      'num_round', 'num_rounds', 'nrounds', 'num_boost_round', 'n_estimators',
+                      'max_iter')
+
+
+class AccuracyDropWarning(UserWarning):
+    """Artımlı güncelleme değerlendirme doğruluğunu tolerans üzerinde düşürdüğünde verilir"""
+
+
+def _warn_accuracy_drop(message: str):
+    print(f"⚠️ {message}")
+    # model_trainer tüm uyarıları susturduğundan bu uyarı ayrıca görünür kılınır
+    with warnings.catch_warnings():
+        warnings.simplefilter('always', AccuracyDropWarning)
+        warnings.warn(message, AccuracyDropWarning, stacklevel=3)
+
+
+def _continue_xgboost(booster: xgb.Booster, params: dict, X, y, rounds: int,
+                      learning_rate_scale: float) -> xgb.Booster:
+    """Booster'a yeni satırlarla, küçültülmüş öğrenme oranıyla rounds kadar ek tur ekler"""
+    config = json.loads(booster.save_config())
+    eta = float(config['learner']['gradient_booster']['tree_train_param']['eta'])
+    params = {**params, 'learning_rate': eta * learning_rate_scale}
+    return xgb.train(params, xgb.DMatrix(X, label=y), num_boost_round=rounds, xgb_model=booster)
+
+
+def _continue_lightgbm(booster: lgb.Booster, X, y, rounds: int,
+                       learning_rate_scale: float) -> lgb.Booster:
+    """Booster'a yeni satırlarla, küçültülmüş öğrenme oranıyla rounds kadar ek tur ekler"""
+    params = {key: value for key, value in booster.params.items() if key not in _LGB_ROUND_ALIASES}
+    params['learning_rate'] = params.get('learning_rate', 0.1) * learning_rate_scale
+    params['verbose'] = -1
+    return lgb.train(params, lgb.Dataset(X, label=y, params=params), num_boost_round=rounds,
+                     init_model=booster, keep_training_booster=True)
+
+
+class IncrementalTrainer:
+    """Kaydedilmiş en iyi modeli yeni satırlarla artımlı olarak güncelleyen sınıf"""
+
+    def __init__(self, model_path: str = "models/best_model.pkl", extra_rounds: int = 20,
+                 extra_trees: int = 20, epochs: int = 5, learning_rate_scale: float = 0.1,
+                 eval_fraction: float = 0.2, random_state: int = 42,
+                 max_accuracy_drop: Optional[float] = 0.01):
+        """
+        Args:
+            model_path: save_best_model ile kaydedilmiş model dosyası
+            extra_rounds: XGBoost/LightGBM için eklenecek boosting turu
+            extra_trees: Random Forest için eklenecek ağaç sayısı
+            epochs: partial_fit ile güncellenen modellerde yeni satırlar üzerinden geçiş sayısı
+            learning_rate_scale: Ek boosting turları ve partial_fit adımları için
+                öğrenme oranı çarpanı. Az sayıda yeni satırla tam öğrenme
+                oranında devam etmek, modeli bu satırlara aşırı uydurur
+                (ör. LightGBM'de 50 turda 10 puandan fazla doğruluk kaybı)
+            eval_fraction: Yeni satırlardan değerlendirmeye ayrılan oran (0: ayrılmaz)
+            random_state: Bölme ve karıştırma seed değeri
+            max_accuracy_drop: Artımlı modelin değerlendirme doğruluğunun tam
+                yeniden eğitime ya da önceki modele göre en fazla düşebileceği
+                miktar (ör. 0.01 = 1 puan); aşılırsa güncelleme reddedilir
+                (None: denetim yok; eval_fraction 0 ise denetim yapılamaz)
+        """
+        self.model_path = model_path
+        self.extra_rounds = extra_rounds
+        self.extra_trees = extra_trees
+        self.epochs = epochs
+        self.learning_rate_scale = learning_rate_scale
+        self.eval_fraction = eval_fraction
+        self.random_state = random_state
+        self.max_accuracy_drop = max_accuracy_drop
+        self.model_data = None
+        self.profiler = StageProfiler()
+        self.report = {}
+
+    def load_model(self):
+        """Kaydedilmiş model ve ön işleme nesnelerini yükler"""
+        with self.profiler.stage('load', source='model'):
+            self.model_data = joblib.load(self.model_path)
+        if 'encoder' not in self.model_data:
+            raise ValueError(f"{self.model_path} FeatureEncoder içermiyor; artımlı güncelleme için "
+                             "modeli güncel sürümle yeniden eğitin")
+        print(f"Model yüklendi: {self.model_data['model_name']} ({self.model_path})")
+
+    @property
+    def scaled(self) -> bool:
+        return self.model_data.get('scaled', self.model_data['model_name'] in SCALED_MODELS)
+
+    def encode(self, data_path: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Veri setini kaydedilmiş kodlayıcı ve ölçekleyiciyle modele hazır hale getirir"""
+        with self.profiler.stage('load', source='dataset'):
+            data = read_dataset(data_path)
+        with self.profiler.stage('encode'):
+            X = self.model_data['encoder'].transform(data)
+            if self.scaled:
+                X = self.model_data['scaler'].transform(X)
+            labels = data[PREPROCESSING_CONFIG['target_column']].astype(str)
+            unknown = sorted(set(labels) - set(self.model_data['label_encoder'].classes_))
+            if unknown:
+                raise ValueError(f"Modelin tanımadığı sporlar: {unknown}; tam yeniden eğitim gerekli")
+            y = self.model_data['label_encoder'].transform(labels)
+        return X, y
+
+    @staticmethod
+    def supports_update(model) -> bool:
+        """Modelin artımlı olarak güncellenip güncellenemeyeceğini döndürür"""
+        if isinstance(model, FoldEnsembleClassifier):
+            return all(IncrementalTrainer.supports_update(estimator) for estimator in model.estimators)
+        return (isinstance(model, (BoosterClassifier, xgb.XGBClassifier, lgb.LGBMClassifier)) or
+                hasattr(model, 'warm_start') and hasattr(model, 'estimators_') or
+                hasattr(model, 'partial_fit'))
+
+    def update_model(self, model, X: np.ndarray, y: np.ndarray):
+        """
+        Modeli yeni satırlarla yerinde günceller
+
+        Returns:
+            (güncellenmiş model, kullanılan yöntem)
+        """
+        n_classes = len(self.model_data['label_encoder'].classes_)
+        if isinstance(model, FoldEnsembleClassifier):
+            methods = {self.update_model(estimator, X, y)[1] for estimator in model.estimators}
+            return model, f"fold_ensemble/{'+'.join(sorted(methods))}"
+
+        if isinstance(model, BoosterClassifier):
+            if isinstance(model.booster, xgb.Booster):
+                params = {'objective': 'multi:softprob', 'num_class': len(model.classes_)}
+                model.booster = _continue_xgboost(model.booster, params, X, y, self.extra_rounds,
+                                                  self.learning_rate_scale)
+            else:
+                model.booster = _continue_lightgbm(model.booster, X, y, self.extra_rounds,
+                                                   self.learning_rate_scale)
+            return model, 'extra_rounds'
+
+        if isinstance(model, xgb.XGBClassifier):
+            params = {key: value for key, value in model.get_xgb_params().items() if value is not None}
+            params['num_class'] = len(model.classes_)
+            model._Booster = _continue_xgboost(model.get_booster(), params, X, y, self.extra_rounds,
+                                               self.learning_rate_scale)
+            model.set_params(n_estimators=model.n_estimators + self.extra_rounds)
+            return model, 'extra_rounds'
+
+        if isinstance(model, lgb.LGBMClassifier):
+            model._Booster = _continue_lightgbm(model.booster_, X, y, self.extra_rounds,
+                                                self.learning_rate_scale)
+            model.set_params(n_estimators=model.n_estimators + self.extra_rounds)
+            return model, 'extra_rounds'
+
+        if hasattr(model, 'warm_start') and hasattr(model, 'estimators_'):
+            # warm_start, classes_'ı yeni etiketlerden yeniden kurar; yeni satırlarda
+            # bulunmayan sınıflar sıfır ağırlıklı satırlarla eklenerek sıralama korunur
+            missing = np.setdiff1d(model.classes_, y)
+            weights = np.ones(len(y))
+            if len(missing):
+                X = np.vstack([X, np.repeat(X[:1], len(missing), axis=0)])
+                y = np.concatenate([y, missing])
+                weights = np.concatenate([weights, np.zeros(len(missing))])
+            model.set_params(warm_start=True, n_estimators=model.n_estimators + self.extra_trees)
+            model.fit(X, y, sample_weight=weights)
+            model.set_params(warm_start=False)
+            return model, 'warm_start'
+
+        if hasattr(model, 'partial_fit'):
+            # MLP'nin kayıtlı optimizer'ı (adam/sgd) aynı adım boyuyla devam eder; adım küçültülür
+            optimizer = getattr(model, '_optimizer', None)
+            if optimizer is not None:
+                learning_rate_init = optimizer.learning_rate_init
+                optimizer.learning_rate_init = learning_rate_init * self.learning_rate_scale
+            rng = np.random.default_rng(self.random_state)
+            for epoch in range(self.epochs):
+                order = rng.permutation(len(y))
+                model.partial_fit(X[order], y[order], classes=np.arange(n_classes))
+            if optimizer is not None:
+                optimizer.learning_rate_init = learning_rate_init
+            return model, 'partial_fit'
+
+        raise ValueError(f"{type(model).__name__} artımlı eğitimi desteklemiyor")
+
+    def _split_new_rows(self, X: np.ndarray, y: np.ndarray):
+        """Yeni satırları güncelleme ve değerlendirme kısımlarına ayırır"""
+        if not self.eval_fraction:
+            return X, y, None, None
+        counts = np.bincount(y)
+        stratify = y if counts[counts > 0].min() >= 2 else None
+        X_update, X_eval, y_update, y_eval = train_test_split(
+            X, y, test_size=self.eval_fraction, random_state=self.random_state, stratify=stratify)
+        return X_update, y_update, X_eval, y_eval
+
+    def run_incremental_update(self, new_data_path: str, base_data_path: Optional[str] = None,
+                               save_path: Optional[str] = None) -> Dict:
+        """
+        Modeli yeni satırlarla günceller, değerlendirir ve kaydeder
+
+        Args:
+            new_data_path: Yalnızca yeni eklenen satırları içeren veri seti
+            base_data_path: Modelin eğitildiği önceki veri seti; verilirse aynı
+                model temel + yeni satırlarla baştan da eğitilip karşılaştırılır
+                (SVM gibi artımlı eğitimi desteklemeyen modellerde bu eğitim
+                kullanılır)
+            save_path: Güncellenmiş modelin kaydedileceği yol (varsayılan: model_path)
+
+        Returns:
+            Güncelleme raporu (yöntem, süreler, doğruluklar, doğruluk kayması ve
+            kabul kararı: 'decision' = 'incremental', 'full_retrain' ya da
+            'kept_previous')
+        """
+        print("Spor Yetenek Tahmin Sistemi - Artımlı Model Güncelleme")
+        print("="*50)
+        if self.model_data is None:
+            self.load_model()
+        model = self.model_data['model']
+        name = self.model_data['model_name']
+
+        X_new, y_new = self.encode(new_data_path)
+        X_update, y_update, X_eval, y_eval = self._split_new_rows(X_new, y_new)
+        print(f"Yeni satır sayısı: {len(y_new)} (güncelleme: {len(y_update)}, "
+              f"değerlendirme: {0 if y_eval is None else len(y_eval)})")
+
+        report = {'model_name': name, 'rows': len(y_update)}
+        previous_model = None
+        if y_eval is not None:
+            report['previous_accuracy'] = accuracy_score(y_eval, model.predict(X_eval))
+            if self.max_accuracy_drop is not None and self.supports_update(model):
+                # Güncelleme modeli yerinde değiştirir; reddedilirse önceki model geri yüklenir
+                previous_model = copy.deepcopy(model)
+
+        # Tam yeniden eğitim için temel model, güncelleme modeli değiştirmeden önce kopyalanır
+        baseline = None
+        if base_data_path and not isinstance(model, BoosterClassifier):
+            baseline = clone(model.estimators[0] if isinstance(model, FoldEnsembleClassifier) else model)
+
+        if self.supports_update(model):
+            start = time.perf_counter()
+            with self.profiler.stage('update', model=name):
+                model, method = self.update_model(model, X_update, y_update)
+            update_seconds = time.perf_counter() - start
+        elif baseline is not None:
+            print(f"{name} artımlı eğitimi desteklemiyor; tam yeniden eğitim yapılacak")
+            model, method = None, 'full_retrain'
+        else:
+            raise ValueError(f"{name} artımlı eğitimi desteklemiyor; base_data_path ile "
+                             "tam yeniden eğitim yapın")
+
+        if baseline is not None:
+            X_base, y_base = self.encode(base_data_path)
+            X_full, y_full = np.vstack([X_base, X_update]), np.concatenate([y_base, y_update])
+            del X_base, y_base
+            print(f"Karşılaştırma için tam yeniden eğitim: {len(y_full)} satır")
+            start = time.perf_counter()
+            with self.profiler.stage('full_retrain', model=name):
+                full_model = baseline.fit(X_full, y_full)
+            report['full_retrain_seconds'] = time.perf_counter() - start
+            if model is None:
+                model, update_seconds = full_model, report['full_retrain_seconds']
+            if y_eval is not None:
+                report['full_retrain_accuracy'] = accuracy_score(y_eval, full_model.predict(X_eval))
+
+        report.update(method=method, update_seconds=update_seconds)
+        if y_eval is not None:
+            with self.profiler.stage('evaluate', model=name):
+                report['incremental_accuracy'] = accuracy_score(y_eval, model.predict(X_eval))
+            if 'full_retrain_accuracy' in report:
+                report['accuracy_drift'] = report['incremental_accuracy'] - report['full_retrain_accuracy']
+        if 'full_retrain_seconds' in report and method != 'full_retrain':
+            report['speedup'] = report['full_retrain_seconds'] / max(update_seconds, 1e-9)
+
+        report['decision'] = 'full_retrain' if method == 'full_retrain' else 'incremental'
+        accuracy = report.get('incremental_accuracy')
+        if self.max_accuracy_drop is not None and method != 'full_retrain' and accuracy is not None:
+            if 'accuracy_drift' in report and report['accuracy_drift'] < -self.max_accuracy_drop:
+                _warn_accuracy_drop(
+                    f"Artımlı {name} doğruluğu tam yeniden eğitimden {-report['accuracy_drift']:.4f} "
+                    f"düşük (tolerans {self.max_accuracy_drop}); tam yeniden eğitilen model kullanılıyor")
+                model, accuracy = full_model, report['full_retrain_accuracy']
+                report['decision'] = 'full_retrain'
+            elif accuracy < report['previous_accuracy'] - self.max_accuracy_drop:
+                _warn_accuracy_drop(
+                    f"Artımlı {name} doğruluğu önceki modelden "
+                    f"{report['previous_accuracy'] - accuracy:.4f} düşük (tolerans "
+                    f"{self.max_accuracy_drop}); önceki model korunuyor")
+                report['decision'] = 'kept_previous'
+
+        self.report = report
+        self.print_report()
+        if report['decision'] == 'kept_previous':
+            self.model_data['model'] = previous_model
+            print("\nGüncelleme reddedildi; model kaydedilmedi")
+            return report
+
+        self.model_data['model'] = model
+        if accuracy is not None:
+            self.model_data['accuracy'] = accuracy
+        self.model_data['incremental_updates'] = self.model_data.get('incremental_updates', []) + [report]
+        save_path = save_path or self.model_path
+        with self.profiler.stage('save', model=name):
+            joblib.dump(self.model_data, save_path)
+            # Derlenmiş hal de güncellenir (derlenemiyorsa eskisi silinir)
+            save_compiled_companion(self.model_data, save_path)
+        print(f"\nGüncellenmiş model kaydedildi: {save_path}")
+        return report
+
+    def print_report(self):
+        """Güncelleme raporunu yazdırır"""
+        report = self.report
+        print(f"\n{report['model_name']} ({report['method']}): {report['rows']} satır, "
+              f"{report['update_seconds']:.2f}s")
+        if 'previous_accuracy' in report:
+            print(f"  Önceki model accuracy: {report['previous_accuracy']:.4f}")
+            print(f"  Artımlı model accuracy: {report['incremental_accuracy']:.4f}")
+        if 'full_retrain_seconds' in report:
+            print(f"  Tam yeniden eğitim: {report['full_retrain_seconds']:.2f}s", end='')
+            if 'full_retrain_accuracy' in report:
+                print(f", accuracy {report['full_retrain_accuracy']:.4f}", end='')
+            print()
+        if 'accuracy_drift' in report:
+            print(f"  Doğruluk kayması (artımlı - tam): {report['accuracy_drift']:+.4f}")
+        if 'speedup' in report:
+            print(f"  Hız kazancı: {report['speedup']:.1f}x")
+        print(f"  Karar: {report['decision']}")
+
+
+# Kullanım örneği
+if __name__ == "__main__":
+    import sys
+    trainer = IncrementalTrainer()
+    trainer.run_incremental_update(sys.argv[1] if len(sys.argv) > 1 else "data/new_rows.csv",
+                                   base_data_path=sys.argv[2] if len(sys.argv) > 2 else None)
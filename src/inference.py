@@ -0,0 +1,295 @@
+"""
+Tahmin - Spor Yetenek Tahmin Sistemi
+Bu dosya, uygulamanın yan bar formundaki alanlardan spor tahmini yapan,
+Streamlit'ten bağımsız tahminciyi içerir.
+
+Formda sorulmayan özellikler DEFAULT_MODEL_INPUTS değerleriyle doldurulur.
+Kaynak sırası uygulamayla aynıdır: model dosyasından eski olmayan derlenmiş
+model (.npz), FeatureEncoder içeren model dosyası (.pkl), model yoksa kural
+tabanlı uyumluluk skorlayıcısı. Birden çok form tek bir vektörel
+predict_proba çağrısıyla tahmin edilir.
+
+Formdaki alanların hepsi tam sayı ya da küçük bir kategori kümesi
+olduğundan aynı girdiler sık tekrarlanır; PredictionCache bu tekrarları
+modele gitmeden yanıtlar.
+"""
+
+import math
+import os
+import threading
+from collections import OrderedDict
+import numpy as np
+from typing import Dict, Hashable, Iterable, List, Optional, Tuple
+
+try:
+    from feature_config import ALL_FEATURES
+    from feature_encoding import RecordEncoder, encode_previous_sports
+    from sport_scorer import SportCompatibilityScorer
+    from compiled_model import CompiledModel, compiled_path_for
+except ImportError:
+    from src.feature_config import ALL_FEATURES
+    from src.feature_encoding import RecordEncoder, encode_previous_sports
+    from src.sport_scorer import SportCompatibilityScorer
+    from src.compiled_model import CompiledModel, compiled_path_for
+
+# Yan bardaki formdan gelen özellikler
+FORM_FIELDS = (
+    'yas', 'cinsiyet', 'boy', 'kilo', 'vucut_tipi', 'kas_orani', 'yag_orani',
+    'hiz', 'kuvvet', 'dayaniklilik', 'esneklik', 'koordinasyon',
+    'spor_yili', 'takım_oyunu_tercihi', 'ailevi_spor_gecmisi'
+)
+
+# Formda sorulmayan özellikler için model girdisinde kullanılan varsayılan değerler
+DEFAULT_MODEL_INPUTS = {
+    'kemik_yogunlugu': 'Orta',
+    'denge': 5,
+    'reaksiyon_hizi': 5,
+    'anne_spor_durumu': 'Aktif',
+    'baba_spor_durumu': 'Aktif',
+    'dominant_el': 'Sağ',
+    'onceki_sporlar': encode_previous_sports(['Futbol']),
+    'en_basarili_spor': 'Futbol',
+    'yaralanma_gecmisi': 'Yok',
+    'stres_toleransi': 5,
+    'yarışma_tutkusu': 5,
+    'konsantrasyon': 5,
+    'coğrafi_konum': 'Marmara',
+    'ekonomik_durum': 'Orta',
+    'tesis_erisimi': 'Orta'
+}
+
+
+def compute_bmi(form: Dict) -> float:
+    """Formdaki boy (cm) ve kilodan vücut kitle indeksini hesaplar"""
+    return form['kilo'] / ((form['boy'] / 100) ** 2)
+
+
+def prepare_model_input(form: Dict) -> Dict:
+    """Form verisini varsayılan değerlerle tam bir model kaydına çevirir"""
+    record = {field: form[field] for field in FORM_FIELDS}
+    record['bmi'] = compute_bmi(form)
+    record.update(DEFAULT_MODEL_INPUTS)
+    return record
+
+
+def form_record_encoder(encoder, scaler=None) -> RecordEncoder:
+    """Form alanlarını ve BMI'ı önceden ayrılmış vektöre yazan kodlayıcıyı kurar"""
+    return RecordEncoder(encoder, DEFAULT_MODEL_INPUTS, list(FORM_FIELDS) + ['bmi'], scaler=scaler)
+
+
+def validate_form(form) -> Dict:
+    """
+    Form verisini şemaya göre denetler
+
+    Eksik alanlar, sayısal olmayan ya da sonlu olmayan (NaN/Infinity)
+    değerler, şemadaki aralığın dışındaki ya da tam sayı olması gerekirken
+    kesirli değerler ve şemada olmayan kategoriler için ValueError fırlatılır.
+    """
+    if not isinstance(form, dict):
+        raise ValueError("Form verisi bir JSON nesnesi olmalı")
+    missing = [field for field in FORM_FIELDS if field not in form]
+    if missing:
+        raise ValueError(f"Eksik alanlar: {missing}")
+    for field in FORM_FIELDS:
+        value, info = form[field], ALL_FEATURES[field]
+        if info['type'] == 'categorical':
+            if value not in info['values']:
+                raise ValueError(f"'{field}' için geçersiz değer: {value} (geçerli: {info['values']})")
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            raise ValueError(f"'{field}' sonlu bir sayı olmalı: {value!r}")
+        low, high = info['range']
+        if not low <= value <= high:
+            raise ValueError(f"'{field}' {low}-{high} aralığında olmalı: {value}")
+        if info.get('integer') and value != int(value):
+            raise ValueError(f"'{field}' tam sayı olmalı: {value}")
+    return form
+
+
+def sample_forms(count: int, seed: int = 42) -> List[Dict]:
+    """Yan bar formunun aralıklarında rastgele form verileri üretir (benchmark ve yük testleri için)"""
+    rng = np.random.default_rng(seed)
+    forms = []
+    for _ in range(count):
+        forms.append({
+            'yas': int(rng.integers(12, 51)),
+            'cinsiyet': str(rng.choice(["Erkek", "Kadın"])),
+            'boy': int(rng.integers(140, 221)),
+            'kilo': int(rng.integers(40, 151)),
+            'vucut_tipi': str(rng.choice(["Ektomorf", "Mezomorf", "Endomorf"])),
+            'kas_orani': int(rng.integers(15, 46)),
+            'yag_orani': int(rng.integers(5, 36)),
+            'hiz': int(rng.integers(1, 11)),
+            'kuvvet': int(rng.integers(1, 11)),
+            'dayaniklilik': int(rng.integers(1, 11)),
+            'esneklik': int(rng.integers(1, 11)),
+            'koordinasyon': int(rng.integers(1, 11)),
+            'spor_yili': int(rng.integers(0, 31)),
+            'takım_oyunu_tercihi': str(rng.choice(["Bireysel", "Takım", "Karma"])),
+            'ailevi_spor_gecmisi': str(rng.choice(["Yok", "Var"]))
+        })
+    return forms
+
+
+class PredictionCache:
+    """
+    Form verisinden tahmin sonucuna boyutu sınırlı LRU önbelleği
+
+    Anahtar, FORM_FIELDS sırasındaki değerlerden oluşan demettir: sözlük
+    sırası ve formdaki fazladan alanlar anahtarı değiştirmez, 25 ile 25.0
+    aynı anahtara düşer. Önbellek bir model sürümüne (ör. dosya yolu ve
+    imzası) bağlanır; bind farklı bir sürümle çağrılırsa tüm kayıtlar silinir.
+    Döndürülen sonuçlar paylaşılır, çağıran tarafından değiştirilmemelidir.
+    """
+
+    def __init__(self, max_entries: int = 4096):
+        """
+        Args:
+            max_entries: Tutulacak en fazla sonuç (dolunca en eski kullanılan silinir)
+        """
+        self.max_entries = max_entries
+        self.version = None
+        self.stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'invalidations': 0}
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(form: Dict) -> Tuple:
+        """Formun kanonik önbellek anahtarı"""
+        return tuple(form[field] for field in FORM_FIELDS)
+
+    def bind(self, version: Hashable):
+        """Önbelleği model sürümüne bağlar; sürüm değiştiyse kayıtları siler"""
+        with self._lock:
+            if version != self.version:
+                if self._entries:
+                    self.stats['invalidations'] += 1
+                self._entries.clear()
+                self.version = version
+
+    def get(self, key: Tuple) -> Optional[Tuple[str, Dict[str, float]]]:
+        """Anahtarın sonucunu döndürür (yoksa None)"""
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.stats['misses'] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats['hits'] += 1
+            return result
+
+    def put(self, key: Tuple, result: Tuple[str, Dict[str, float]]):
+        """Sonucu ekler; önbellek doluysa en eski kullanılan kaydı siler"""
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats['evictions'] += 1
+
+    def clear(self):
+        """Tüm kayıtları siler (sayaçlar korunur)"""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.stats['hits'] + self.stats['misses']
+        return self.stats['hits'] / lookups if lookups else 0.0
+
+
+class SportPredictor:
+    """Form verilerinden toplu (vektörel) spor tahmini yapan sınıf"""
+
+    def __init__(self, model_path: str = "models/best_model.pkl", cache_size: int = 0):
+        """
+        Args:
+            model_path: save_best_model ile kaydedilmiş model dosyası; yanında
+                eski olmayan bir derlenmiş model (.npz) varsa o kullanılır
+            cache_size: Tekrarlanan formlar için LRU önbellek boyutu (0: önbellek yok)
+        """
+        self.model_path = model_path
+        self.cache = PredictionCache(cache_size) if cache_size > 0 else None
+        self.model = None
+        self.sports = None
+        self.record_encoder = None
+        self.scorer = None
+        self.model_name = None
+
+        compiled_path = compiled_path_for(model_path)
+        if os.path.exists(compiled_path) and (not os.path.exists(model_path) or
+                                              os.path.getmtime(compiled_path) >= os.path.getmtime(model_path)):
+            self.source = 'compiled'
+            self.model = CompiledModel.load(compiled_path)
+            self.sports = self.model.classes_
+            self.model_name = self.model.model_name
+            self.record_encoder = form_record_encoder(self.model.encoder)
+        elif os.path.exists(model_path):
+            import joblib
+
+            model_data = joblib.load(model_path)
+            if 'encoder' not in model_data:
+                raise ValueError(f"{model_path} FeatureEncoder içermiyor; modeli güncel sürümle yeniden eğitin")
+            self.source = 'model'
+            self.model = model_data['model']
+            self.sports = model_data['label_encoder'].classes_[self.model.classes_]
+            self.model_name = model_data['model_name']
+            scaled = model_data.get('scaled', self.model_name in ['SVM', 'Neural Network'])
+            self.record_encoder = form_record_encoder(model_data['encoder'],
+                                                      model_data['scaler'] if scaled else None)
+        else:
+            self.source = 'generator'
+            self.scorer = SportCompatibilityScorer()
+            self.sports = np.asarray(self.scorer.sports)
+
+    def encode(self, forms: List[Dict]) -> np.ndarray:
+        """Formları (N, n_features) model girdisine çevirir"""
+        X = np.empty((len(forms), self.record_encoder.template.shape[1]))
+        for i, form in enumerate(forms):
+            X[i] = self.record_encoder.encode({**form, 'bmi': compute_bmi(form)})[0]
+        return X
+
+    def score(self, forms: List[Dict]) -> np.ndarray:
+        """Formlar için (N, spor sayısı) boyutunda 0-100 arası skorlar"""
+        if self.scorer is not None:
+            records = [prepare_model_input(form) for form in forms]
+            return self.scorer.score_matrix({key: [record[key] for record in records] for key in records[0]})
+        return self.model.predict_proba(self.encode(forms)) * 100
+
+    def predict_batch(self, forms: Iterable[Dict]) -> List[Tuple[str, Dict[str, float]]]:
+        """Formların her biri için (en uygun spor, {spor: skor}) döndürür"""
+        forms = list(forms)
+        if not forms:
+            return []
+        if self.cache is None:
+            return self._predict_uncached(forms)
+
+        # Önbellekte olmayan formlar (aynı batch'te tekrarlananlar bir kez)
+        # tek bir toplu çağrıda tahmin edilir
+        keys = [self.cache.key(form) for form in forms]
+        results = [self.cache.get(key) for key in keys]
+        missing = {}
+        for i, result in enumerate(results):
+            if result is None:
+                missing.setdefault(keys[i], []).append(i)
+        if missing:
+            indices = list(missing.values())
+            for positions, result in zip(indices, self._predict_uncached([forms[p[0]] for p in indices])):
+                self.cache.put(keys[positions[0]], result)
+                for i in positions:
+                    results[i] = result
+        return results
+
+    def _predict_uncached(self, forms: List[Dict]) -> List[Tuple[str, Dict[str, float]]]:
+        scores = self.score(forms)
+        best = np.argmax(scores, axis=1)
+        return [(str(self.sports[best[i]]),
+                 {str(sport): float(score) for sport, score in zip(self.sports, row)})
+                for i, row in enumerate(scores)]
+
+    def predict(self, form: Dict) -> Tuple[str, Dict[str, float]]:
+        """Tek bir form için (en uygun spor, {spor: skor}) döndürür"""
+        return self.predict_batch([form])[0]
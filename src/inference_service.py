@@ -0,0 +1,238 @@
+"""
+Tahmin Servisi - Spor Yetenek Tahmin Sistemi
+Bu dosya, SportPredictor'ı yerel bir HTTP servisi olarak sunar.
+
+Uç noktalar:
+    POST /predict  Gövde: yan bar form alanlarını içeren bir JSON nesnesi ya da
+                   nesne listesi. Yanıt: {"tahmin_edilen_spor": ..., "skorlar": {...}}
+                   (liste için yanıt listesi)
+    GET  /health   Model kaynağı, mikro-batch ve tahmin önbelleği istatistikleri
+
+Eşzamanlı istekler MicroBatcher kuyruğunda toplanır: ilk istek geldikten
+sonra en fazla max_wait_ms beklenir ya da max_batch_size satıra ulaşılır ve
+toplanan tüm satırlar tek bir vektörel predict_proba çağrısıyla tahmin edilir.
+Varsayılan bekleme 0'dır: önceki toplu çağrı sürerken kuyrukta biriken
+istekler birleştirilir, tek istemcide gecikme eklenmez. Tek çekirdekte
+ölçülen en iyi ayar budur; çok çekirdekte ve ucuz modellerde birkaç
+milisaniyelik bekleme batch'leri büyütebilir.
+
+--cache-size verilirse tekrarlanan formlar SportPredictor'ın LRU
+önbelleğinden yanıtlanır; yalnızca önbellekte olmayanlar modele gider.
+"""
+
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, List
+
+try:
+    from inference import SportPredictor, validate_form
+except ImportError:
+    from src.inference import SportPredictor, validate_form
+
+# İstek gövdesi için üst sınır (bayt)
+MAX_BODY_BYTES = 1 << 20
+
+
+class MicroBatcher:
+    """Eşzamanlı tahmin isteklerini tek bir toplu çağrıda birleştiren kuyruk"""
+
+    def __init__(self, predict_batch: Callable[[List], List], max_batch_size: int = 64,
+                 max_wait_ms: float = 0.0):
+        """
+        Args:
+            predict_batch: Girdi listesi alıp aynı sırada sonuç listesi döndüren fonksiyon
+            max_batch_size: Bir toplu çağrıdaki en fazla satır (1: birleştirme yok)
+            max_wait_ms: İlk istekten sonra diğer istekler için en fazla bekleme süresi
+                (0: beklenmez, yalnızca kuyrukta hazır bekleyen istekler birleştirilir)
+        """
+        self.predict_batch = predict_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.stats = {'requests': 0, 'batches': 0, 'max_batch_size': 0}
+        self._queue = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name='micro-batcher', daemon=True)
+        self._thread.start()
+
+    def submit(self, item) -> Future:
+        """Bir girdiyi kuyruğa ekler; sonuç Future üzerinden döner"""
+        future = Future()
+        self._queue.put((item, future))
+        return future
+
+    def predict(self, item, timeout: float = None):
+        """Bir girdiyi kuyruğa ekleyip sonucunu bekler"""
+        return self.submit(item).result(timeout)
+
+    def _collect(self, first) -> tuple:
+        """İlk istekten sonra süre dolana ya da batch dolana kadar istek toplar"""
+        batch = [first]
+        deadline = time.perf_counter() + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                # Süre dolmuş olsa da kuyrukta hazır bekleyen istekler alınır
+                request = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if request is None:
+                return batch, True
+            batch.append(request)
+        return batch, False
+
+    def _run(self):
+        stopping = False
+        while not stopping:
+            first = self._queue.get()
+            if first is None:
+                break
+            batch, stopping = self._collect(first)
+            items = [item for item, _ in batch]
+            try:
+                results = self.predict_batch(items)
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+            else:
+                for (_, future), result in zip(batch, results):
+                    future.set_result(result)
+            self.stats['requests'] += len(batch)
+            self.stats['batches'] += 1
+            self.stats['max_batch_size'] = max(self.stats['max_batch_size'], len(batch))
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.stats['requests'] / self.stats['batches'] if self.stats['batches'] else 0.0
+
+    def close(self):
+        """Kuyruktaki istekler bittikten sonra işçi iş parçacığını durdurur"""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class _PredictionHandler(BaseHTTPRequestHandler):
+    server_version = 'SporTahminServisi/1.0'
+    # Kalıcı bağlantılar (keep-alive) desteklenir
+    protocol_version = 'HTTP/1.1'
+    # Başlık ve gövde ayrı yazıldığından Nagle, gecikmeli ACK ile her yanıta ~40 ms ekler
+    disable_nagle_algorithm = True
+
+    def _send_json(self, status: int, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path != '/health':
+            self._send_json(404, {'hata': f"Bilinmeyen yol: {self.path}"})
+            return
+        server = self.server
+        cache = server.predictor.cache
+        self._send_json(200, {
+            'durum': 'ok',
+            'kaynak': server.predictor.source,
+            'model': server.predictor.model_name,
+            'batch': {**server.batcher.stats, 'mean_batch_size': server.batcher.mean_batch_size},
+            'onbellek': ({**cache.stats, 'entries': len(cache), 'hit_rate': cache.hit_rate}
+                         if cache is not None else None)
+        })
+
+    def do_POST(self):
+        if self.path != '/predict':
+            self._send_json(404, {'hata': f"Bilinmeyen yol: {self.path}"})
+            return
+        try:
+            length = int(self.headers.get('Content-Length') or 0)
+            if length < 0:
+                raise ValueError(f"Geçersiz Content-Length: {length}")
+        except ValueError as e:
+            # Gövdenin nerede bittiği bilinmediğinden bağlantı yeniden kullanılamaz
+            self.close_connection = True
+            self._send_json(400, {'hata': str(e)})
+            return
+        if length > MAX_BODY_BYTES:
+            self.close_connection = True
+            self._send_json(413, {'hata': f"İstek gövdesi {MAX_BODY_BYTES} baytı aşıyor"})
+            return
+        try:
+            payload = json.loads(self.rfile.read(length) or b'null')
+            forms = payload if isinstance(payload, list) else [payload]
+            for form in forms:
+                validate_form(form)
+        except ValueError as e:  # json.JSONDecodeError dahil
+            self._send_json(400, {'hata': str(e)})
+            return
+
+        try:
+            futures = [self.server.batcher.submit(form) for form in forms]
+            results = [{'tahmin_edilen_spor': sport, 'skorlar': scores}
+                       for sport, scores in (future.result() for future in futures)]
+        except Exception as e:
+            self._send_json(500, {'hata': f"Tahmin hatası: {e}"})
+            return
+        self._send_json(200, results if isinstance(payload, list) else results[0])
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class InferenceServer(ThreadingHTTPServer):
+    """Her bağlantıyı ayrı iş parçacığında işleyen, mikro-batch'li tahmin sunucusu"""
+
+    daemon_threads = True
+    # Varsayılan dinleme kuyruğu (5), eşzamanlı bağlantı açan istemcilerde bağlantı sıfırlamalarına yol açar
+    request_queue_size = 128
+
+    def __init__(self, address, predictor: SportPredictor, max_batch_size: int = 64,
+                 max_wait_ms: float = 0.0, verbose: bool = False):
+        super().__init__(address, _PredictionHandler)
+        self.predictor = predictor
+        self.batcher = MicroBatcher(predictor.predict_batch, max_batch_size, max_wait_ms)
+        self.verbose = verbose
+
+    def server_close(self):
+        super().server_close()
+        self.batcher.close()
+
+
+def serve(model_path: str = "models/best_model.pkl", host: str = "127.0.0.1", port: int = 8502,
+          max_batch_size: int = 64, max_wait_ms: float = 0.0, cache_size: int = 0,
+          verbose: bool = False):
+    """Servisi başlatır ve durdurulana kadar istekleri işler"""
+    predictor = SportPredictor(model_path, cache_size)
+    server = InferenceServer((host, port), predictor, max_batch_size, max_wait_ms, verbose)
+    print(f"Tahmin servisi: http://{host}:{server.server_address[1]} "
+          f"(kaynak: {predictor.source}, model: {predictor.model_name}, "
+          f"batch: {max_batch_size} satır / {max_wait_ms} ms, önbellek: {cache_size})", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+# Kullanım örneği
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Yerel HTTP tahmin servisi")
+    parser.add_argument('--model', default="models/best_model.pkl", help="Model dosyası")
+    parser.add_argument('--host', default="127.0.0.1", help="Dinlenecek adres")
+    parser.add_argument('--port', type=int, default=8502, help="Dinlenecek port")
+    parser.add_argument('--max-batch-size', type=int, default=64,
+                        help="Bir toplu tahmindeki en fazla satır (1: birleştirme yok)")
+    parser.add_argument('--max-wait-ms', type=float, default=0.0,
+                        help="İlk istekten sonra batch'i doldurmak için en fazla bekleme")
+    parser.add_argument('--cache-size', type=int, default=0,
+                        help="Tekrarlanan formlar için LRU önbellek boyutu (0: önbellek yok)")
+    parser.add_argument('--verbose', action='store_true', help="İstekleri logla")
+    args = parser.parse_args()
+    serve(args.model, args.host, args.port, args.max_batch_size, args.max_wait_ms, args.cache_size,
+          args.verbose)
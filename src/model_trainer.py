@@ -3,33 +3,138 @@ Makine Öğrenmesi Modelleri - Spor Yetenek Tahmin Sistemi
 Bu dosya, farklı ML modellerini eğitir ve karşılaştırır.
 """
 
+import json
+import os
+import time
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split, cross_val_score, GridSearchCV
+from sklearn.base import clone
+from sklearn.model_selection import train_test_split, StratifiedKFold
 from sklearn.preprocessing import StandardScaler, LabelEncoder
 from sklearn.ensemble import RandomForestClassifier
 from sklearn.svm import SVC
 from sklearn.neural_network import MLPClassifier
 from sklearn.metrics import accuracy_score, classification_report, confusion_matrix
+from typing import Optional
 import xgboost as xgb
 import lightgbm as lgb
 import joblib
+from joblib import Parallel, delayed, effective_n_jobs, parallel_config
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from dataset_io import read_dataset
+    from feature_encoding import FeatureEncoder
+    from fold_ensemble import FoldEnsembleClassifier, aligned_probabilities
+    from preprocessing_cache import PreprocessingCache
+    from hyperparameter_search import DEFAULT_TIME_BUDGET, SearchBudget, SuccessiveHalvingSearch
+    from profiling import StageProfiler
+    from compiled_model import save_compiled_companion
+except ImportError:
+    from src.dataset_io import read_dataset
+    from src.feature_encoding import FeatureEncoder
+    from src.fold_ensemble import FoldEnsembleClassifier, aligned_probabilities
+    from src.preprocessing_cache import PreprocessingCache
+    from src.hyperparameter_search import DEFAULT_TIME_BUDGET, SearchBudget, SuccessiveHalvingSearch
+    from src.profiling import StageProfiler
+    from src.compiled_model import save_compiled_companion
+
+# Ön işleme yapılandırması; değişen her alan önbellek anahtarını değiştirir
+PREPROCESSING_CONFIG = {
+    'version': 2,
+    'target_column': 'tavsiye_edilen_spor',
+    'feature_layout': FeatureEncoder().feature_names,
+    'test_size': 0.2,
+    'random_state': 42,
+    'scaler': 'StandardScaler'
+}
+
+# Ön işleme önbelleği için önerilen dizin; çalışma dizininden bağımsız olarak
+# proje kökündedir. Önbellek isteğe bağlıdır (SportsModelTrainer(cache_dir=...))
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                                 '.cache', 'preprocessing')
+
+# Standartlaştırılmış veriyle eğitilen modeller
+SCALED_MODELS = ['SVM', 'Neural Network']
+
+# cross_val_score(cv=5) ile aynı bölmeler: sınıflandırıcılar için karıştırmasız StratifiedKFold
+CV_FOLDS = 5
+
+
+def _take_rows(X, indices):
+    """DataFrame ya da dizi üzerinden satır seçer"""
+    return X.iloc[indices] if hasattr(X, 'iloc') else X[indices]
+
+
+def _with_thread_budget(model, threads: int):
+    """Modelin kendi iş parçacığı sayısını threads ile sınırlar (klonlayarak)"""
+    model = clone(model)
+    if 'n_jobs' in model.get_params():
+        model.set_params(n_jobs=threads)
+    return model
+
+
+def _run_training_job(job: dict):
+    """
+    Tek bir eğitim işini çalıştırır: test bölmesi için tam eğitim ('fit')
+    ya da tek bir cross-validation katmanı ('cv')
+    
+    'cv' işleri katmanın dışarıda kalan (out-of-fold) satırları için tahmin
+    ve olasılıkları döndürür; model yalnızca keep_model verilmişse geri gönderilir.
+    İşin aşama kayıtları (fit/predict ya da cv) dördüncü değer olarak döner;
+    böylece paralel işçilerde alınan ölçümler de ana sürece taşınır.
+    """
+    model = job['model']
+    profiler = StageProfiler()
+    if job['kind'] == 'fit':
+        with profiler.stage('fit', model=job['name']):
+            model.fit(job['X_train'], job['y_train'])
+        if 'n_jobs' in job:
+            # Kaydedilen model, tahmin sırasında varsayılan iş parçacığı ayarını kullansın
+            model.set_params(n_jobs=job['n_jobs'])
+        with profiler.stage('predict', model=job['name']):
+            y_pred = model.predict(job['X_test'])
+            y_pred_proba = aligned_probabilities(model, job['X_test'], job['classes'])
+    else:
+        X, y = job['X'], job['y']
+        with profiler.stage('cv', model=job['name'], fold=job['fold']):
+            model.fit(_take_rows(X, job['train_index']), y[job['train_index']])
+            if 'n_jobs' in job:
+                model.set_params(n_jobs=job['n_jobs'])
+            X_eval = _take_rows(X, job['test_index'])
+            y_pred = model.predict(X_eval)
+            y_pred_proba = aligned_probabilities(model, X_eval, job['classes'])
+        if not job.get('keep_model'):
+            model = None
+    return model, y_pred, y_pred_proba, profiler.records
+
+
 class SportsModelTrainer:
     """Spor yetenek tahmin modelleri eğitici sınıfı"""
     
-    def __init__(self, data_path: str = "data/sporcu_dataset_500.csv"):
+    def __init__(self, data_path: str = "data/sporcu_dataset_500.csv",
+                 cache_dir: Optional[str] = None,
+                 compact: bool = False):
         """
         Model eğitici sınıfını başlatır
         
         Args:
-            data_path: Veri seti dosya yolu
+            data_path: Veri seti dosya yolu (.csv, .parquet ya da .arrow)
+            cache_dir: Ön işlenmiş matrislerin önbellek dizini (None: önbellek kapalı;
+                önerilen dizin DEFAULT_CACHE_DIR)
+            compact: True ise veri yüklemeden eğitime kadar tek bir float32
+                kopyada tutulur: ham veri ve tam özellik matrisi saklanmaz,
+                standartlaştırma yerinde yapılır ve tüm modeller ölçeklenmiş
+                veriyle eğitilir (ağaç modelleri ölçeklemeden etkilenmez)
         """
         self.data_path = data_path
+        self.cache_dir = cache_dir
+        self.compact = compact
         self.data = None
         self.X = None
+        self.feature_names = None
+        self.encoder = FeatureEncoder()
         self.y = None
         self.X_train = None
         self.X_test = None
@@ -39,53 +144,121 @@ class SportsModelTrainer:
         self.label_encoder = LabelEncoder()
         self.models = {}
         self.results = {}
+        self.best_params = {}
+        self.tuning_results = {}
+        self.profiler = StageProfiler()
         
     def load_and_preprocess_data(self):
-        """Veri setini yükler ve ön işlemden geçirir"""
+        """
+        Veri setini yükler ve ön işlemden geçirir
+        
+        cache_dir tanımlıysa kodlanmış, bölünmüş ve ölçeklenmiş matrisler veri
+        seti içeriği + PREPROCESSING_CONFIG anahtarıyla önbelleğe yazılır.
+        Önbellekten yüklemede matrisler bellek eşlemeli okunur. Önbellekten
+        yüklemede ve compact modda self.data ve self.X None kalır.
+        Aşamalar (load, encode, split, scale, cache_save) self.profiler'a kaydedilir.
+        """
+        cache = PreprocessingCache(self.cache_dir) if self.cache_dir else None
+        if cache is not None:
+            with self.profiler.stage('load', source='cache'):
+                start = time.perf_counter()
+                cache_key = cache.key(self.data_path, {**PREPROCESSING_CONFIG, 'compact': self.compact})
+                cached = cache.load(cache_key)
+                if cached is not None:
+                    self._load_preprocessed(*cached)
+            if cached is not None:
+                print(f"Ön işlenmiş veri önbellekten yüklendi ({cache_key[:12]}, "
+                      f"{(time.perf_counter() - start) * 1000:.1f} ms)")
+                self._print_data_summary()
+                return
+        
         print("Veri seti yükleniyor...")
-        self.data = pd.read_csv(self.data_path)
+        with self.profiler.stage('load', source='dataset'):
+            self.data = read_dataset(self.data_path)
         print(f"Veri boyutu: {self.data.shape}")
         
-        # Hedef değişken (tavsiye_edilen_spor) ve özellikler
-        target_column = 'tavsiye_edilen_spor'
-        feature_columns = [col for col in self.data.columns 
-                          if col != target_column and not col.startswith('skor_')]
-        
         # Eksik değer kontrolü
         print(f"Eksik değer sayısı: {self.data.isnull().sum().sum()}")
         
-        # Kategorik değişkenleri sayısal hale getir
-        X = self.data[feature_columns].copy()
-        
-        # Kategorik sütunları belirle
-        categorical_columns = X.select_dtypes(include=['object']).columns
-        print(f"Kategorik sütunlar: {list(categorical_columns)}")
-        
-        # One-hot encoding
-        X_encoded = pd.get_dummies(X, columns=categorical_columns, drop_first=True)
-        
-        # Sütun isimlerini temizle (XGBoost ve LightGBM için)
-        import re
-        X_encoded.columns = [re.sub(r'[^\w\s]', '_', col).replace(' ', '_') 
-                           for col in X_encoded.columns]
-        
-        # Özellik matrisi ve hedef değişken
-        self.X = X_encoded
-        self.y = self.label_encoder.fit_transform(self.data[target_column])
-        
-        print(f"Özellik sayısı: {self.X.shape[1]}")
-        print(f"Sınıf sayısı: {len(np.unique(self.y))}")
-        print(f"Sınıf dağılımı: {dict(zip(self.label_encoder.classes_, np.bincount(self.y)))}")
+        # Şemadan kurulan kodlayıcı: sabit sütun düzeni, tahminde de aynısı kullanılır
+        print(f"Kategorik sütunlar: {self.encoder.categorical_features}")
+        with self.profiler.stage('encode'):
+            X_encoded = self.encoder.transform(self.data, dtype=np.float32 if self.compact else np.float64)
+            
+            # Özellik matrisi ve hedef değişken
+            target_column = PREPROCESSING_CONFIG['target_column']
+            self.feature_names = list(self.encoder.feature_names)
+            self.y = self.label_encoder.fit_transform(self.data[target_column].astype(str))
+            if self.compact:
+                # Ham veri ve tam matris kopyası tutulmaz
+                self.data = None
+            else:
+                self.X = pd.DataFrame(X_encoded, columns=self.feature_names, copy=False)
         
         # Veriyi eğitim ve test setlerine ayır
-        self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(
-            self.X, self.y, test_size=0.2, random_state=42, stratify=self.y
-        )
+        with self.profiler.stage('split'):
+            self.X_train, self.X_test, self.y_train, self.y_test = train_test_split(
+                X_encoded, self.y,
+                test_size=PREPROCESSING_CONFIG['test_size'],
+                random_state=PREPROCESSING_CONFIG['random_state'],
+                stratify=self.y
+            )
+            
+            del X_encoded
         
         # Standartlaştırma
-        self.X_train_scaled = self.scaler.fit_transform(self.X_train)
-        self.X_test_scaled = self.scaler.transform(self.X_test)
-        
+        with self.profiler.stage('scale'):
+            if self.compact:
+                # Yerinde: ölçeklenmiş ve ölçeklenmemiş matris aynı nesnedir
+                self.scaler.fit(self.X_train)
+                self.scaler.transform(self.X_train, copy=False)
+                self.scaler.transform(self.X_test, copy=False)
+                self.X_train_scaled, self.X_test_scaled = self.X_train, self.X_test
+            else:
+                self.X_train_scaled = self.scaler.fit_transform(self.X_train)
+                self.X_test_scaled = self.scaler.transform(self.X_test)
+        
+        if cache is not None:
+            arrays = {
+                'X_train': self.X_train,
+                'X_test': self.X_test,
+                'y': self.y,
+                'y_train': self.y_train,
+                'y_test': self.y_test
+            }
+            if not self.compact:
+                arrays.update(X_train_scaled=self.X_train_scaled, X_test_scaled=self.X_test_scaled)
+            with self.profiler.stage('cache_save'):
+                cache.save(cache_key, arrays, {
+                    'feature_names': self.feature_names,
+                    'scaler': self.scaler,
+                    'label_encoder': self.label_encoder,
+                    'data_path': self.data_path
+                })
+                # Sonraki çalışmalarla aynı (mmap) matrislerle eğitilsin
+                self._load_preprocessed(*cache.load(cache_key))
+            print(f"Ön işlenmiş veri önbelleğe yazıldı ({cache_key[:12]})")
+        
+        self._print_data_summary()
+        
+    def _load_preprocessed(self, arrays: dict, metadata: dict):
+        """Önbellekteki matrisleri ve ön işleme nesnelerini yükler"""
+        self.feature_names = metadata['feature_names']
+        self.scaler = metadata['scaler']
+        self.label_encoder = metadata['label_encoder']
+        self.X_train = arrays['X_train']
+        self.X_test = arrays['X_test']
+        # Compact modda kaydedilen matrisler zaten ölçeklenmiştir
+        self.X_train_scaled = arrays.get('X_train_scaled', self.X_train)
+        self.X_test_scaled = arrays.get('X_test_scaled', self.X_test)
+        self.y = arrays['y']
+        self.y_train = arrays['y_train']
+        self.y_test = arrays['y_test']
+        
+    def _print_data_summary(self):
+        print(f"Özellik sayısı: {len(self.feature_names)}")
+        print(f"Sınıf sayısı: {len(np.unique(self.y))}")
+        print(f"Sınıf dağılımı: {dict(zip(self.label_encoder.classes_, np.bincount(self.y)))}")
         print(f"Eğitim seti boyutu: {self.X_train.shape}")
         print(f"Test seti boyutu: {self.X_test.shape}")
         
@@ -136,57 +309,240 @@ class SportsModelTrainer:
             )
         }
         
+        # Hiperparametre aramasında bulunan ayarlar
+        for name, params in self.best_params.items():
+            if name in self.models:
+                self.models[name].set_params(**params)
+                print(f"  {name}: ayarlanmış parametreler uygulandı {params}")
+        
         print(f"Toplam {len(self.models)} model başlatıldı")
         
-    def train_and_evaluate_models(self):
-        """Tüm modelleri eğitir ve değerlendirir"""
-        print("\nModel eğitimi başlıyor...")
+    def tune_hyperparameters(self, model_names=None, time_budget: float = DEFAULT_TIME_BUDGET,
+                             cpu_budget: float = None, method: str = 'halving',
+                             eta: int = 3, n_jobs: int = 1, params_path: str = None):
+        """
+        Modellerin hiperparametrelerini bütçe altında ardışık yarılama ile arar
+        
+        Arama, eğitim setinden ayrılan tabakalı bir doğrulama setiyle yapılır
+        (test seti kullanılmaz). Bulunan ayarlar self.best_params'a yazılır ve
+        modeller bu ayarlarla yeniden başlatılır.
+        
+        Args:
+            model_names: Aranacak modeller (varsayılan: tümü)
+            time_budget: Toplam duvar saati bütçesi (saniye; None: sınırsız); modellere
+                eşit bölünür
+            cpu_budget: Toplam CPU saniyesi bütçesi; modellere eşit bölünür
+            method: 'halving' ya da 'hyperband'
+            eta: Her turda elenme oranı
+            n_jobs: Aynı turdaki adayları eşzamanlı değerlendiren iş sayısı
+            params_path: Verilirse bulunan ayarlar bu JSON dosyasına kaydedilir
+        """
+        if not self.models:
+            self.initialize_models()
+        model_names = list(model_names or self.models)
+        print(f"\nHiperparametre araması başlıyor ({method}, eta={eta})...")
+        budget = SearchBudget(time_budget, cpu_budget)
+        print(f"Arama bütçesi: {budget.describe()} (modellere eşit bölünür; "
+              f"time_budget=None ile sınırsız)")
+        
+        train_index, val_index = train_test_split(
+            np.arange(len(self.y_train)),
+            test_size=PREPROCESSING_CONFIG['test_size'],
+            random_state=PREPROCESSING_CONFIG['random_state'],
+            stratify=self.y_train
+        )
+        for i, name in enumerate(model_names):
+            X = self.X_train_scaled if name in SCALED_MODELS else self.X_train
+            search = SuccessiveHalvingSearch(
+                name, self.models[name],
+                X[train_index], self.y_train[train_index],
+                X[val_index], self.y_train[val_index],
+                method=method, eta=eta, n_jobs=n_jobs,
+                budget=budget.split(len(model_names) - i),
+                random_state=PREPROCESSING_CONFIG['random_state']
+            )
+            with self.profiler.stage('tune', model=name):
+                result = search.run()
+            budget.cpu_seconds += search.budget.cpu_seconds
+            self.tuning_results[name] = result
+            if result['best_params']:
+                self.best_params[name] = result['best_params']
+                print(f"  {name}: doğrulama accuracy {result['best_score']:.4f}, "
+                      f"{len(result['history'])} değerlendirme, {result['best_params']}")
+            else:
+                print(f"  {name}: bütçe yetersiz, varsayılan parametreler korunuyor")
+        
+        print(f"Arama tamamlandı: {budget.elapsed:.1f}s, {budget.cpu_seconds:.1f} CPU saniyesi")
+        if params_path:
+            self.save_best_params(params_path)
+        self.initialize_models()
         
+    def save_best_params(self, path: str = "models/best_params.json"):
+        """Bulunan hiperparametreleri JSON olarak kaydeder"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.best_params, f, ensure_ascii=False, indent=2)
+        
+    def load_best_params(self, path: str = "models/best_params.json"):
+        """Kaydedilmiş hiperparametreleri yükler (sonraki initialize_models'ta uygulanır)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            params = json.load(f)
+        # JSON listeleri, sklearn'in beklediği demetlere (ör. hidden_layer_sizes) çevrilir
+        self.best_params = {name: {key: tuple(value) if isinstance(value, list) else value
+                                   for key, value in model_params.items()}
+                            for name, model_params in params.items()}
+        
+    def _build_training_jobs(self, threads_per_job=None, fold_ensemble: bool = True) -> list:
+        """
+        Her model için CV_FOLDS adet cross-validation işi üretir
+        
+        fold_ensemble=True ise katman modelleri topluluk için saklanır; False
+        ise ayrıca eğitim setinin tamamıyla bir tam eğitim işi de üretilir.
+        threads_per_job verildiğinde her iş kendi model kopyasını alır ve
+        modelin n_jobs parametresi bu değerle sınırlanır.
+        """
+        folds = list(StratifiedKFold(n_splits=CV_FOLDS).split(self.X_train, self.y_train))
+        classes = np.arange(len(self.label_encoder.classes_))
+        jobs = []
         for name, model in self.models.items():
-            print(f"\n{name} modeli eğitiliyor...")
+            if name in SCALED_MODELS:
+                X_train, X_test = self.X_train_scaled, self.X_test_scaled
+            else:
+                X_train, X_test = self.X_train, self.X_test
             
-            # Modeli eğit
-            if name in ['SVM', 'Neural Network']:
-                # Standartlaştırılmış veri kullan
-                model.fit(self.X_train_scaled, self.y_train)
-                y_pred = model.predict(self.X_test_scaled)
-                y_pred_proba = model.predict_proba(self.X_test_scaled)
-                
-                # Cross-validation
-                cv_scores = cross_val_score(model, self.X_train_scaled, self.y_train, 
-                                          cv=5, scoring='accuracy')
+            model_jobs = [] if fold_ensemble else [
+                {'kind': 'fit', 'model': model,
+                 'X_train': X_train, 'y_train': self.y_train, 'X_test': X_test}
+            ]
+            for fold, (train_index, test_index) in enumerate(folds):
+                model_jobs.append({'kind': 'cv', 'model': clone(model), 'keep_model': fold_ensemble,
+                                   'fold': fold,
+                                   'X': X_train, 'y': self.y_train,
+                                   'train_index': train_index, 'test_index': test_index})
+            
+            for job in model_jobs:
+                job.update(name=name, classes=classes)
+                if threads_per_job is not None:
+                    job['model'] = _with_thread_budget(model, threads_per_job)
+                    if 'n_jobs' in model.get_params():
+                        job['n_jobs'] = model.get_params()['n_jobs']
+            jobs.extend(model_jobs)
+        return jobs
+        
+    def _classification_report(self, y_true, y_pred) -> dict:
+        labels = np.unique(np.concatenate([y_true, y_pred]))
+        return classification_report(
+            y_true, y_pred,
+            labels=labels,
+            target_names=[self.label_encoder.classes_[i] for i in labels],
+            output_dict=True,
+            zero_division=0
+        )
+        
+    def train_and_evaluate_models(self, n_jobs: int = 1, threads_per_job: int = None,
+                                  fold_ensemble: bool = True):
+        """
+        Tüm modelleri eğitir ve değerlendirir
+        
+        Cross-validation katmanlarının dışarıda kalan (out-of-fold) tahminleri ve
+        olasılıkları tek geçişte toplanır; CV metrikleri ve CV sınıflandırma
+        raporu bunlardan türetilir ve sonuçlarda saklanır.
+        
+        Args:
+            n_jobs: Aynı anda çalışacak eğitim işi sayısı (-1: tüm çekirdekler).
+                1'den büyükse model eğitimleri ve CV katmanları süreç havuzunda
+                eşzamanlı çalışır; sonuçlar seri çalışmayla aynıdır.
+            threads_per_job: Her işin kullanabileceği iş parçacığı sayısı
+                (varsayılan: çekirdek sayısı / n_jobs). XGBoost/LightGBM/Random
+                Forest'ın n_jobs'u ve OpenMP/BLAS iş parçacıkları bununla sınırlanır.
+            fold_ensemble: True (varsayılan) ise eğitim setinin tamamıyla ayrıca
+                eğitim yapılmaz; katman modelleri FoldEnsembleClassifier olarak
+                birleştirilip test seti ve kaydedilen model için kullanılır
+                (model başına 5 eğitim). False ise her model ayrıca eğitim
+                setinin tamamıyla eğitilir (model başına 6 eğitim).
+        
+        Her modelin fit, cv (katman başına), predict ve report aşamalarının
+        süre/CPU/tepe RSS kayıtları self.results[model]['profile'] altında
+        saklanır ve self.profiler'a eklenir.
+        """
+        n_jobs = effective_n_jobs(n_jobs)
+        print(f"\nModel eğitimi başlıyor... ({n_jobs} paralel iş)")
+        
+        with self.profiler.stage('train', n_jobs=n_jobs):
+            if n_jobs == 1:
+                jobs = self._build_training_jobs(fold_ensemble=fold_ensemble)
+                outputs = []
+                current = None
+                for job in jobs:
+                    if job['name'] != current:
+                        current = job['name']
+                        print(f"\n{current} modeli eğitiliyor...")
+                    outputs.append(_run_training_job(job))
             else:
-                # Orijinal veri kullan
-                model.fit(self.X_train, self.y_train)
-                y_pred = model.predict(self.X_test)
-                y_pred_proba = model.predict_proba(self.X_test)
-                
-                # Cross-validation
-                cv_scores = cross_val_score(model, self.X_train, self.y_train, 
-                                          cv=5, scoring='accuracy')
+                threads_per_job = threads_per_job or max(1, (os.cpu_count() or 1) // n_jobs)
+                jobs = self._build_training_jobs(threads_per_job, fold_ensemble=fold_ensemble)
+                print(f"{len(jobs)} iş, iş başına {threads_per_job} iş parçacığı ile çalıştırılıyor...")
+                with parallel_config(backend='loky', inner_max_num_threads=threads_per_job):
+                    outputs = Parallel(n_jobs=n_jobs)(delayed(_run_training_job)(job) for job in jobs)
+        
+        n_train, n_classes = len(self.y_train), len(self.label_encoder.classes_)
+        fitted = {}
+        oof = {name: {'predictions': np.empty(n_train, dtype=self.y_train.dtype),
+                      'probabilities': np.empty((n_train, n_classes)),
+                      'fold_scores': [], 'fold_models': [], 'profile': []}
+               for name in self.models}
+        for job, (model, y_pred, y_pred_proba, records) in zip(jobs, outputs):
+            self.profiler.extend(records)
+            oof[job['name']]['profile'].extend(records)
+            if job['kind'] == 'fit':
+                fitted[job['name']] = (model, y_pred, y_pred_proba)
+                continue
+            fold = oof[job['name']]
+            fold['predictions'][job['test_index']] = y_pred
+            fold['probabilities'][job['test_index']] = y_pred_proba
+            fold['fold_scores'].append(accuracy_score(self.y_train[job['test_index']], y_pred))
+            fold['fold_models'].append(model)
+        
+        for name in self.models:
+            fold = oof[name]
+            if fold_ensemble:
+                model = FoldEnsembleClassifier(fold['fold_models'], np.arange(n_classes))
+                X_test = self.X_test_scaled if name in SCALED_MODELS else self.X_test
+                with self.profiler.stage('predict', model=name):
+                    y_pred_proba = model.predict_proba(X_test)
+                    y_pred = model.predict(X_test)
+                fold['profile'].append(self.profiler.records[-1])
+            else:
+                model, y_pred, y_pred_proba = fitted[name]
+            self.models[name] = model
+            scores = np.array(fold['fold_scores'])
             
             # Performans metrikleri
-            accuracy = accuracy_score(self.y_test, y_pred)
+            with self.profiler.stage('report', model=name):
+                accuracy = accuracy_score(self.y_test, y_pred)
+                report = self._classification_report(self.y_test, y_pred)
+                cv_report = self._classification_report(self.y_train, fold['predictions'])
+            fold['profile'].append(self.profiler.records[-1])
             
             # Sonuçları kaydet
             self.results[name] = {
                 'model': model,
                 'accuracy': accuracy,
-                'cv_mean': cv_scores.mean(),
-                'cv_std': cv_scores.std(),
+                'cv_mean': scores.mean(),
+                'cv_std': scores.std(),
+                'cv_scores': scores,
                 'predictions': y_pred,
                 'probabilities': y_pred_proba,
-                'classification_report': classification_report(
-                    self.y_test, y_pred, 
-                    labels=np.unique(np.concatenate([self.y_test, y_pred])),
-                    target_names=[self.label_encoder.classes_[i] for i in np.unique(np.concatenate([self.y_test, y_pred]))],
-                    output_dict=True,
-                    zero_division=0
-                )
+                'oof_predictions': fold['predictions'],
+                'oof_probabilities': fold['probabilities'],
+                'oof_accuracy': accuracy_score(self.y_train, fold['predictions']),
+                'classification_report': report,
+                'cv_classification_report': cv_report,
+                'profile': fold['profile']
             }
             
+            print(f"\n{name}")
             print(f"  Test Accuracy: {accuracy:.4f}")
-            print(f"  CV Accuracy: {cv_scores.mean():.4f} (+/- {cv_scores.std() * 2:.4f})")
+            print(f"  CV Accuracy: {scores.mean():.4f} (+/- {scores.std() * 2:.4f})")
             
     def get_feature_importance(self):
         """Özellik önem skorlarını hesaplar"""
@@ -194,24 +550,30 @@ class SportsModelTrainer:
         
         feature_importance = {}
         
-        for name, result in self.results.items():
-            model = result['model']
-            
-            if hasattr(model, 'feature_importances_'):
-                # Tree-based modeller için
-                importance = model.feature_importances_
-                feature_importance[name] = dict(zip(self.X.columns, importance))
-            elif hasattr(model, 'coef_'):
-                # Linear modeller için
-                importance = np.abs(model.coef_[0])
-                feature_importance[name] = dict(zip(self.X.columns, importance))
-            else:
-                feature_importance[name] = {}
+        with self.profiler.stage('importance'):
+            for name, result in self.results.items():
+                model = result['model']
+                
+                if hasattr(model, 'feature_importances_'):
+                    # Tree-based modeller için
+                    importance = model.feature_importances_
+                    feature_importance[name] = dict(zip(self.feature_names, importance))
+                elif hasattr(model, 'coef_'):
+                    # Linear modeller için
+                    importance = np.abs(model.coef_[0])
+                    feature_importance[name] = dict(zip(self.feature_names, importance))
+                else:
+                    feature_importance[name] = {}
                 
         return feature_importance
         
-    def save_best_model(self, save_path: str = "models/best_model.pkl"):
-        """En iyi modeli kaydeder"""
+    def save_best_model(self, save_path: str = "models/best_model.pkl", compile_trees: bool = True):
+        """
+        En iyi modeli kaydeder
+        
+        compile_trees=True ise en iyi model bir ağaç topluluğu olduğunda
+        yanına yalnızca NumPy ile çalışan derlenmiş hali (.npz) de yazılır.
+        """
         # En iyi modeli bul
         best_model_name = max(self.results.keys(), 
                              key=lambda x: self.results[x]['accuracy'])
@@ -220,18 +582,27 @@ class SportsModelTrainer:
         # Modeli kaydet
         model_data = {
             'model': best_model,
+            'encoder': self.encoder,
             'scaler': self.scaler,
             'label_encoder': self.label_encoder,
-            'feature_names': list(self.X.columns),
+            'feature_names': list(self.feature_names),
             'model_name': best_model_name,
+            'scaled': self.compact or best_model_name in SCALED_MODELS,
             'accuracy': self.results[best_model_name]['accuracy']
         }
         
-        joblib.dump(model_data, save_path)
+        with self.profiler.stage('save', model=best_model_name):
+            joblib.dump(model_data, save_path)
         print(f"\nEn iyi model kaydedildi: {best_model_name}")
         print(f"Dosya yolu: {save_path}")
         print(f"Accuracy: {self.results[best_model_name]['accuracy']:.4f}")
         
+        if compile_trees:
+            with self.profiler.stage('compile', model=best_model_name):
+                compiled_path = save_compiled_companion(model_data, save_path)
+            if compiled_path:
+                print(f"Derlenmiş model: {compiled_path}")
+        
     def print_results_summary(self):
         """Sonuçları özetler"""
         print("\n" + "="*50)
@@ -252,9 +623,25 @@ class SportsModelTrainer:
             report = result['classification_report']
             print(f"   Weighted F1-Score: {report['weighted avg']['f1-score']:.4f}")
             print(f"   Macro F1-Score: {report['macro avg']['f1-score']:.4f}")
+            print(f"   CV (OOF) Weighted F1-Score: "
+                  f"{result['cv_classification_report']['weighted avg']['f1-score']:.4f}")
             
-    def run_full_pipeline(self):
-        """Tam eğitim sürecini çalıştırır"""
+    def run_full_pipeline(self, n_jobs: int = 1, fold_ensemble: bool = True,
+                          tune: bool = False, time_budget: float = DEFAULT_TIME_BUDGET, cpu_budget: float = None,
+                          profile_path: str = None, trace_path: str = None):
+        """
+        Tam eğitim sürecini çalıştırır
+        
+        Args:
+            n_jobs: Eşzamanlı eğitim işi sayısı (bkz. train_and_evaluate_models)
+            fold_ensemble: Katman modellerini topluluk olarak kullan (False:
+                ayrıca tam eğitim yap, bkz. train_and_evaluate_models)
+            tune: Eğitimden önce bütçeli hiperparametre araması yap
+            time_budget, cpu_budget: Arama bütçesi (bkz. tune_hyperparameters)
+            profile_path: Verilirse aşama kayıtları bu JSON dosyasına yazılır
+            trace_path: Verilirse aşama kayıtları Chrome izleme dosyası olarak
+                yazılır (chrome://tracing ya da ui.perfetto.dev ile açılır)
+        """
         print("Spor Yetenek Tahmin Sistemi - Model Eğitimi")
         print("="*50)
         
@@ -264,8 +651,12 @@ class SportsModelTrainer:
         # Modelleri başlat
         self.initialize_models()
         
+        # Hiperparametre araması (bulunan ayarlar modellere uygulanır)
+        if tune:
+            self.tune_hyperparameters(time_budget=time_budget, cpu_budget=cpu_budget, n_jobs=n_jobs)
+        
         # Modelleri eğit ve değerlendir
-        self.train_and_evaluate_models()
+        self.train_and_evaluate_models(n_jobs=n_jobs, fold_ensemble=fold_ensemble)
         
         # Sonuçları yazdır
         self.print_results_summary()
@@ -276,6 +667,13 @@ class SportsModelTrainer:
         # En iyi modeli kaydet
         self.save_best_model()
         
+        # Aşama süreleri ve bellek kullanımı
+        self.profiler.print_summary()
+        if profile_path:
+            self.profiler.save_json(profile_path)
+        if trace_path:
+            self.profiler.save_chrome_trace(trace_path)
+        
         return self.results, feature_importance
 
 # Kullanım örneği
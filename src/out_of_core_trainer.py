@@ -0,0 +1,431 @@
+"""
+Bellek Dışı Model Eğitimi - Spor Yetenek Tahmin Sistemi
+Bu dosya, belleğe sığmayan (ör. 100M satırlık) parçalı veri setlerinde
+modelleri parça parça eğitir.
+
+Akış:
+    1. Veri seti parça parça okunur, FeatureEncoder ile float32 matrislere
+       çevrilir ve akış halinde tabakalı (stratified) olarak eğitim/test
+       parçalarına ayrılıp diske .npy olarak yazılır. StandardScaler aynı
+       geçişte partial_fit ile uydurulur.
+    2. Modeller bu parçalar üzerinde eğitilir:
+       - SGD ve Neural Network: partial_fit, birkaç epoch
+       - XGBoost: DataIter ile harici bellekli (external memory) DMatrix
+       - LightGBM: lgb.Sequence ile parça parça kurulan Dataset. Ham veri
+         belleğe alınmaz, ancak LightGBM harici belleği desteklemediğinden
+         kutulanmış (binned) veri satır sayısıyla orantılı olarak bellekte
+         tutulur; bu nedenle eğitim satırı lgb_max_rows ile sınırlıdır.
+    3. Test parçaları üzerinde akış halinde değerlendirme yapılır.
+
+Random Forest ve SVM artımlı eğitimi desteklemediği için bu modda yer almaz.
+"""
+
+import contextlib
+import glob
+import io
+import os
+import shutil
+import tempfile
+import time
+import numpy as np
+import joblib
+from sklearn.base import clone
+from sklearn.preprocessing import StandardScaler, LabelEncoder
+from sklearn.linear_model import SGDClassifier
+from sklearn.metrics import classification_report
+import xgboost as xgb
+import lightgbm as lgb
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    from feature_config import TARGET_SPORTS
+    from dataset_io import FORMAT_EXTENSIONS, iter_dataset
+    from feature_encoding import FeatureEncoder
+    from bulk_data_generator import MANIFEST_NAME, BulkDataGenerator
+    from model_trainer import PREPROCESSING_CONFIG, SportsModelTrainer
+    from compiled_model import save_compiled_companion
+except ImportError:
+    from src.feature_config import TARGET_SPORTS
+    from src.dataset_io import FORMAT_EXTENSIONS, iter_dataset
+    from src.feature_encoding import FeatureEncoder
+    from src.bulk_data_generator import MANIFEST_NAME, BulkDataGenerator
+    from src.model_trainer import PREPROCESSING_CONFIG, SportsModelTrainer
+    from src.compiled_model import save_compiled_companion
+
+# Standartlaştırılmış veriyle eğitilen modeller
+SCALED_MODELS = ['SGD', 'Neural Network']
+
+# LightGBM'in bellekte tuttuğu kutulanmış veri için varsayılan eğitim satırı sınırı
+# (64 özellikle ölçülen ~150 bayt/satır: 10M satır ~1.5 GB, örnekleme için sabit ~200 MB)
+LGB_MAX_ROWS = 10_000_000
+
+# prepare_chunks ve XGBoost harici bellek modunun çalışma dizinine yazdığı dosyalar
+WORK_FILE_PATTERNS = ('train-X-*.npy', 'train-y-*.npy', 'test-X-*.npy', 'test-y-*.npy', 'xgb-cache*')
+
+
+def dataset_files(source: str) -> List[str]:
+    """
+    Kaynağı okunacak dosya listesine çevirir: tek bir dosya, manifest.json
+    içeren bir parça dizini ya da veri seti dosyaları içeren bir dizin
+    """
+    if not os.path.isdir(source):
+        return [source]
+    if os.path.exists(os.path.join(source, MANIFEST_NAME)):
+        return BulkDataGenerator.shard_files(source)
+    files = sorted(os.path.join(source, name) for name in os.listdir(source)
+                   if os.path.splitext(name)[1].lower() in FORMAT_EXTENSIONS)
+    if not files:
+        raise ValueError(f"Dizinde veri seti dosyası bulunamadı: {source}")
+    return files
+
+
+class StreamingStratifiedSplitter:
+    """
+    Akış halinde tabakalı eğitim/test ayırıcı
+
+    Her sınıfın k. satırı, sınıfa özgü rastgele bir kaydırma ile sistematik
+    örnekleme yapılarak test setine atanır; böylece her sınıfın test oranı
+    tek geçişte ve parça boyutundan bağımsız olarak test_size'a eşit olur.
+    """
+
+    def __init__(self, n_classes: int, test_size: float = 0.2, random_state: int = 42):
+        self.test_size = test_size
+        self.seen = np.zeros(n_classes, dtype=np.int64)
+        self.offsets = np.random.default_rng(random_state).uniform(0, 1 / test_size, n_classes)
+
+    def split(self, y: np.ndarray) -> np.ndarray:
+        """Parçadaki satırlar için test maskesini döndürür"""
+        is_test = np.zeros(len(y), dtype=bool)
+        for label in np.unique(y):
+            rows = np.flatnonzero(y == label)
+            position = self.seen[label] + np.arange(len(rows)) + self.offsets[label]
+            is_test[rows] = (np.floor((position + 1) * self.test_size)
+                             - np.floor(position * self.test_size)) >= 1
+            self.seen[label] += len(rows)
+        return is_test
+
+
+class _ChunkIterator(xgb.DataIter):
+    """Diskteki eğitim parçalarını XGBoost'a sırayla veren yineleyici"""
+
+    def __init__(self, chunks: List[Tuple[str, str]], cache_prefix: Optional[str] = None):
+        self._chunks = chunks
+        self._position = 0
+        super().__init__(cache_prefix=cache_prefix)
+
+    def next(self, input_data) -> int:
+        if self._position == len(self._chunks):
+            return 0
+        X_path, y_path = self._chunks[self._position]
+        input_data(data=np.load(X_path), label=np.load(y_path))
+        self._position += 1
+        return 1
+
+    def reset(self):
+        self._position = 0
+
+
+class _ChunkSequence(lgb.Sequence):
+    """Bir eğitim parçasını LightGBM'e satır batch'leri halinde veren dizi"""
+
+    def __init__(self, X_path: str, batch_size: int):
+        self._X = np.load(X_path, mmap_mode='r')
+        self.batch_size = batch_size
+
+    def __getitem__(self, index):
+        # LightGBM örnekleme adımı float64 bekler
+        return np.asarray(self._X[index], dtype=np.float64)
+
+    def __len__(self) -> int:
+        return len(self._X)
+
+
+class BoosterClassifier:
+    """XGBoost/LightGBM Booster'ını predict/predict_proba arayüzüyle saran sınıflandırıcı"""
+
+    def __init__(self, booster, n_classes: int):
+        self.booster = booster
+        self.classes_ = np.arange(n_classes)
+
+    @property
+    def feature_importances_(self) -> np.ndarray:
+        if isinstance(self.booster, xgb.Booster):
+            scores = self.booster.get_score(importance_type='gain')
+            names = self.booster.feature_names or [f'f{i}' for i in range(self.booster.num_features())]
+            return np.array([scores.get(name, 0.0) for name in names])
+        return self.booster.feature_importance(importance_type='gain')
+
+    def predict_proba(self, X) -> np.ndarray:
+        if isinstance(self.booster, xgb.Booster):
+            return self.booster.predict(xgb.DMatrix(X))
+        return self.booster.predict(X)
+
+    def predict(self, X) -> np.ndarray:
+        return np.argmax(self.predict_proba(X), axis=1)
+
+
+class OutOfCoreTrainer:
+    """Belleğe sığmayan veri setleri için parça parça model eğitici"""
+
+    def __init__(self, source: str, chunk_rows: int = 100_000, epochs: int = 3,
+                 work_dir: Optional[str] = None, random_state: int = 42,
+                 xgb_memory: str = 'external', lgb_max_rows: Optional[int] = LGB_MAX_ROWS):
+        """
+        Args:
+            source: Veri seti dosyası, parça dizini (manifest.json) ya da dosya dizini
+            chunk_rows: Belleğe bir seferde alınacak en fazla satır sayısı
+            epochs: partial_fit ile eğitilen modellerin veri üzerinden geçiş sayısı
+            work_dir: Kodlanmış parçaların yazılacağı dizin (varsayılan: geçici dizin).
+                Verilen dizin temizlikte silinmez; yalnızca yazılan parçalar silinir.
+            random_state: Ayırma ve model seed değeri
+            xgb_memory: 'external' ise XGBoost sayfaları diskte tutulur (bellek
+                kullanımı veri boyutundan bağımsız); 'quantile' ise parçalar
+                satır başına ~1 bayt/özellik olan sıkıştırılmış QuantileDMatrix'e
+                okunur (bellekte tutulur, daha hızlı)
+            lgb_max_rows: LightGBM'in eğitileceği en fazla eğitim satırı; veri
+                daha büyükse LightGBM atlanır (None: sınır yok). LightGBM'in
+                kutulanmış verisi satır sayısıyla orantılı bellek kullanır.
+        """
+        if xgb_memory not in ('external', 'quantile'):
+            raise ValueError(f"Geçersiz xgb_memory: {xgb_memory} ('external' ya da 'quantile')")
+        self.source = source
+        self.chunk_rows = chunk_rows
+        self.epochs = epochs
+        self.random_state = random_state
+        self.xgb_memory = xgb_memory
+        self.lgb_max_rows = lgb_max_rows
+        self.work_dir = work_dir
+        self._owns_work_dir = False
+        self.encoder = FeatureEncoder()
+        self.feature_names = list(self.encoder.feature_names)
+        self.scaler = StandardScaler()
+        self.label_encoder = LabelEncoder().fit(list(TARGET_SPORTS.keys()))
+        self.train_chunks = []
+        self.test_chunks = []
+        self.y_test = None
+        self.n_train = 0
+        self.models = {}
+        self.results = {}
+
+    def iter_chunks(self) -> Iterator:
+        """Kaynağı dosya dosya, her dosyayı en fazla chunk_rows satırlık parçalarla okur"""
+        for path in dataset_files(self.source):
+            yield from iter_dataset(path, chunk_rows=self.chunk_rows)
+
+    def prepare_chunks(self):
+        """Veriyi kodlar, akış halinde tabakalı ayırır ve parçaları diske yazar"""
+        if self.work_dir is None:
+            self.work_dir = tempfile.mkdtemp(prefix='sporcu_ooc_')
+            self._owns_work_dir = True
+        os.makedirs(self.work_dir, exist_ok=True)
+        print(f"Veri seti parça parça hazırlanıyor: {self.source}")
+
+        target_column = PREPROCESSING_CONFIG['target_column']
+        splitter = StreamingStratifiedSplitter(len(self.label_encoder.classes_),
+                                               PREPROCESSING_CONFIG['test_size'], self.random_state)
+        self.train_chunks, self.test_chunks = [], []
+        y_test = []
+        rows = 0
+        for i, chunk in enumerate(self.iter_chunks()):
+            X = self.encoder.transform(chunk, dtype=np.float32)
+            y = self.label_encoder.transform(chunk[target_column].astype(str)).astype(np.int8)
+            is_test = splitter.split(y)
+
+            for split, mask, chunks in (('train', ~is_test, self.train_chunks),
+                                        ('test', is_test, self.test_chunks)):
+                X_path = os.path.join(self.work_dir, f'{split}-X-{i:06d}.npy')
+                y_path = os.path.join(self.work_dir, f'{split}-y-{i:06d}.npy')
+                np.save(X_path, X[mask])
+                np.save(y_path, y[mask])
+                chunks.append((X_path, y_path))
+
+            self.scaler.partial_fit(X[~is_test])
+            y_test.append(y[is_test])
+            rows += len(chunk)
+            print(f"  {rows} satır hazırlandı")
+
+        self.y_test = np.concatenate(y_test)
+        n_test = len(self.y_test)
+        self.n_train = rows - n_test
+        print(f"Eğitim seti boyutu: {self.n_train}, test seti boyutu: {n_test}")
+        print(f"Özellik sayısı: {len(self.feature_names)}")
+
+    def _load_chunk(self, chunk: Tuple[str, str], scaled: bool):
+        X_path, y_path = chunk
+        X = np.load(X_path, mmap_mode='r')
+        if scaled:
+            X = self.scaler.transform(X).astype(np.float32)
+        return X, np.load(y_path)
+
+    def initialize_models(self):
+        """Artımlı eğitime uygun modelleri, bellek içi eğiticinin ayarlarıyla başlatır"""
+        trainer = SportsModelTrainer(cache_dir=None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            trainer.initialize_models()
+        self.models = {
+            'SGD': SGDClassifier(loss='log_loss', alpha=1e-4, random_state=self.random_state),
+            'Neural Network': clone(trainer.models['Neural Network']),
+            'XGBoost': trainer.models['XGBoost'],
+            'LightGBM': trainer.models['LightGBM']
+        }
+        print(f"\nToplam {len(self.models)} model başlatıldı")
+
+    def _train_incremental(self, model):
+        """partial_fit destekleyen modeli epochs kez tüm eğitim parçaları üzerinden eğitir"""
+        classes = np.arange(len(self.label_encoder.classes_))
+        rng = np.random.default_rng(self.random_state)
+        for epoch in range(self.epochs):
+            for index in rng.permutation(len(self.train_chunks)):
+                X, y = self._load_chunk(self.train_chunks[index], scaled=True)
+                model.partial_fit(X, y, classes=classes)
+        return model
+
+    def _train_xgboost(self, model) -> BoosterClassifier:
+        """Parça yineleyicisinden kurulan (harici bellekli ya da quantile) DMatrix ile XGBoost eğitimi"""
+        params = {key: value for key, value in model.get_xgb_params().items() if value is not None}
+        params.update(objective='multi:softprob', num_class=len(self.label_encoder.classes_),
+                      tree_method='hist')
+        if self.xgb_memory == 'external':
+            dtrain = xgb.DMatrix(_ChunkIterator(self.train_chunks, os.path.join(self.work_dir, 'xgb-cache')))
+        else:
+            dtrain = xgb.QuantileDMatrix(_ChunkIterator(self.train_chunks))
+        booster = xgb.train(params, dtrain, num_boost_round=model.n_estimators)
+        return BoosterClassifier(booster, len(self.label_encoder.classes_))
+
+    def _train_lightgbm(self, model) -> BoosterClassifier:
+        """
+        Parçalardan (lgb.Sequence) kurulan Dataset ile LightGBM eğitimi
+
+        Parçalar mmap ile batch batch okunup doğrudan kutulanır; ham veri ve
+        ikili dosya kopyası oluşmaz. Etiketler int8 olarak birleştirilir.
+        """
+        p = model.get_params()
+        params = {
+            'objective': 'multiclass',
+            'num_class': len(self.label_encoder.classes_),
+            'learning_rate': p['learning_rate'],
+            'max_depth': p['max_depth'],
+            'num_leaves': p['num_leaves'],
+            'feature_fraction': p['colsample_bytree'],
+            'bagging_fraction': p['subsample'],
+            'bagging_freq': p['subsample_freq'],
+            'seed': p['random_state'],
+            'verbose': -1
+        }
+        sequences = [_ChunkSequence(X_path, self.chunk_rows) for X_path, _ in self.train_chunks]
+        labels = np.concatenate([np.load(y_path) for _, y_path in self.train_chunks])
+        train_set = lgb.Dataset(sequences, label=labels, params=params, free_raw_data=True)
+        booster = lgb.train(params, train_set, num_boost_round=p['n_estimators'])
+        return BoosterClassifier(booster, len(self.label_encoder.classes_))
+
+    def train_and_evaluate_models(self):
+        """Tüm modelleri parça parça eğitir ve test parçaları üzerinde değerlendirir"""
+        print("\nModel eğitimi başlıyor...")
+        for name, model in self.models.items():
+            if name == 'LightGBM' and self.lgb_max_rows is not None and self.n_train > self.lgb_max_rows:
+                print(f"\n{name} atlandı: {self.n_train} eğitim satırı lgb_max_rows={self.lgb_max_rows} "
+                      f"sınırını aşıyor (kutulanmış veri bellekte tutulur)")
+                continue
+            print(f"\n{name} modeli eğitiliyor...")
+            start = time.time()
+            if name == 'XGBoost':
+                model = self._train_xgboost(model)
+            elif name == 'LightGBM':
+                model = self._train_lightgbm(model)
+            else:
+                model = self._train_incremental(model)
+            self.models[name] = model
+
+            y_pred = np.concatenate([
+                model.predict(self._load_chunk(chunk, scaled=name in SCALED_MODELS)[0])
+                for chunk in self.test_chunks
+            ]).astype(np.int8)
+            accuracy = float(np.mean(y_pred == self.y_test))
+            labels = np.unique(np.concatenate([self.y_test, y_pred]))
+            self.results[name] = {
+                'model': model,
+                'accuracy': accuracy,
+                'predictions': y_pred,
+                'training_time': time.time() - start,
+                'classification_report': classification_report(
+                    self.y_test, y_pred,
+                    labels=labels,
+                    target_names=[self.label_encoder.classes_[i] for i in labels],
+                    output_dict=True,
+                    zero_division=0
+                )
+            }
+            print(f"  Test Accuracy: {accuracy:.4f} ({time.time() - start:.1f}s)")
+
+    def print_results_summary(self):
+        """Sonuçları özetler"""
+        print("\n" + "="*50)
+        print("MODEL KARŞILAŞTIRMA SONUÇLARI (BELLEK DIŞI)")
+        print("="*50)
+        sorted_results = sorted(self.results.items(), key=lambda x: x[1]['accuracy'], reverse=True)
+        for i, (name, result) in enumerate(sorted_results, 1):
+            report = result['classification_report']
+            print(f"\n{i}. {name}")
+            print(f"   Test Accuracy: {result['accuracy']:.4f}")
+            print(f"   Weighted F1-Score: {report['weighted avg']['f1-score']:.4f}")
+            print(f"   Eğitim süresi: {result['training_time']:.1f}s")
+
+    def save_best_model(self, save_path: str = "models/best_model.pkl"):
+        """En iyi modeli SportsModelTrainer ile aynı biçimde kaydeder"""
+        best_model_name = max(self.results.keys(), key=lambda x: self.results[x]['accuracy'])
+        model_data = {
+            'model': self.results[best_model_name]['model'],
+            'encoder': self.encoder,
+            'scaler': self.scaler,
+            'label_encoder': self.label_encoder,
+            'feature_names': list(self.feature_names),
+            'model_name': best_model_name,
+            'scaled': best_model_name in SCALED_MODELS,
+            'accuracy': self.results[best_model_name]['accuracy']
+        }
+        joblib.dump(model_data, save_path)
+        print(f"\nEn iyi model kaydedildi: {best_model_name}")
+        print(f"Dosya yolu: {save_path}")
+        print(f"Accuracy: {self.results[best_model_name]['accuracy']:.4f}")
+        compiled_path = save_compiled_companion(model_data, save_path)
+        if compiled_path:
+            print(f"Derlenmiş model: {compiled_path}")
+
+    def cleanup(self):
+        """
+        Kodlanmış parçaları siler
+
+        Geçici çalışma dizini tümüyle silinir; çağıranın verdiği dizinde
+        yalnızca bu sınıfın yazdığı parça ve XGBoost önbellek dosyaları silinir.
+        """
+        if not self.work_dir or not os.path.exists(self.work_dir):
+            return
+        if self._owns_work_dir:
+            shutil.rmtree(self.work_dir)
+            return
+        for pattern in WORK_FILE_PATTERNS:
+            for path in glob.glob(os.path.join(glob.escape(self.work_dir), pattern)):
+                os.remove(path)
+
+    def run_full_pipeline(self, save_path: str = "models/best_model.pkl",
+                          keep_work_dir: bool = False) -> Dict:
+        """Tam bellek dışı eğitim sürecini çalıştırır"""
+        print("Spor Yetenek Tahmin Sistemi - Bellek Dışı Model Eğitimi")
+        print("="*50)
+        try:
+            self.prepare_chunks()
+            self.initialize_models()
+            self.train_and_evaluate_models()
+            self.print_results_summary()
+            self.save_best_model(save_path)
+        finally:
+            if not keep_work_dir:
+                self.cleanup()
+        return self.results
+
+
+# Kullanım örneği
+if __name__ == "__main__":
+    import sys
+    trainer = OutOfCoreTrainer(sys.argv[1] if len(sys.argv) > 1 else "data/shards")
+    trainer.run_full_pipeline()
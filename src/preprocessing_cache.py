@@ -0,0 +1,111 @@
+"""
+Ön İşleme Önbelleği - Spor Yetenek Tahmin Sistemi
+Bu dosya, kodlanmış, bölünmüş ve ölçeklenmiş özellik matrislerini diskte
+içerik adresli olarak saklar.
+
+Önbellek anahtarı, veri seti dosyasının SHA-256 özeti ile ön işleme
+yapılandırmasının özetinden oluşur. Matrisler .npy olarak yazılır ve
+bellek eşlemeli (mmap) okunur; böylece değişmemiş bir veri setiyle yeniden
+çalıştırmada CSV ayrıştırma ve kodlama adımları tamamen atlanır.
+"""
+
+import hashlib
+import json
+import os
+import shutil
+import uuid
+import numpy as np
+import joblib
+from typing import Dict, Optional, Tuple
+
+# Dosya özetleri bu dosyada yol/boyut/değişiklik zamanına göre saklanır;
+# dosya değişmediyse büyük veri setleri yeniden okunmaz
+INDEX_NAME = 'index.json'
+METADATA_NAME = 'metadata.pkl'
+_HASH_CHUNK = 1 << 20
+
+
+def _config_digest(config: dict) -> str:
+    return hashlib.sha256(json.dumps(config, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+
+class PreprocessingCache:
+    """Ön işlenmiş özellik matrisleri için içerik adresli disk önbelleği"""
+
+    def __init__(self, cache_dir: str):
+        """
+        Args:
+            cache_dir: Önbellek dizini (yoksa oluşturulur)
+        """
+        self.cache_dir = cache_dir
+        self.index_path = os.path.join(cache_dir, INDEX_NAME)
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save_index(self, index: dict):
+        tmp_path = f"{self.index_path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(index, f, indent=2)
+        os.replace(tmp_path, self.index_path)
+
+    def file_digest(self, path: str) -> str:
+        """
+        Dosyanın SHA-256 özetini döndürür
+
+        Boyutu ve değişiklik zamanı dizindeki kayıtla aynı olan dosyalar
+        yeniden okunmaz.
+        """
+        stat = os.stat(path)
+        key = os.path.abspath(path)
+        index = self._load_index()
+        entry = index.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_HASH_CHUNK), b''):
+                digest.update(chunk)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        index[key] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+        self._save_index(index)
+        return digest.hexdigest()
+
+    def key(self, data_path: str, config: dict) -> str:
+        """Veri seti içeriği ve ön işleme yapılandırmasından önbellek anahtarı üretir"""
+        combined = f"{self.file_digest(data_path)}:{_config_digest(config)}"
+        return hashlib.sha256(combined.encode('utf-8')).hexdigest()[:32]
+
+    def load(self, key: str) -> Optional[Tuple[Dict[str, np.ndarray], dict]]:
+        """Önbellek kaydını (mmap dizileri, metadata) döndürür; yoksa None"""
+        entry_dir = os.path.join(self.cache_dir, key)
+        metadata_path = os.path.join(entry_dir, METADATA_NAME)
+        if not os.path.exists(metadata_path):
+            return None
+
+        metadata = joblib.load(metadata_path)
+        arrays = {name: np.load(os.path.join(entry_dir, f'{name}.npy'), mmap_mode='r')
+                  for name in metadata['arrays']}
+        return arrays, metadata
+
+    def save(self, key: str, arrays: Dict[str, np.ndarray], metadata: dict):
+        """Dizileri ve metadata'yı atomik olarak (geçici dizin + yeniden adlandırma) yazar"""
+        entry_dir = os.path.join(self.cache_dir, key)
+        tmp_dir = f"{entry_dir}.{uuid.uuid4().hex}.tmp"
+        os.makedirs(tmp_dir)
+        try:
+            for name, array in arrays.items():
+                np.save(os.path.join(tmp_dir, f'{name}.npy'), np.ascontiguousarray(array))
+            joblib.dump({**metadata, 'arrays': list(arrays)}, os.path.join(tmp_dir, METADATA_NAME))
+            if os.path.exists(entry_dir):
+                shutil.rmtree(entry_dir)
+            os.replace(tmp_dir, entry_dir)
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir)
@@ -0,0 +1,199 @@
+"""
+Performans Ölçümü - Spor Yetenek Tahmin Sistemi
+Bu dosya, süre ve bellek ölçümü için ortak yardımcıları ve aşama bazlı
+(duvar saati, CPU süresi, tepe RSS) profil kaydedicisini içerir.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import List, Optional
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+try:
+    import psutil
+except ImportError:  # psutil isteğe bağlıdır
+    psutil = None
+
+
+def peak_rss_bytes() -> int:
+    """Sürecin başlangıcından bu yana ulaştığı en yüksek RSS değerini (bayt) döndürür
+
+    Ölçüm yapılamıyorsa 0 döndürülür.
+    """
+    if resource is not None:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux'ta KB, macOS'ta bayt cinsindendir
+        return peak if sys.platform == 'darwin' else peak * 1024
+    if psutil is not None:
+        memory = psutil.Process().memory_info()
+        return getattr(memory, 'peak_wset', memory.rss)
+    return 0
+
+
+def current_rss_bytes() -> int:
+    """Sürecin o anki RSS değerini (bayt) döndürür; ölçülemiyorsa 0"""
+    if psutil is not None:
+        return psutil.Process().memory_info().rss
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * 4096
+    except OSError:
+        return 0
+
+
+class StageProfiler:
+    """
+    Adlandırılmış aşamaların duvar saati, CPU süresi ve tepe RSS değerini kaydeder
+
+    Aşama içindeki tepe RSS, arka planda interval aralıklarla alınan
+    örneklerden bulunur; süreç genelindeki en yüksek RSS aşama sırasında
+    yükseldiyse bu kesin değer kullanılır. Kayıtlar JSON olarak ya da
+    Chrome izleme (chrome://tracing, Perfetto) dosyası olarak dışa aktarılabilir.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        """
+        Args:
+            interval: RSS örnekleme aralığı (saniye)
+        """
+        self.interval = interval
+        self.records = []
+        self._active = []
+        self._lock = threading.Lock()
+        self._sampler = None
+        self._stop = threading.Event()
+
+    def _sample(self):
+        while not self._stop.wait(self.interval):
+            rss = current_rss_bytes()
+            with self._lock:
+                for entry in self._active:
+                    entry['peak'] = max(entry['peak'], rss)
+
+    @contextmanager
+    def stage(self, name: str, model: Optional[str] = None, **args):
+        """
+        Bir aşamayı ölçer; with bloğunda dönen sözlüğe ek alanlar yazılabilir
+
+        Args:
+            name: Aşama adı (ör. 'load', 'fit', 'cv')
+            model: Aşamanın ait olduğu model adı (varsa)
+            **args: Kayda eklenecek ek bilgiler (ör. fold=2)
+        """
+        rss_start = current_rss_bytes()
+        entry = {'peak': rss_start}
+        with self._lock:
+            self._active.append(entry)
+            if self._sampler is None:
+                self._stop.clear()
+                self._sampler = threading.Thread(target=self._sample, daemon=True)
+                self._sampler.start()
+        high_water_start = peak_rss_bytes()
+        extra = dict(args)
+        start = time.time()
+        wall_start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield extra
+        finally:
+            cpu_seconds = time.process_time() - cpu_start
+            wall_seconds = time.perf_counter() - wall_start
+            rss_end = current_rss_bytes()
+            high_water_end = peak_rss_bytes()
+            with self._lock:
+                self._active.remove(entry)
+                sampler = None
+                if not self._active:
+                    sampler, self._sampler = self._sampler, None
+                    self._stop.set()
+            if sampler is not None:
+                sampler.join()
+            peak = max(entry['peak'], rss_end)
+            if high_water_end > high_water_start:
+                peak = max(peak, high_water_end)
+            self.records.append({
+                'name': name,
+                'model': model,
+                'start': start,
+                'wall_seconds': wall_seconds,
+                'cpu_seconds': cpu_seconds,
+                'peak_rss_mb': round(peak / 2**20, 1),
+                'rss_start_mb': round(rss_start / 2**20, 1),
+                'rss_end_mb': round(rss_end / 2**20, 1),
+                'pid': os.getpid(),
+                'tid': threading.get_native_id(),
+                **extra
+            })
+
+    def extend(self, records: List[dict]):
+        """Başka bir süreçte (ör. paralel eğitim işçisi) alınan kayıtları ekler"""
+        self.records.extend(records)
+
+    def model_records(self, model: str) -> List[dict]:
+        """Bir modele ait kayıtları döndürür"""
+        return [record for record in self.records if record['model'] == model]
+
+    def summary(self) -> List[dict]:
+        """Kayıtları (model, aşama) bazında toplar; toplam süreye göre azalan sırada"""
+        totals = {}
+        for record in self.records:
+            key = (record['model'], record['name'])
+            total = totals.setdefault(key, {'model': record['model'], 'name': record['name'], 'count': 0,
+                                            'wall_seconds': 0.0, 'cpu_seconds': 0.0, 'peak_rss_mb': 0.0})
+            total['count'] += 1
+            total['wall_seconds'] += record['wall_seconds']
+            total['cpu_seconds'] += record['cpu_seconds']
+            total['peak_rss_mb'] = max(total['peak_rss_mb'], record['peak_rss_mb'])
+        return sorted(totals.values(), key=lambda total: total['wall_seconds'], reverse=True)
+
+    def print_summary(self, limit: int = 15):
+        """En uzun süren aşamaları tablo halinde yazdırır"""
+        print(f"\n{'Aşama':<32}{'Adet':>6}{'Süre (s)':>11}{'CPU (s)':>11}{'Tepe RSS (MB)':>15}")
+        for total in self.summary()[:limit]:
+            label = f"{total['model']} / {total['name']}" if total['model'] else total['name']
+            print(f"{label:<32}{total['count']:>6}{total['wall_seconds']:>11.2f}"
+                  f"{total['cpu_seconds']:>11.2f}{total['peak_rss_mb']:>15.1f}")
+
+    def save_json(self, path: str):
+        """Kayıtları ve özeti JSON olarak yazar"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'records': self.records, 'summary': self.summary()}, f,
+                      ensure_ascii=False, indent=2, default=str)
+
+    def to_chrome_trace(self) -> dict:
+        """Kayıtları Chrome izleme biçimine (Trace Event Format) çevirir"""
+        origin = min((record['start'] for record in self.records), default=0.0)
+        events = []
+        for record in self.records:
+            ts = (record['start'] - origin) * 1e6
+            args = {key: value for key, value in record.items()
+                    if key not in ('name', 'start', 'wall_seconds', 'pid', 'tid')}
+            events.append({
+                'name': f"{record['model']} / {record['name']}" if record['model'] else record['name'],
+                'cat': 'model' if record['model'] else 'pipeline',
+                'ph': 'X',
+                'ts': ts,
+                'dur': record['wall_seconds'] * 1e6,
+                'pid': record['pid'],
+                'tid': record['tid'],
+                'args': args
+            })
+            # Bellek sayacı: aşama başı ve sonundaki RSS
+            events.append({'name': 'RSS (MB)', 'ph': 'C', 'ts': ts, 'pid': record['pid'],
+                           'args': {'rss': record['rss_start_mb']}})
+            events.append({'name': 'RSS (MB)', 'ph': 'C', 'ts': ts + record['wall_seconds'] * 1e6,
+                           'pid': record['pid'], 'args': {'rss': record['rss_end_mb']}})
+        return {'traceEvents': sorted(events, key=lambda event: event['ts']), 'displayTimeUnit': 'ms'}
+
+    def save_chrome_trace(self, path: str):
+        """Chrome izleme dosyası yazar (chrome://tracing ya da ui.perfetto.dev ile açılır)"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_chrome_trace(), f, ensure_ascii=False, default=str)
@@ -0,0 +1,129 @@
+"""
+Spor Uygunluk Skorlayıcı - Spor Yetenek Tahmin Sistemi
+Bu dosya, TARGET_SPORTS kurallarını bir kez ağırlık/dönüşüm matrislerine
+derler ve N kişiyi tüm sporlara karşı tek bir vektörel işlemle skorlar.
+"""
+
+import numpy as np
+from typing import Dict, List
+
+try:
+    from feature_config import TARGET_SPORTS
+except ImportError:
+    from src.feature_config import TARGET_SPORTS
+
+# Takım sporları (takım oyunu tercihi bonusu için)
+TEAM_SPORTS = ['Futbol', 'Basketbol', 'Voleybol']
+TEAM_PREFERENCES = ['Bireysel', 'Takım', 'Karma']
+BODY_TYPES = ['Ektomorf', 'Mezomorf', 'Endomorf']
+
+
+def score_column(sport: str) -> str:
+    """Spor adından veri setindeki skor sütununun adını üretir"""
+    return f'skor_{sport.replace("/", "_").replace(" ", "_").lower()}'
+
+
+def _category_codes(values, categories: List[str]) -> np.ndarray:
+    """Kategorik değerleri kod dizisine çevirir (bilinmeyen değerler -1)"""
+    values = np.asarray(values, dtype=object)
+    codes = np.full(values.shape, -1, dtype=np.int64)
+    for code, category in enumerate(categories):
+        codes[values == category] = code
+    return codes
+
+
+class SportCompatibilityScorer:
+    """TARGET_SPORTS kurallarını matris biçiminde uygulayan skorlayıcı"""
+
+    def __init__(self, target_sports: Dict = TARGET_SPORTS):
+        """
+        Skorlayıcıyı TARGET_SPORTS konfigürasyonundan derler
+
+        Args:
+            target_sports: Spor adı -> key_features / preferred_body_type sözlüğü
+        """
+        self.sports = list(target_sports.keys())
+        self.score_columns = [score_column(sport) for sport in self.sports]
+        num_sports = len(self.sports)
+
+        # Doğrudan toplanan (1-10 skala) özellikler ile boy/kilo dönüşümleri
+        # aynı terim matrisinde yer alır: [sayısal özellikler..., boy_terimi, kilo_terimi]
+        self.numeric_features = []
+        for sport_info in target_sports.values():
+            for feature in sport_info['key_features']:
+                if (feature not in ('boy', 'kilo', 'takım_oyunu_tercihi')
+                        and feature not in self.numeric_features):
+                    self.numeric_features.append(feature)
+        self.term_features = self.numeric_features + ['boy', 'kilo']
+
+        self.weights = np.zeros((len(self.term_features), num_sports))
+        self.team_weights = np.zeros(num_sports)
+
+        # Satırlar: Bireysel, Takım, Karma, bilinmeyen (-1 kodu son satırı seçer)
+        self.team_table = np.zeros((len(TEAM_PREFERENCES) + 1, num_sports))
+        self.body_table = np.zeros((len(BODY_TYPES) + 1, num_sports))
+
+        for j, (sport, sport_info) in enumerate(target_sports.items()):
+            for feature in sport_info['key_features']:
+                if feature == 'takım_oyunu_tercihi':
+                    self.team_weights[j] += 1
+                    uygun = ['Takım', 'Karma'] if sport in TEAM_SPORTS else ['Bireysel', 'Karma']
+                    for i, tercih in enumerate(TEAM_PREFERENCES):
+                        self.team_table[i, j] += 8 if tercih in uygun else 4
+                    self.team_table[-1, j] += 4
+                else:
+                    self.weights[self.term_features.index(feature), j] += 1
+
+            for i, body_type in enumerate(BODY_TYPES):
+                self.body_table[i, j] = 15 if body_type in sport_info['preferred_body_type'] else 5
+            self.body_table[-1, j] = 5
+
+    def _term_matrix(self, columns) -> np.ndarray:
+        """Sayısal ve boy/kilo terimlerinden (N, F) matrisi oluşturur"""
+        n = len(columns['vucut_tipi'])
+        terms = np.zeros((n, len(self.term_features)))
+        for i, feature in enumerate(self.numeric_features):
+            if feature in columns:
+                terms[:, i] = columns[feature]
+        if 'boy' in columns:
+            # 160-190 arası normalize
+            terms[:, -2] = np.clip(5 + (np.asarray(columns['boy'], dtype=float) - 160) / 30 * 2, 0, 10)
+        if 'kilo' in columns:
+            # Düşük kilo avantajlı
+            terms[:, -1] = np.clip(5 + (80 - np.asarray(columns['kilo'], dtype=float)) / 30 * 2, 0, 10)
+        return terms
+
+    def score_matrix(self, columns) -> np.ndarray:
+        """
+        N kişiyi tüm sporlara karşı skorlar
+
+        Args:
+            columns: Özellik adı -> dizi eşlemesi (dict ya da DataFrame)
+
+        Returns:
+            (N, spor sayısı) boyutunda 0-100 arası uygunluk skorları
+        """
+        present = np.array([feature in columns for feature in self.term_features], dtype=float)
+        score = self._term_matrix(columns) @ self.weights
+        max_score = 10 * (present @ self.weights) + 15
+
+        if 'takım_oyunu_tercihi' in columns:
+            team_codes = _category_codes(columns['takım_oyunu_tercihi'], TEAM_PREFERENCES)
+            score += self.team_table[team_codes]
+            max_score = max_score + 10 * self.team_weights
+
+        # Vücut tipi uygunluğu
+        score += self.body_table[_category_codes(columns['vucut_tipi'], BODY_TYPES)]
+
+        return np.round(score / max_score * 100, 1)
+
+    def score_record(self, record: Dict) -> Dict[str, float]:
+        """Tek bir kişinin skorlarını {spor: skor} sözlüğü olarak döndürür"""
+        columns = {key: [value] for key, value in record.items()
+                   if not isinstance(value, (list, tuple))}
+        scores = self.score_matrix(columns)[0]
+        return {sport: float(score) for sport, score in zip(self.sports, scores)}
+
+    def best_sports(self, scores: np.ndarray) -> np.ndarray:
+        """Skor matrisinden her satır için en uygun sporun adını seçer"""
+        return np.asarray(self.sports, dtype=object)[np.argmax(scores, axis=1)]
@@ -0,0 +1,11 @@
+"""
+Testler için ortak ayarlar
+
+Modüller src içinden düz adlarla (ör. 'from feature_encoding import ...')
+birbirini içe aktardığı için src dizini yola eklenir.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
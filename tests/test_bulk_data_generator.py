@@ -0,0 +1,117 @@
+"""Toplu veri üretiminin belirlenimcilik testleri (batch boyutu, işçi sayısı, devam etme)"""
+
+import filecmp
+import os
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bulk_data_generator import JOURNAL_NAME, ROWS_PER_BLOCK, BulkDataGenerator, generate_rows
+
+ROWS = 1200
+SEED = 7
+
+
+def generate(path, batch_size=40, n_jobs=1, stream=True, checkpoint_dir=None, progress_callback=None):
+    generator = BulkDataGenerator(batch_size=batch_size, seed=SEED, vectorized=True)
+    generator.generate_large_dataset(ROWS, str(path), progress_callback, n_jobs,
+                                     stream=stream, checkpoint_dir=checkpoint_dir)
+    return path
+
+
+@pytest.fixture(scope='module')
+def reference(tmp_path_factory):
+    return generate(tmp_path_factory.mktemp('reference') / 'data.csv')
+
+
+def test_row_ranges_are_independent_of_split():
+    full = generate_rows(SEED, 0, ROWS_PER_BLOCK + 500)
+    split = pd.concat([generate_rows(SEED, 0, 300),
+                       generate_rows(SEED, 300, ROWS_PER_BLOCK + 100),
+                       generate_rows(SEED, ROWS_PER_BLOCK + 100, ROWS_PER_BLOCK + 500)],
+                      ignore_index=True)
+    pd.testing.assert_frame_equal(full, split)
+
+
+def test_generate_rows_leaves_global_rng_untouched():
+    np.random.seed(123)
+    random.seed(123)
+    np_state, py_state = np.random.get_state(), random.getstate()
+    # Blok önbelleğine düşmemesi için başka testlerde kullanılmayan bir seed
+    generate_rows(SEED + 1000, 0, 100)
+    generate_rows(SEED + 1000, 50, 50)
+    after = np.random.get_state()
+    assert after[0] == np_state[0] and np.array_equal(after[1], np_state[1]) and after[2:] == np_state[2:]
+    assert random.getstate() == py_state
+
+
+def test_empty_range_keeps_columns_and_dtypes():
+    empty = generate_rows(SEED, 0, 0)
+    sample = generate_rows(SEED, 0, 3)
+    assert len(empty) == 0
+    assert list(empty.columns) == list(sample.columns)
+    assert (empty.dtypes == sample.dtypes).all()
+
+
+def test_vectorized_generation_leaves_global_rng_untouched():
+    np.random.seed(123)
+    random.seed(123)
+    np_state, py_state = np.random.get_state(), random.getstate()
+    BulkDataGenerator(batch_size=40, seed=SEED, vectorized=True).generate_batch(0)
+    after = np.random.get_state()
+    assert after[0] == np_state[0] and np.array_equal(after[1], np_state[1]) and after[2:] == np_state[2:]
+    assert random.getstate() == py_state
+
+
+@pytest.mark.parametrize('batch_size', [50, 400])
+def test_output_is_independent_of_batch_size(tmp_path, reference, batch_size):
+    assert filecmp.cmp(generate(tmp_path / 'data.csv', batch_size=batch_size), reference, shallow=False)
+
+
+def test_output_is_independent_of_worker_count(tmp_path, reference):
+    assert filecmp.cmp(generate(tmp_path / 'data.csv', n_jobs=2), reference, shallow=False)
+
+
+def test_in_memory_output_matches_streaming(tmp_path, reference):
+    assert filecmp.cmp(generate(tmp_path / 'data.csv', stream=False), reference, shallow=False)
+
+
+def test_sharded_output_matches_streaming(tmp_path, reference):
+    output = generate(tmp_path / 'data.csv', n_jobs=2, checkpoint_dir=str(tmp_path / 'shards'))
+    assert filecmp.cmp(output, reference, shallow=False)
+
+
+def test_resume_after_interruption_is_byte_identical(tmp_path, reference):
+    shard_dir = tmp_path / 'shards'
+
+    def interrupt(done, total, batch, batches):
+        if batch == 7:
+            raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        generate(tmp_path / 'data.csv', checkpoint_dir=str(shard_dir), progress_callback=interrupt)
+    # Çökme anında yarım yazılmış bir günlük satırı yok sayılmalı
+    with open(shard_dir / JOURNAL_NAME, 'a', encoding='utf-8') as journal:
+        journal.write('{"batch": 99, "fi')
+
+    calls = []
+    output = generate(tmp_path / 'data.csv', checkpoint_dir=str(shard_dir),
+                      progress_callback=lambda *args: calls.append(args))
+    assert filecmp.cmp(output, reference, shallow=False)
+    assert calls[-1] == (ROWS, ROWS, ROWS // 40, ROWS // 40)
+    assert not os.path.exists(shard_dir / JOURNAL_NAME)
+
+
+def test_parallel_rejects_unaligned_batch_size():
+    generator = BulkDataGenerator(batch_size=3000, seed=SEED, vectorized=True)
+    with pytest.raises(ValueError):
+        generator.generate_large_dataset(ROWS, 'unused.csv', n_jobs=2, stream=True)
+
+
+@pytest.mark.parametrize('n_jobs', [0, -2])
+def test_invalid_worker_count_is_rejected(n_jobs):
+    generator = BulkDataGenerator(batch_size=40, seed=SEED, vectorized=True)
+    with pytest.raises(ValueError):
+        generator.generate_large_dataset(ROWS, 'unused.csv', n_jobs=n_jobs, stream=True)
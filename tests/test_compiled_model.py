@@ -0,0 +1,89 @@
+"""Derlenmiş ağaç topluluklarının orijinal modellerle olasılık eşitliği testleri"""
+
+import numpy as np
+import pytest
+from lightgbm import LGBMClassifier
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.naive_bayes import GaussianNB
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+from xgboost import XGBClassifier
+
+from bulk_data_generator import generate_rows
+from compiled_model import CompiledModel
+from feature_encoding import FeatureEncoder
+
+# XGBoost girdiyi float32'ye yuvarlayıp float32 toplar; diğerleri float64 ile aynı sonucu verir
+TOLERANCE = {'Random Forest': 1e-12, 'XGBoost': 1e-6, 'LightGBM': 1e-12}
+
+MODELS = {
+    'Random Forest': lambda: RandomForestClassifier(n_estimators=20, max_depth=8, random_state=0),
+    'XGBoost': lambda: XGBClassifier(n_estimators=20, max_depth=4, random_state=0),
+    'LightGBM': lambda: LGBMClassifier(n_estimators=20, num_leaves=15, random_state=0, verbose=-1),
+}
+
+
+@pytest.fixture(scope='module')
+def data():
+    df = generate_rows(11, 0, 3000)
+    encoder = FeatureEncoder()
+    label_encoder = LabelEncoder().fit(df['tavsiye_edilen_spor'])
+    X = encoder.transform(df)
+    return encoder, label_encoder, X, label_encoder.transform(df['tavsiye_edilen_spor'])
+
+
+def model_data(name, data):
+    encoder, label_encoder, X, y = data
+    return {
+        'model': MODELS[name]().fit(X[:2000], y[:2000]),
+        'model_name': name,
+        'scaler': StandardScaler().fit(X[:2000]),
+        'scaled': False,
+        'label_encoder': label_encoder,
+        'feature_names': encoder.feature_names,
+        'encoder': encoder,
+    }
+
+
+@pytest.fixture(scope='module', params=list(MODELS))
+def trained(request, data):
+    return request.param, model_data(request.param, data)
+
+
+def test_probabilities_match_native(trained, data):
+    name, md = trained
+    X = data[2][2000:]
+    compiled = CompiledModel.from_model_data(md)
+    np.testing.assert_allclose(compiled.predict_proba(X), md['model'].predict_proba(X),
+                               rtol=0, atol=TOLERANCE[name])
+
+
+def test_missing_values_follow_default_branch(trained, data):
+    name, md = trained
+    if name == 'Random Forest':
+        pytest.skip("sklearn ormanı NaN ile eğitilmedi")
+    X = data[2][2000:2500].copy()
+    X[::3, 0] = np.nan
+    X[1::4, 5] = np.nan
+    compiled = CompiledModel.from_model_data(md)
+    np.testing.assert_allclose(compiled.predict_proba(X), md['model'].predict_proba(X),
+                               rtol=0, atol=TOLERANCE[name])
+
+
+def test_saved_model_round_trips(trained, data, tmp_path):
+    name, md = trained
+    X = data[2][2000:]
+    compiled = CompiledModel.from_model_data(md)
+    path = str(tmp_path / 'model.npz')
+    compiled.save(path)
+    loaded = CompiledModel.load(path)
+    np.testing.assert_array_equal(loaded.predict_proba(X), compiled.predict_proba(X))
+    assert list(loaded.classes_) == list(md['label_encoder'].classes_)
+    assert loaded.model_name == name
+
+
+def test_unsupported_model_is_rejected(data):
+    encoder, label_encoder, X, y = data
+    md = model_data('Random Forest', data)
+    md['model'] = GaussianNB().fit(X[:500], y[:500])
+    with pytest.raises(ValueError):
+        CompiledModel.from_model_data(md)
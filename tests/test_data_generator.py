@@ -0,0 +1,97 @@
+"""Vektörel üretimin klasik (kişi kişi) üretimle istatistiksel eşdeğerliği testleri"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_generator import SportsDataGenerator
+from feature_config import ALL_FEATURES
+
+SCALAR_ROWS = 5000
+VECTORIZED_ROWS = 50000
+
+# BMI grubuna göre vücut tipi olasılıkları (Ektomorf, Mezomorf, Endomorf)
+BODY_TYPES = ['Ektomorf', 'Mezomorf', 'Endomorf']
+BODY_TYPE_BY_BMI = {
+    'bmi < 20': [0.7, 0.3, 0.0],
+    '20 <= bmi < 25': [0.2, 0.6, 0.2],
+    'bmi >= 25': [0.0, 0.4, 0.6],
+}
+
+# Ailevi spor geçmişine göre ebeveyn aktivite olasılıkları (Sedanter, Aktif, Sporcu)
+ACTIVITY_LEVELS = ['Sedanter', 'Aktif', 'Sporcu']
+PARENT_ACTIVITY = {
+    ('anne_spor_durumu', 'Var'): [0.40, 0.45, 0.15],
+    ('anne_spor_durumu', 'Yok'): [0.65, 0.30, 0.05],
+    ('baba_spor_durumu', 'Var'): [0.25, 0.55, 0.20],
+    ('baba_spor_durumu', 'Yok'): [0.50, 0.40, 0.10],
+}
+
+
+@pytest.fixture(scope='module')
+def scalar():
+    return SportsDataGenerator(seed=1).generate_dataset(SCALAR_ROWS)
+
+
+@pytest.fixture(scope='module')
+def vectorized():
+    return SportsDataGenerator(seed=2).generate_dataset(VECTORIZED_ROWS, vectorized=True)
+
+
+def bmi_groups(df):
+    return {
+        'bmi < 20': df[df['bmi'] < 20],
+        '20 <= bmi < 25': df[(df['bmi'] >= 20) & (df['bmi'] < 25)],
+        'bmi >= 25': df[df['bmi'] >= 25],
+    }
+
+
+def frequencies(values, levels):
+    return values.value_counts(normalize=True).reindex(levels, fill_value=0.0).to_numpy()
+
+
+def test_same_columns_and_dtypes(scalar, vectorized):
+    assert list(vectorized.columns) == list(scalar.columns)
+    pd.testing.assert_series_equal(vectorized.dtypes, scalar.dtypes)
+
+
+def test_numeric_marginals_match(scalar, vectorized):
+    numeric = [c for c in scalar.columns
+               if c in ALL_FEATURES and ALL_FEATURES[c]['type'] == 'numeric'] + ['bmi']
+    for column in numeric:
+        std = scalar[column].std()
+        assert abs(vectorized[column].mean() - scalar[column].mean()) < 0.1 * std, column
+        assert abs(vectorized[column].std() - std) < 0.1 * std, column
+        quantiles = [0.05, 0.5, 0.95]
+        difference = np.abs(vectorized[column].quantile(quantiles) - scalar[column].quantile(quantiles))
+        assert difference.max() < 0.15 * std, column
+
+
+def test_categorical_marginals_match(scalar, vectorized):
+    categorical = [c for c in scalar.columns
+                   if c in ALL_FEATURES and ALL_FEATURES[c]['type'] == 'categorical']
+    categorical.append('tavsiye_edilen_spor')
+    for column in categorical:
+        levels = sorted(set(scalar[column]) | set(vectorized[column]))
+        difference = np.abs(frequencies(vectorized[column], levels) - frequencies(scalar[column], levels))
+        assert difference.max() < 0.03, column
+
+
+@pytest.mark.parametrize('engine', ['scalar', 'vectorized'])
+def test_body_type_follows_bmi_rule(engine, request):
+    df = request.getfixturevalue(engine)
+    for group, rows in bmi_groups(df).items():
+        observed = frequencies(rows['vucut_tipi'], BODY_TYPES)
+        expected = np.array(BODY_TYPE_BY_BMI[group])
+        # Olasılığı sıfır olan tipler hiç üretilmez
+        assert (observed[expected == 0] == 0).all(), group
+        assert np.abs(observed - expected).max() < 0.06, group
+
+
+@pytest.mark.parametrize('engine', ['scalar', 'vectorized'])
+def test_parent_activity_follows_family_history(engine, request):
+    df = request.getfixturevalue(engine)
+    for (parent, history), expected in PARENT_ACTIVITY.items():
+        rows = df[df['ailevi_spor_gecmisi'] == history]
+        observed = frequencies(rows[parent], ACTIVITY_LEVELS)
+        assert np.abs(observed - np.array(expected)).max() < 0.06, (parent, history)
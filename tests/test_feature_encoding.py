@@ -0,0 +1,77 @@
+"""Özellik kodlayıcılarının sütun düzeni ve tutarlılık testleri"""
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from bulk_data_generator import generate_rows
+from feature_config import ALL_FEATURES
+from feature_encoding import FeatureEncoder, expand_multi_hot_columns
+from inference import form_record_encoder, prepare_model_input, sample_forms
+
+
+@pytest.fixture(scope='module')
+def dataset():
+    return generate_rows(3, 0, 2000)
+
+
+@pytest.fixture(scope='module')
+def encoder():
+    return FeatureEncoder()
+
+
+def legacy_encoding(df):
+    """
+    Eğitimin önceki pd.get_dummies(drop_first=True) tabanlı kodlaması;
+    kategoriler veride görülmese de şemadaki sıralı değerlerle açılır
+    """
+    X = df[[c for c in df.columns if c != 'tavsiye_edilen_spor' and not c.startswith('skor_')]].copy()
+    X = expand_multi_hot_columns(X)
+    categorical = [c for c in X.columns if ALL_FEATURES.get(c, {}).get('type') == 'categorical']
+    for column in categorical:
+        X[column] = pd.Categorical(X[column].astype(object),
+                                   categories=sorted(ALL_FEATURES[column]['values']))
+    X = pd.get_dummies(X, columns=categorical, drop_first=True)
+    X.columns = [re.sub(r'[^\w\s]', '_', c).replace(' ', '_') for c in X.columns]
+    return X
+
+
+def test_layout_matches_get_dummies(dataset, encoder):
+    legacy = legacy_encoding(dataset)
+    assert list(legacy.columns) == encoder.feature_names
+    np.testing.assert_array_equal(encoder.transform(dataset), legacy.to_numpy(np.float64))
+
+
+def test_layout_does_not_depend_on_data(dataset, encoder):
+    # Bazı kategorilerin hiç görülmediği küçük bir parça da aynı düzende kodlanır
+    head = dataset.head(5)
+    np.testing.assert_array_equal(encoder.transform(head), encoder.transform(dataset)[:5])
+
+
+def test_record_and_batch_encoding_agree(dataset, encoder):
+    records = dataset.head(200).to_dict('records')
+    expected = encoder.transform(dataset.head(200))
+    np.testing.assert_array_equal(np.array([encoder.transform_record(r) for r in records]), expected)
+    np.testing.assert_array_equal(encoder.transform_records(records), expected)
+
+
+def test_unknown_category_is_rejected(dataset, encoder):
+    record = dataset.iloc[0].to_dict()
+    record['cinsiyet'] = 'Bilinmiyor'
+    with pytest.raises(ValueError):
+        encoder.transform_record(record)
+
+
+@pytest.mark.parametrize('scaled', [False, True])
+def test_form_record_encoder_matches_full_encoding(dataset, encoder, scaled):
+    scaler = StandardScaler().fit(encoder.transform(dataset)) if scaled else None
+    record_encoder = form_record_encoder(encoder, scaler)
+    for form in sample_forms(100, seed=5):
+        expected = encoder.transform_record(prepare_model_input(form)).reshape(1, -1)
+        if scaler is not None:
+            expected = scaler.transform(expected)
+        record = {**form, 'bmi': form['kilo'] / (form['boy'] / 100) ** 2}
+        np.testing.assert_allclose(record_encoder.encode(record), expected, rtol=0, atol=1e-12)
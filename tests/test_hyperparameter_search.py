@@ -0,0 +1,52 @@
+"""Bütçeli hiperparametre aramasının bütçe ve seçilen ayar testleri"""
+
+import numpy as np
+import pytest
+from sklearn.neural_network import MLPClassifier
+
+from bulk_data_generator import generate_rows
+from feature_encoding import FeatureEncoder
+from hyperparameter_search import (DEFAULT_TIME_BUDGET, MLP_EARLY_STOPPING, SearchBudget,
+                                   SuccessiveHalvingSearch)
+
+
+@pytest.fixture(scope='module')
+def data():
+    df = generate_rows(13, 0, 1500)
+    X = FeatureEncoder().transform(df)
+    X = (X - X.mean(axis=0)) / (X.std(axis=0) + 1e-9)
+    y = np.unique(df['tavsiye_edilen_spor'], return_inverse=True)[1]
+    return X[:1200], y[:1200], X[1200:], y[1200:]
+
+
+def test_default_budget_is_finite_and_reported():
+    budget = SearchBudget()
+    assert budget.time_budget == DEFAULT_TIME_BUDGET
+    assert budget.describe() == f"{DEFAULT_TIME_BUDGET:.0f} s duvar saati"
+    assert SearchBudget(None).describe() == "sınırsız"
+
+
+def test_mlp_best_params_match_evaluated_configuration(data, capsys):
+    search = SuccessiveHalvingSearch(
+        'Neural Network', MLPClassifier(max_iter=50, random_state=0), *data,
+        search_space={'alpha': [1e-4, 1e-2], 'hidden_layer_sizes': [(20,)]},
+        min_resource=400, budget=SearchBudget(60))
+    result = search.run()
+    assert 'arama bütçesi 60 s duvar saati' in capsys.readouterr().out
+    for key, value in MLP_EARLY_STOPPING.items():
+        assert result['best_params'][key] == value
+    # Seçilen ayarlarla kurulan model değerlendirilen modelle aynı doğrulukta olmalı
+    X_train, y_train, X_val, y_val = data
+    best = max(r['resource'] for r in result['history'])
+    model = MLPClassifier(max_iter=50, random_state=0).set_params(**result['best_params'])
+    rows = search.order[:best]
+    assert model.fit(X_train[rows], y_train[rows]).score(X_val, y_val) == result['best_score']
+
+
+def test_exhausted_budget_is_reported(data, capsys):
+    search = SuccessiveHalvingSearch(
+        'Neural Network', MLPClassifier(max_iter=20, random_state=0), *data,
+        min_resource=400, budget=SearchBudget(0))
+    result = search.run()
+    assert 'bütçe doldu' in capsys.readouterr().out
+    assert result['best_params'] == {}
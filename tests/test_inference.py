@@ -0,0 +1,149 @@
+"""Form doğrulama, tahmin önbelleği ve SportPredictor tutarlılık testleri"""
+
+import os
+
+import joblib
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+from bulk_data_generator import generate_rows
+from compiled_model import compiled_path_for, save_compiled_companion
+from feature_encoding import FeatureEncoder
+from inference import PredictionCache, SportPredictor, sample_forms, validate_form
+
+
+@pytest.fixture
+def form():
+    return sample_forms(1, seed=1)[0]
+
+
+@pytest.fixture(scope='module')
+def model_path(tmp_path_factory):
+    df = generate_rows(5, 0, 2000)
+    encoder = FeatureEncoder()
+    label_encoder = LabelEncoder().fit(df['tavsiye_edilen_spor'])
+    X = encoder.transform(df)
+    model_data = {
+        'model': RandomForestClassifier(n_estimators=10, max_depth=8, random_state=0).fit(
+            X, label_encoder.transform(df['tavsiye_edilen_spor'])),
+        'model_name': 'Random Forest',
+        'scaler': StandardScaler().fit(X),
+        'scaled': False,
+        'label_encoder': label_encoder,
+        'feature_names': encoder.feature_names,
+        'encoder': encoder,
+    }
+    path = str(tmp_path_factory.mktemp('model') / 'best_model.pkl')
+    joblib.dump(model_data, path)
+    return path
+
+
+def copy_model(model_path, directory, compiled=True):
+    """Modeli dizine kopyalar; istenirse yanına derlenmiş halini yazar"""
+    path = str(directory / 'best_model.pkl')
+    model_data = joblib.load(model_path)
+    joblib.dump(model_data, path)
+    if compiled:
+        save_compiled_companion(model_data, path)
+    return path
+
+
+def test_sample_forms_are_valid():
+    for form in sample_forms(50):
+        assert validate_form(form) is form
+
+
+@pytest.mark.parametrize('field, value', [
+    ('yas', float('nan')), ('yas', float('inf')), ('yas', '25'), ('yas', True),
+    ('yas', 1000), ('boy', -5), ('spor_yili', 2.5), ('cinsiyet', 'Bilinmiyor'),
+])
+def test_invalid_values_are_rejected(form, field, value):
+    with pytest.raises(ValueError):
+        validate_form({**form, field: value})
+
+
+def test_missing_field_is_rejected(form):
+    del form['kilo']
+    with pytest.raises(ValueError):
+        validate_form(form)
+
+
+def test_integral_float_is_accepted(form):
+    validate_form({**form, 'yas': float(form['yas'])})
+
+
+def test_cache_key_ignores_order_extra_fields_and_int_float(form):
+    reordered = {**dict(reversed(list(form.items()))), 'yas': float(form['yas']), 'ekstra': 1}
+    assert PredictionCache.key(reordered) == PredictionCache.key(form)
+
+
+def test_cache_evicts_least_recently_used():
+    cache = PredictionCache(2)
+    keys = [PredictionCache.key(form) for form in sample_forms(3)]
+    assert cache.get(keys[0]) is None
+    cache.put(keys[0], 'a')
+    cache.put(keys[1], 'b')
+    assert cache.get(keys[0]) == 'a'
+    cache.put(keys[2], 'c')
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == 'a' and cache.get(keys[2]) == 'c'
+    assert len(cache) == 2
+    assert cache.stats == {'hits': 3, 'misses': 2, 'evictions': 1, 'invalidations': 0}
+
+
+def test_cache_is_cleared_when_model_version_changes(form):
+    cache = PredictionCache()
+    key = PredictionCache.key(form)
+    cache.bind('v1')
+    cache.put(key, 'a')
+    cache.bind('v1')
+    assert cache.get(key) == 'a'
+    cache.bind('v2')
+    assert cache.get(key) is None
+    assert len(cache) == 0 and cache.stats['invalidations'] == 1
+
+
+@pytest.mark.parametrize('source', ['generator', 'model', 'compiled'])
+def test_cached_predictions_match_uncached(tmp_path, model_path, source):
+    if source == 'generator':
+        path = str(tmp_path / 'missing.pkl')
+    else:
+        path = copy_model(model_path, tmp_path, compiled=source == 'compiled')
+    forms = sample_forms(100) * 3
+    uncached = SportPredictor(path)
+    cached = SportPredictor(path, cache_size=64)
+    assert uncached.source == source
+    assert cached.predict_batch(forms[:150]) + cached.predict_batch(forms[150:]) == \
+        uncached.predict_batch(forms)
+    assert cached.cache.stats['hits'] > 0
+
+
+def test_compiled_companion_matches_model(tmp_path, model_path):
+    path = copy_model(model_path, tmp_path)
+    forms = sample_forms(200)
+    compiled = SportPredictor(path)
+    os.remove(compiled_path_for(path))
+    native = SportPredictor(path)
+    assert (compiled.source, native.source) == ('compiled', 'model')
+    np.testing.assert_allclose(compiled.score(forms), native.score(forms), rtol=0, atol=1e-9)
+
+
+def test_stale_compiled_companion_is_ignored(tmp_path, model_path):
+    path = copy_model(model_path, tmp_path)
+    compiled_mtime = os.path.getmtime(compiled_path_for(path))
+    os.utime(path, (compiled_mtime + 10, compiled_mtime + 10))
+    assert SportPredictor(path).source == 'model'
+
+
+@pytest.mark.parametrize('source', ['generator', 'model', 'compiled'])
+def test_batch_predictions_match_single(tmp_path, model_path, source):
+    if source == 'generator':
+        path = str(tmp_path / 'missing.pkl')
+    else:
+        path = copy_model(model_path, tmp_path, compiled=source == 'compiled')
+    predictor = SportPredictor(path)
+    forms = sample_forms(50)
+    assert predictor.source == source
+    assert predictor.predict_batch(forms) == [predictor.predict(form) for form in forms]
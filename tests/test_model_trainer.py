@@ -0,0 +1,59 @@
+"""Out-of-fold değerlendirme ve katman topluluğu testleri"""
+
+import os
+
+import numpy as np
+import pytest
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.metrics import accuracy_score
+from sklearn.model_selection import StratifiedKFold
+
+from fold_ensemble import FoldEnsembleClassifier
+from model_trainer import CV_FOLDS, SportsModelTrainer
+
+DATA_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sporcu_dataset_500.csv')
+
+
+def train(**kwargs):
+    trainer = SportsModelTrainer(DATA_PATH)
+    trainer.load_and_preprocess_data()
+    trainer.models = {'Random Forest': RandomForestClassifier(n_estimators=10, random_state=0)}
+    trainer.train_and_evaluate_models(**kwargs)
+    return trainer, trainer.results['Random Forest']
+
+
+@pytest.fixture(scope='module')
+def default():
+    return train()
+
+
+def test_default_uses_fold_models_without_extra_fit(default):
+    trainer, result = default
+    assert isinstance(result['model'], FoldEnsembleClassifier)
+    assert len(result['model'].estimators) == CV_FOLDS
+    assert [job['kind'] for job in trainer._build_training_jobs()] == ['cv'] * CV_FOLDS
+
+
+def test_metrics_are_derived_from_oof_predictions(default):
+    trainer, result = default
+    y_train = trainer.y_train
+    folds = StratifiedKFold(n_splits=CV_FOLDS).split(trainer.X_train, y_train)
+    fold_scores = [accuracy_score(y_train[test], result['oof_predictions'][test]) for _, test in folds]
+    np.testing.assert_allclose(result['cv_scores'], fold_scores)
+    assert result['oof_accuracy'] == accuracy_score(y_train, result['oof_predictions'])
+    assert result['cv_classification_report']['accuracy'] == pytest.approx(result['oof_accuracy'])
+    np.testing.assert_allclose(result['oof_probabilities'].sum(axis=1), 1.0)
+    np.testing.assert_array_equal(result['oof_probabilities'].argmax(axis=1), result['oof_predictions'])
+
+
+def test_test_metrics_come_from_fold_ensemble(default):
+    trainer, result = default
+    np.testing.assert_array_equal(result['predictions'], result['model'].predict(trainer.X_test))
+    assert result['accuracy'] == accuracy_score(trainer.y_test, result['predictions'])
+
+
+def test_full_fit_is_opt_in(default):
+    _, result = default
+    trainer, full = train(fold_ensemble=False)
+    assert isinstance(full['model'], RandomForestClassifier)
+    np.testing.assert_array_equal(full['oof_predictions'], result['oof_predictions'])
@@ -0,0 +1,45 @@
+"""Bellek dışı eğiticinin çalışma dizini temizliği testleri"""
+
+import os
+
+import pytest
+
+from bulk_data_generator import generate_rows
+from out_of_core_trainer import OutOfCoreTrainer
+
+
+@pytest.fixture(scope='module')
+def source(tmp_path_factory):
+    path = tmp_path_factory.mktemp('data') / 'data.csv'
+    generate_rows(1, 0, 600).to_csv(path, index=False)
+    return str(path)
+
+
+def test_cleanup_keeps_caller_work_dir_contents(source, tmp_path):
+    (tmp_path / 'keep.txt').write_text('veri')
+    (tmp_path / 'keep.npy').write_bytes(b'')
+    trainer = OutOfCoreTrainer(source, chunk_rows=200, work_dir=str(tmp_path))
+    trainer.prepare_chunks()
+    (tmp_path / 'xgb-cache.row.page').write_bytes(b'')
+    assert len(os.listdir(tmp_path)) > 3
+
+    trainer.cleanup()
+    assert sorted(os.listdir(tmp_path)) == ['keep.npy', 'keep.txt']
+
+
+def test_cleanup_removes_temporary_work_dir(source):
+    trainer = OutOfCoreTrainer(source, chunk_rows=200)
+    trainer.prepare_chunks()
+    assert os.listdir(trainer.work_dir)
+
+    trainer.cleanup()
+    assert not os.path.exists(trainer.work_dir)
+
+
+def test_pipeline_does_not_delete_caller_work_dir(source, tmp_path):
+    work_dir = tmp_path / 'work'
+    work_dir.mkdir()
+    (work_dir / 'keep.txt').write_text('veri')
+    trainer = OutOfCoreTrainer(source, chunk_rows=200, epochs=1, work_dir=str(work_dir))
+    trainer.run_full_pipeline(str(tmp_path / 'model.pkl'))
+    assert os.listdir(work_dir) == ['keep.txt']